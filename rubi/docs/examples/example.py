@@ -1,7 +1,7 @@
 import logging as log
 import os
 from _decimal import Decimal
-from multiprocessing import Queue
+from queue import Queue
 
 from dotenv import load_dotenv
 
@@ -1,6 +1,6 @@
 import logging as log
 import os
-from multiprocessing import Queue
+from queue import Queue
 from typing import Union
 
 import requests
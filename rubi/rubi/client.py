@@ -1,17 +1,23 @@
+import asyncio
 import logging
+import multiprocessing.queues
+import queue
 from _decimal import Decimal
-from multiprocessing import Queue
-from threading import Thread
-from time import sleep
-from typing import Union, List, Optional, Dict, Type, Any, Callable, Tuple
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor, Future
+from threading import Lock
+from time import monotonic
+from typing import Union, List, Optional, Dict, Type, Any, Callable, Tuple, Set
 
 import pandas as pd
 from eth_typing import ChecksumAddress
+from web3 import Web3
 from web3.types import EventData, Nonce, TxParams
 
 from rubi import LimitOrder
 from rubi.contracts import (
     ERC20,
+    PollScheduler,
     TransactionReceipt,
     EmitFeeEvent,
     EmitOfferEvent,
@@ -20,6 +26,7 @@ from rubi.contracts import (
     EmitApproval,
     EmitTransfer,
 )
+from rubi.contracts.transaction_handler import estimate_gas
 from rubi.data import MarketData, SubgraphOffer
 from rubi.network import (
     Network,
@@ -44,6 +51,33 @@ from rubi.rubicon_types import (
 
 logger = logging.getLogger(__name__)
 
+# Callers pass the same few wallet, spender and recipient addresses on every call, so each address is only checksummed
+# once
+_to_checksum_address = lru_cache(maxsize=4096)(Web3.to_checksum_address)
+
+# Builds the (pay_amt, pay_gem, buy_amt, buy_gem) of a limit order from (base_asset, quote_asset, order) for each order
+# side. A dict lookup is cheaper than a match statement in the batch order loop.
+_LIMIT_ORDER_LEGS: Dict[
+    OrderSide,
+    Callable[
+        [ERC20, ERC20, Union[NewLimitOrder, UpdateLimitOrder]],
+        Tuple[int, ChecksumAddress, int, ChecksumAddress],
+    ],
+] = {
+    OrderSide.BUY: lambda base_asset, quote_asset, order: (
+        quote_asset.to_integer(order.price * order.size),
+        quote_asset.address,
+        base_asset.to_integer(order.size),
+        base_asset.address,
+    ),
+    OrderSide.SELL: lambda base_asset, quote_asset, order: (
+        base_asset.to_integer(order.size),
+        base_asset.address,
+        quote_asset.to_integer(order.price * order.size),
+        quote_asset.address,
+    ),
+}
+
 
 class Client:
     """This class is a client for Rubicon. It aims to provide a simple and understandable interface when interacting
@@ -52,8 +86,10 @@ class Client:
 
     :param network: A Network instance
     :type network: Network
-    :param message_queue: Optional message queue for processing events (optional, default is None).
-    :type message_queue: Optional[Queue]
+    :param message_queue: Optional message queue for processing events (optional, default is None). Use a
+        queue.Queue when the messages are consumed in the same process, as a multiprocessing.Queue pickles every
+        message to pass it through a pipe. Only use a multiprocessing.Queue to consume messages in another process.
+    :type message_queue: Optional[queue.Queue | multiprocessing.Queue]
     :param wallet: Wallet address (optional, default is None).
     :type wallet: Optional[ChecksumAddress]
     :param key: Key for the wallet (optional, default is None).
@@ -63,39 +99,86 @@ class Client:
     def __init__(
         self,
         network: Network,
-        message_queue: Optional[Queue] = None,
+        message_queue: Optional[queue.Queue | multiprocessing.queues.Queue] = None,
         wallet: Optional[Union[ChecksumAddress, str]] = None,
         key: Optional[str] = None,
     ):
         """constructor method."""
         self.network = network
 
-        self.message_queue = message_queue  # type: Queue | None
+        self.message_queue = message_queue
 
         # Authentication
         self.wallet = (
-            self.network.w3.to_checksum_address(wallet) if wallet else wallet
+            self._checksum_address(address=wallet) if wallet else wallet
         )  # type: ChecksumAddress |  None
         self._key = key  # type: str |  None
 
         self.market_data = MarketData.from_network(network=network)
 
+        # Orderbook cache keyed by (pair_name, block_number) -> (expiry, future of the rubicon offer book). Concurrent
+        # readers of the same pair within a block (e.g. strategy code and the orderbook poller) share a single router
+        # call, including while that call is still in flight.
+        self._orderbook_cache: Dict[
+            Tuple[str, int],
+            Tuple[float, Future[Tuple[List[List[int]], List[List[int]]]]],
+        ] = {}
+        self._orderbook_cache_ttl = 2
+        self._orderbook_cache_lock = Lock()
+
+        # (expiry, block number). The block number is reused for a short time so that a cached orderbook read does
+        # not cost a round trip to the node. It is reset when a transaction of this client is executed.
+        self._block_number_cache: Optional[Tuple[float, int]] = None
+        self._block_number_cache_ttl = 1
+
+        # (token, spender) -> (expiry, allowance). Allowances of the wallet only change through transactions, so they
+        # are reused for a short time and forgotten whenever a transaction of this client is executed. A change made
+        # by another client of the same wallet can be missed for up to _allowance_cache_ttl seconds.
+        self._allowance_cache: Dict[
+            Tuple[str, ChecksumAddress], Tuple[float, Decimal]
+        ] = {}
+        self._allowance_cache_ttl = 5
+
+        # All pollers are run by a single scheduler thread and order books are built on a single processor thread
+        self._poll_scheduler = PollScheduler()
+        self._orderbook_processor = ThreadPoolExecutor(max_workers=1)
+
+        # Transactions executed through the async methods are signed, submitted and waited for on these threads. Only
+        # created when an async method is first used.
+        self._transaction_executor: Optional[ThreadPoolExecutor] = None
+        self._transaction_executor_lock = Lock()
+
+        # Order books superseded by a newer one before reaching the message queue. Only updated by the processor thread
+        self.dropped_books = 0
+        self._dropped_books_log_interval = 100
+
+        # Index of bid and ask identifiers to pair names used to demultiplex events from a shared event poller
+        self._pair_by_identifier: Dict[str, str] = {}
+
+        # The pair identifiers and default event filters of a pair never change, so they are only computed once
+        self._pair_identifier_cache: Dict[str, Tuple[str, str]] = {}
+        self._filter_cache: Dict[Tuple[Type[BaseEvent], str], Dict[str, Any]] = {}
+
     @classmethod
     def from_http_node_url(
         cls,
         http_node_url: str,
-        message_queue: Optional[Queue] = None,
+        message_queue: Optional[queue.Queue | multiprocessing.queues.Queue] = None,
         wallet: Optional[Union[ChecksumAddress, str]] = None,
         key: Optional[str] = None,
         custom_token_addresses_file: Optional[str] = None,
+        request_kwargs: Optional[Dict[str, Any]] = None,
+        pool_maxsize: int = 32,
+        ws_node_url: Optional[str] = None,
         **kwargs,
     ):
         """Initialize a Client using a http_node_url.
 
         :param http_node_url: URL of the HTTP node.
         :type http_node_url: str
-        :param message_queue: Optional message queue for processing events (optional, default is None).
-        :type message_queue: Optional[Queue]
+        :param message_queue: Optional message queue for processing events (optional, default is None). Use a
+            queue.Queue unless the messages are consumed in another process.
+        :type message_queue: Optional[queue.Queue | multiprocessing.Queue]
         :param wallet: Wallet address (optional, default is None).
         :type wallet: Optional[Union[ChecksumAddress, str]]
         :param key: Key for the wallet (optional, default is None).
@@ -104,10 +187,22 @@ class Client:
             custom token addresses. Overwrites the token config found in network_config/{chain}/network.yaml.
             (optional, default is None).
         :type custom_token_addresses_file: Optional[str]
+        :param request_kwargs: Additional keyword arguments passed to each request to the node, e.g. a timeout
+            (optional, default is None).
+        :type request_kwargs: Optional[Dict[str, Any]]
+        :param pool_maxsize: The maximum number of keep-alive connections kept open to the node (optional, default is
+            32).
+        :type pool_maxsize: int
+        :param ws_node_url: The websocket URL of the node. If set, events are pushed by the node over a websocket
+            connection instead of being polled for (optional, default is None).
+        :type ws_node_url: Optional[str]
         """
         network = Network.from_http_node_url(
             http_node_url=http_node_url,
             custom_token_addresses_file=custom_token_addresses_file,
+            request_kwargs=request_kwargs,
+            pool_maxsize=pool_maxsize,
+            ws_node_url=ws_node_url,
         )
 
         return cls(
@@ -129,6 +224,19 @@ class Client:
         """
         return self.network.w3.eth.get_transaction_count(self.wallet)
 
+    def get_transaction_params(self) -> Dict[str, int]:
+        """Get the nonce and fee parameters for the next transaction of the wallet in a single round trip to the node.
+        Passing these to the transaction methods (e.g. client.limit_order(order=order, **params)) avoids the separate
+        requests that are made for each of them when building a transaction. Only the gas limit is still estimated per
+        transaction unless it is passed as well.
+
+        :return: The nonce, max_fee_per_gas and max_priority_fee_per_gas for the next transaction.
+        :rtype: Dict[str, int]
+        """
+        return self.network.transaction_handler.get_transaction_params(
+            wallet=self.wallet
+        )
+
     def get_transaction_receipt(
         self,
         transaction_hash: str,
@@ -166,9 +274,12 @@ class Client:
         """
         pair_names = transaction["pair_names"] if "pair_names" in transaction else None
 
-        transaction_receipt = self.network.transaction_handler.execute_transaction(
-            transaction=transaction, key=self._key
-        )
+        try:
+            transaction_receipt = self.network.transaction_handler.execute_transaction(
+                transaction=transaction, key=self._key
+            )
+        finally:
+            self._reset_chain_state_caches()
 
         processed_transaction_receipt = self._handle_transaction_receipt_raw_events(
             transaction_receipt=transaction_receipt,
@@ -177,6 +288,72 @@ class Client:
 
         return processed_transaction_receipt
 
+    def execute_transactions(
+        self, transactions: List[TxParams]
+    ) -> List[TransactionReceipt]:
+        """Execute the passed transactions. All transactions are submitted before any receipt is waited for, so the
+        transactions should have sequential nonces (e.g. as built by batch_approve).
+
+        :param transactions: The transactions to execute.
+        :type transactions: List[TxParams]
+        :return: The TransactionReceipts of the executed transactions, in the same order as the transactions.
+        :rtype: List[TransactionReceipt]
+        """
+        pair_names = [transaction.get("pair_names") for transaction in transactions]
+
+        try:
+            transaction_receipts = (
+                self.network.transaction_handler.execute_transactions(
+                    transactions=transactions, key=self._key
+                )
+            )
+        finally:
+            self._reset_chain_state_caches()
+
+        return [
+            self._handle_transaction_receipt_raw_events(
+                transaction_receipt=transaction_receipt,
+                pair_names=transaction_pair_names,
+            )
+            for transaction_receipt, transaction_pair_names in zip(
+                transaction_receipts, pair_names
+            )
+        ]
+
+    async def execute_transaction_async(
+        self, transaction: TxParams
+    ) -> TransactionReceipt:
+        """Execute the passed transaction without blocking the event loop. The transaction is signed, submitted and
+        waited for on a worker thread, so independent transactions (e.g. of different wallets) can be awaited
+        concurrently with asyncio.gather and complete in the time of the slowest one instead of one after the other.
+        Synchronous code should call execute_transaction directly rather than wrapping this in asyncio.run, which
+        creates and tears down an event loop on every call.
+
+        :param transaction: The transaction to execute.
+        :type transaction: TxParams
+        :return: A TransactionReceipt of the executed transaction.
+        :rtype: TransactionReceipt
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_transaction_executor(),
+            partial(self.execute_transaction, transaction=transaction),
+        )
+
+    async def execute_transactions_async(
+        self, transactions: List[TxParams]
+    ) -> List[TransactionReceipt]:
+        """Execute the passed transactions without blocking the event loop. See execute_transactions.
+
+        :param transactions: The transactions to execute.
+        :type transactions: List[TxParams]
+        :return: The TransactionReceipts of the executed transactions, in the same order as the transactions.
+        :rtype: List[TransactionReceipt]
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_transaction_executor(),
+            partial(self.execute_transactions, transactions=transactions),
+        )
+
     ######################################################################
     # token methods
     ######################################################################
@@ -193,12 +370,46 @@ class Client:
         :return: The token balance of the wallet
         :rtype: Decimal
         """
-        if not wallet:
-            wallet = self.wallet
+        wallet = self._checksum_address(address=wallet) if wallet else self.wallet
+
+        erc20 = self.network.tokens[token]
 
-        balance = self.network.tokens[token].balance_of(account=wallet)
+        return erc20.to_decimal(erc20.balance_of(account=wallet))
 
-        return self.network.tokens[token].to_decimal(balance)
+    def get_balances(
+        self, tokens: List[str], wallet: Optional[ChecksumAddress] = None
+    ) -> Dict[str, Decimal]:
+        """Get the balances of several tokens in a single request to the node.
+
+        :param tokens: The tokens to get the balances of
+        :type tokens: List[str]
+        :param wallet: The wallet balance to check (Optional, defaults to client wallet)
+        :type wallet: ChecksumAddress
+        :return: The token balances of the wallet, keyed by token
+        :rtype: Dict[str, Decimal]
+        :raises Exception: If the balance of any of the tokens could not be read.
+        """
+        wallet = self._checksum_address(address=wallet) if wallet else self.wallet
+
+        erc20s = [self.network.tokens[token] for token in tokens]
+
+        balances = self.network.batch_call(
+            contract_functions=[
+                erc20.contract.functions.balanceOf(wallet) for erc20 in erc20s
+            ]
+        )
+
+        failed_tokens = [
+            token for token, balance in zip(tokens, balances) if balance is None
+        ]
+
+        if failed_tokens:
+            raise Exception(f"failed to read the balance of: {failed_tokens}")
+
+        return {
+            token: erc20.to_decimal(balance)
+            for token, erc20, balance in zip(tokens, erc20s, balances)
+        }
 
     def get_allowance(self, token: str, spender: ChecksumAddress) -> Decimal:
         """Get a spenders allowance for a certain token.
@@ -210,12 +421,24 @@ class Client:
         :return: The allowance of the spender
         :rtype: Decimal
         """
+        erc20 = self.network.tokens[token]
+        spender = self._checksum_address(address=spender)
+
+        now = monotonic()
+        cached = self._allowance_cache.get((token, spender))
 
-        allowance = self.network.tokens[token].allowance(
-            owner=self.wallet, spender=spender
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        allowance = erc20.to_decimal(
+            erc20.allowance(owner=self.wallet, spender=spender)
+        )
+        self._allowance_cache[(token, spender)] = (
+            now + self._allowance_cache_ttl,
+            allowance,
         )
 
-        return self.network.tokens[token].to_decimal(allowance)
+        return allowance
 
     # TODO: revisit as the safer thing is to set approval to 0 and then set approval to new_allowance
     #  or use increaseAllowance and decreaseAllowance but the current abi does not support these methods
@@ -247,7 +470,9 @@ class Client:
         :return: The built transaction.
         :rtype: TxParams
         """
-        amount = self.network.tokens[approval.token].to_integer(approval.amount)
+        token = self.network.tokens[approval.token]
+
+        amount = token.to_integer(approval.amount)
         spender = approval.spender
 
         if isinstance(approval, RubiconMarketApproval):
@@ -256,8 +481,10 @@ class Client:
             spender = self.network.rubicon_router.address
         elif spender is None:
             raise Exception("A spender must be provided for an approval")
+        else:
+            spender = self._checksum_address(address=spender)
 
-        return self.network.tokens[approval.token].approve(
+        return token.approve(
             spender=spender,
             amount=amount,
             wallet=self.wallet,
@@ -267,6 +494,75 @@ class Client:
             max_priority_fee_per_gas=max_priority_fee_per_gas,
         )
 
+    def batch_approve(
+        self,
+        approvals: List[Approval],
+        nonce: Optional[int] = None,
+        gas: Optional[int] = None,
+        max_fee_per_gas: Optional[int] = None,
+        max_priority_fee_per_gas: Optional[int] = None,
+    ) -> List[TxParams]:
+        """
+        Construct the approval transactions for several approvals with sequential nonces, so that they can all be
+        submitted at once with execute_transactions rather than one after the other.
+
+        :param approvals: The approvals of spenders of ERC20s
+        :type approvals: List[Approval | RubiconMarketApproval | RubiconRouterApproval]
+        :param nonce: nonce of the first transaction, defaults to calling the chain state to get the nonce.
+            (optional, default is None)
+        :type nonce: Optional[int]
+        :param gas: gas limit for each transaction. If None is passed then the gas limits of all the transactions are
+            estimated in a single request.
+        :type gas: Optional[int]
+        :param max_fee_per_gas: max fee that can be paid for gas, defaults to
+            max_priority_fee (from chain) + (2 * base fee per gas of latest block) (optional, default is None)
+        :type max_fee_per_gas: Optional[int]
+        :param max_priority_fee_per_gas: max priority fee that can be paid for gas, defaults to calling the chain to
+            estimate the max_priority_fee_per_gas (optional, default is None)
+        :type max_priority_fee_per_gas: Optional[int]
+        :return: The built transactions, in the same order as the approvals.
+        :rtype: List[TxParams]
+        """
+        if nonce is None:
+            # The nonce and default fees in one round trip, instead of one for each transaction
+            transaction_params = self.get_transaction_params()
+
+            nonce = transaction_params["nonce"]
+
+            if max_fee_per_gas is None and max_priority_fee_per_gas is None:
+                max_fee_per_gas = transaction_params["max_fee_per_gas"]
+                max_priority_fee_per_gas = transaction_params[
+                    "max_priority_fee_per_gas"
+                ]
+
+        # If no gas limit is passed the transactions are built with a placeholder gas limit, so that they are not
+        # estimated one by one, and the placeholder is then replaced by the estimates of all the transactions
+        transactions = [
+            self.approve(
+                approval=approval,
+                nonce=nonce + i,
+                gas=gas if gas is not None else 0,
+                max_fee_per_gas=max_fee_per_gas,
+                max_priority_fee_per_gas=max_priority_fee_per_gas,
+            )
+            for i, approval in enumerate(approvals)
+        ]
+
+        if gas is None:
+            built = [i for i, transaction in enumerate(transactions) if transaction]
+            gas_estimates = estimate_gas(
+                w3=self.network.w3, transactions=[transactions[i] for i in built]
+            )
+
+            for i, gas_estimate in zip(built, gas_estimates):
+                if gas_estimate is None:
+                    # Like a transaction that fails to build
+                    transactions[i] = None
+                else:
+                    transactions[i]["gas"] = gas_estimate
+
+        return transactions
+
     def transfer(
         self,
         transfer: Transfer,
@@ -294,10 +590,12 @@ class Client:
         :return: The built transaction.
         :rtype: TxParams
         """
-        amount = self.network.tokens[transfer.token].to_integer(transfer.amount)
+        token = self.network.tokens[transfer.token]
 
-        return self.network.tokens[transfer.token].transfer(
-            recipient=transfer.recipient,
+        amount = token.to_integer(transfer.amount)
+
+        return token.transfer(
+            recipient=self._checksum_address(address=transfer.recipient),
             amount=amount,
             wallet=self.wallet,
             nonce=nonce,
@@ -311,38 +609,39 @@ class Client:
     ######################################################################
 
     def get_orderbook(self, pair_name: str) -> OrderBook:
-        """Retrieve the order book for a specific pair from the Rubicon Router.
+        """Retrieve the order book for a specific pair from the Rubicon Router. Router responses are cached per block
+        for a short time so that repeated reads of the same pair within a block only result in a single call.
 
         :param pair_name: Name of the pair to retrieve the order book for.
         :type pair_name: str
         :return: The order book for the specified pair.
         :rtype: OrderBook
-        :raises PairDoesNotExistException: If the pair does not exist in the client.
+        :raises Exception: If the assets of the pair are not in the clients token set.
         """
-        base_asset, quote_asset = pair_name.split("/")
-
-        rubicon_offer_book = self.network.rubicon_router.get_book_from_pair(
-            asset=self.network.tokens[base_asset].address,
-            quote=self.network.tokens[quote_asset].address,
-        )
+        base_asset, quote_asset = self._get_pair(pair_name=pair_name)
 
         return OrderBook.from_rubicon_offer_book(
-            offer_book=rubicon_offer_book,
-            base_asset=self.network.tokens[base_asset],
-            quote_asset=self.network.tokens[quote_asset],
+            offer_book=self._get_rubicon_offer_book(pair_name=pair_name),
+            base_asset=base_asset,
+            quote_asset=quote_asset,
         )
 
-    def start_orderbook_poller(self, pair_name: str, poll_time: int = 2) -> None:
+    def start_orderbook_poller(
+        self, pair_name: str, poll_time: int = 2, min_poll_interval: float = 0.05
+    ) -> None:
         """Starts a background thread that continuously polls the order book for the specified pair
-        at a specified polling interval. The retrieved order book is added to the message queue of the client.
-        The poller will run until the pair is removed from the client.
+        at a specified polling interval. The retrieved order book is added to the message queue of the client whenever
+        it changes. The poller will run until the pair is removed from the client.
 
         :param pair_name: Name of the pair to start the order book poller for.
         :type pair_name: str
         :param poll_time: Polling interval in seconds, defaults to 2 seconds.
         :type poll_time: int, optional
-        :raises Exception: If the message queue is not configured.
-        :raises PairDoesNotExistException: If the pair does not exist in the client.
+        :param min_poll_interval: Minimum time in seconds to wait between polls if retrieving the order book takes
+            longer than the poll_time, defaults to 0.05 seconds.
+        :type min_poll_interval: float, optional
+        :raises Exception: If the message queue is not configured or the assets of the pair are not in the clients
+            token set.
         """
 
         if self.message_queue is None:
@@ -350,40 +649,196 @@ class Client:
                 "Orderbook poller is configured to place messages on the message queue. Message queue cannot be none"
             )
 
-        base_asset, quote_asset = pair_name.split("/")
-        if (
-            base_asset not in self.network.tokens.keys()
-            or quote_asset not in self.network.tokens.keys()
-        ):
-            raise Exception(
-                f"Cannot start orderbook poller for {base_asset}/{quote_asset} as these assets are not in"
-                f"the clients token set: {self.network.tokens.keys()}"
-            )
+        # Fail fast rather than logging the same lookup error on every poll
+        self._get_pair(pair_name=pair_name)
 
-        thread = Thread(
-            target=self._start_orderbook_poller,
-            kwargs={"pair_name": pair_name, "poll_time": poll_time},
-            daemon=True,
-        )
-        thread.start()
+        # Fetching the book from the node and building the OrderBook are decoupled so that slow RPC calls are not
+        # delayed further by parsing, and a slow message queue consumer does not delay the next poll.
+        raw_offer_book_queue: queue.Queue = queue.Queue(maxsize=2)
+        previous_offer_book = None
 
-    # TODO: look at using a listener instead of poller (we will probably need to listen to events)
-    def _start_orderbook_poller(self, pair_name: str, poll_time: int = 2) -> None:
-        """The internal implementation of the order book poller. It continuously retrieves the order book for the
-        specified pair and adds it to the message queue of the client.
+        # TODO: look at using a listener instead of poller (we will probably need to listen to events)
+        def poll() -> float:
+            """Retrieve the raw offer book for the pair and add it to the raw offer book queue for processing if it
+            has changed since the last poll. If the queue is full the oldest offer book is dropped as only the latest
+            book is relevant. The time taken to retrieve the offer book is deducted from the time until the next poll.
 
-        :param pair_name: Name of the pair to start the order book poller for.
-        :type pair_name: str
-        :param poll_time: Polling interval in seconds, defaults to 2 seconds.
-        :type poll_time: int, optional
-        """
-        polling: bool = True
-        while polling:
+            :return: The time until the next poll in seconds.
+            :rtype: float
+            """
+            nonlocal previous_offer_book
+
+            poll_start = monotonic()
             try:
-                self.message_queue.put(self.get_orderbook(pair_name=pair_name))
+                rubicon_offer_book = self._get_rubicon_offer_book(pair_name=pair_name)
+
+                if rubicon_offer_book != previous_offer_book:
+                    self._put_drop_oldest(
+                        message_queue=raw_offer_book_queue, message=rubicon_offer_book
+                    )
+                    self._orderbook_processor.submit(
+                        self._process_orderbook, pair_name, raw_offer_book_queue
+                    )
+                    previous_offer_book = rubicon_offer_book
             except Exception as e:
                 logger.error(e)
-            sleep(poll_time)
+
+            return max(min_poll_interval, poll_time - (monotonic() - poll_start))
+
+        self._poll_scheduler.schedule(job=poll)
+
+    def _process_orderbook(
+        self, pair_name: str, raw_offer_book_queue: queue.Queue
+    ) -> None:
+        """Build an OrderBook from the oldest raw offer book on the raw offer book queue and add it to the message
+        queue of the client. Runs on the single orderbook processor thread so order books are processed in order.
+
+        The order book is never waited for to be put on the message queue as only the latest order book is relevant. If
+        a bounded message queue is full the order book is dropped instead, as the message queue is shared with events
+        which cannot be dropped. Dropped order books are counted in dropped_books.
+
+        :param pair_name: Name of the pair the order book poller was started for.
+        :type pair_name: str
+        :param raw_offer_book_queue: The queue the raw offer books are retrieved from.
+        :type raw_offer_book_queue: queue.Queue
+        """
+        try:
+            rubicon_offer_book = raw_offer_book_queue.get_nowait()
+        except queue.Empty:
+            # The offer book was dropped in favour of a newer one that has already been processed
+            self._record_dropped_book(pair_name=pair_name)
+            return
+
+        base_asset, quote_asset = self._get_pair(pair_name=pair_name)
+
+        try:
+            self.message_queue.put_nowait(
+                OrderBook.from_rubicon_offer_book(
+                    offer_book=rubicon_offer_book,
+                    base_asset=base_asset,
+                    quote_asset=quote_asset,
+                )
+            )
+        except queue.Full:
+            self._record_dropped_book(pair_name=pair_name)
+        except Exception as e:
+            logger.error(e)
+
+    def _record_dropped_book(self, pair_name: str) -> None:
+        """Count an order book that was dropped before reaching the message queue and periodically log the total.
+
+        :param pair_name: Name of the pair the order book was dropped for.
+        :type pair_name: str
+        """
+        self.dropped_books += 1
+
+        if self.dropped_books % self._dropped_books_log_interval == 1:
+            logger.warning(
+                f"{self.dropped_books} order books dropped in total (latest for {pair_name}) as the message queue "
+                f"consumer is not keeping up with the orderbook pollers"
+            )
+
+    def _get_rubicon_offer_book(
+        self, pair_name: str
+    ) -> Tuple[List[List[int]], List[List[int]]]:
+        """Get the raw offer book of a pair from the Rubicon Router, or from the orderbook cache if it has already been
+        retrieved, or is being retrieved, in the current block.
+
+        :param pair_name: Name of the pair to retrieve the offer book for.
+        :type pair_name: str
+        :return: The asks and bids of the pair as returned by the Rubicon Router.
+        :rtype: Tuple[List[List[int]], List[List[int]]]
+        """
+        key = (pair_name, self._get_block_number())
+        now = monotonic()
+
+        with self._orderbook_cache_lock:
+            cached = self._orderbook_cache.get(key)
+
+            if cached is not None and cached[0] > now:
+                return cached[1].result()
+
+            # Evict entries for previous blocks of this pair and anything that has expired
+            self._orderbook_cache = {
+                cache_key: value
+                for cache_key, value in self._orderbook_cache.items()
+                if cache_key[0] != pair_name and value[0] > now
+            }
+
+            future = Future()
+            self._orderbook_cache[key] = (now + self._orderbook_cache_ttl, future)
+
+        try:
+            base_asset, quote_asset = self._get_pair(pair_name=pair_name)
+
+            future.set_result(
+                self.network.rubicon_router.get_book_from_pair(
+                    asset=base_asset.address,
+                    quote=quote_asset.address,
+                )
+            )
+        except Exception as e:
+            # Do not cache the failure, waiting readers get the exception and the next read retries
+            with self._orderbook_cache_lock:
+                if self._orderbook_cache.get(key, (None, None))[1] is future:
+                    del self._orderbook_cache[key]
+
+            future.set_exception(e)
+
+        return future.result()
+
+    def _checksum_address(
+        self, address: Union[ChecksumAddress, str]
+    ) -> ChecksumAddress:
+        """Checksum an address passed to the client, so that an invalid address fails before a transaction or call is
+        built with it.
+
+        :param address: The address.
+        :type address: Union[ChecksumAddress, str]
+        :return: The checksummed address.
+        :rtype: ChecksumAddress
+        :raises Exception: If the address is not a valid address.
+        """
+        try:
+            return _to_checksum_address(address)
+        except ValueError as e:
+            raise Exception(f"{address} is not a valid address: {e}")
+
+    def _get_transaction_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool the async transaction methods run on, creating it on first use.
+
+        :return: The transaction thread pool.
+        :rtype: ThreadPoolExecutor
+        """
+        with self._transaction_executor_lock:
+            if self._transaction_executor is None:
+                self._transaction_executor = ThreadPoolExecutor(
+                    thread_name_prefix="rubi-transaction"
+                )
+
+            return self._transaction_executor
+
+    def _get_block_number(self) -> int:
+        """Get the latest block number, reusing it for _block_number_cache_ttl seconds.
+
+        :return: The latest block number.
+        :rtype: int
+        """
+        cached = self._block_number_cache
+        now = monotonic()
+
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        block_number = self.network.w3.eth.block_number
+        self._block_number_cache = (now + self._block_number_cache_ttl, block_number)
+
+        return block_number
+
+    def _reset_chain_state_caches(self) -> None:
+        """Forget the cached block number and allowances after a transaction of this client changed the chain."""
+        self._block_number_cache = None
+        self._allowance_cache = {}
 
     ######################################################################
     # event methods
@@ -395,7 +850,7 @@ class Client:
         event_type: Type[BaseEvent],
         filters: Optional[Dict[str, Any]] = None,
         event_handler: Optional[Callable] = None,
-        poll_time: int = 2,
+        poll_time: Optional[float] = None,
     ) -> None:
         """Starts a background event poller that continuously listens for events of the specified event type
         related to the specified pair. The retrieved events are processed by the event handler and added to the message
@@ -411,10 +866,11 @@ class Client:
         :param event_handler: Optional event handler function to process the retrieved events, defaults to the
             self._default_event_handler (optional, default is None).
         :type event_handler: Optional[Callable], optional
-        :param poll_time: Polling interval in seconds, defaults to 2 seconds.
-        :type poll_time: int, optional
-        :raises Exception: If the message queue is not configured.
-        :raises PairDoesNotExistException: If the pair does not exist in the client.
+        :param poll_time: Polling interval in seconds, defaults to an interval adapted to the block time of the chain.
+            Unused if the network has a log subscriber, as events are then pushed by the node.
+        :type poll_time: Optional[float], optional
+        :raises Exception: If the message queue is not configured or the assets of the pair are not in the clients
+            token set.
         """
         if self.message_queue is None:
             raise Exception(
@@ -422,25 +878,8 @@ class Client:
                 "cannot be none."
             )
 
-        base_asset, quote_asset = pair_name.split("/")
-
-        bid_identifier = self.network.w3.solidity_keccak(
-            abi_types=["address", "address"],
-            values=[
-                self.network.tokens[quote_asset].address,
-                self.network.tokens[base_asset].address,
-            ],
-        ).hex()
-        ask_identifier = self.network.w3.solidity_keccak(
-            abi_types=["address", "address"],
-            values=[
-                self.network.tokens[base_asset].address,
-                self.network.tokens[quote_asset].address,
-            ],
-        ).hex()
-
-        argument_filters = event_type.default_filters(
-            bid_identifier=bid_identifier, ask_identifier=ask_identifier
+        argument_filters = self._default_filters(
+            pair_name=pair_name, event_type=event_type
         )
 
         if filters is not None:
@@ -458,8 +897,102 @@ class Client:
             if event_handler is None
             else event_handler,
             poll_time=poll_time,
+            poll_scheduler=self._poll_scheduler,
+            log_subscriber=self.network.log_subscriber,
+        )
+
+    def start_event_multiplex_poller(
+        self,
+        pair_names: List[str],
+        event_type: Type[BaseEvent],
+        filters: Optional[Dict[str, Any]] = None,
+        event_handler: Optional[Callable] = None,
+        poll_time: Optional[float] = None,
+    ) -> None:
+        """Starts a single background event poller that listens for events of the specified event type across all the
+        specified pairs. Events are retrieved with one filter on the market and then dispatched to the event handler
+        with the pair they relate to, instead of polling the node once per pair.
+
+        :param pair_names: Names of the pairs to start the event poller for.
+        :type pair_names: List[str]
+        :param event_type: Type of the event to listen for.
+        :type event_type: Type[BaseEvent]
+        :param filters: Optional filters to apply when retrieving events, defaults to the events default filters
+            (optional, default is None). These are added to the default filters for the event
+        :type filters: Optional[Dict[str, Any]], optional
+        :param event_handler: Optional event handler function to process the retrieved events, defaults to the
+            self._default_event_handler (optional, default is None).
+        :type event_handler: Optional[Callable], optional
+        :param poll_time: Polling interval in seconds, defaults to an interval adapted to the block time of the chain.
+            Unused if the network has a log subscriber, as events are then pushed by the node.
+        :type poll_time: Optional[float], optional
+        :raises Exception: If the message queue is not configured.
+        """
+        if self.message_queue is None:
+            raise Exception(
+                "Event poller is configured to place messages on the message queue. Message queue"
+                "cannot be none."
+            )
+
+        argument_filters: Dict[str, Any] = {}
+        for pair_name in pair_names:
+            bid_identifier, ask_identifier = self._pair_identifiers(pair_name=pair_name)
+
+            self._pair_by_identifier[bid_identifier] = pair_name
+            self._pair_by_identifier[ask_identifier] = pair_name
+
+            for key, value in self._default_filters(
+                pair_name=pair_name, event_type=event_type
+            ).items():
+                argument_filters.setdefault(key, []).extend(value)
+
+        if filters is not None:
+            argument_filters.update(filters)
+
+        event_type.get_event_contract(
+            market=self.network.rubicon_market, router=self.network.rubicon_router
+        ).start_event_poller(
+            pair_name=None,
+            event_type=event_type,
+            argument_filters=argument_filters,
+            event_handler=partial(
+                self._multiplexed_event_handler,
+                self._default_event_handler if event_handler is None else event_handler,
+            ),
+            poll_time=poll_time,
+            poll_scheduler=self._poll_scheduler,
+            log_subscriber=self.network.log_subscriber,
         )
 
+    def _multiplexed_event_handler(
+        self,
+        event_handler: Callable,
+        pair_name: Optional[str],
+        event_type: Type[BaseEvent],
+        event_data: EventData,
+    ) -> None:
+        """Event handler used by the multiplexed event poller. It resolves the pair an event belongs to from the pair
+        identifier of the event and then passes the event on to the event handler.
+
+        :param event_handler: The event handler to dispatch the event to.
+        :type event_handler: Callable
+        :param pair_name: Unused, the pair name is resolved from the event.
+        :type pair_name: Optional[str]
+        :param event_type: Type of the event.
+        :type event_type: Type[BaseEvent]
+        :param event_data: Data of the retrieved event.
+        :type event_data: EventData
+        """
+        pair_name = self._pair_by_identifier.get(
+            self.network.w3.to_hex(event_data["args"]["pair"])
+        )
+
+        # The event is for a pair that is not being listened to
+        if pair_name is None:
+            return
+
+        event_handler(pair_name, event_type, event_data)
+
     def _default_event_handler(
         self, pair_name: str, event_type: Type[BaseEvent], event_data: EventData
     ) -> None:
@@ -473,28 +1006,54 @@ class Client:
         :param event_data: Data of the retrieved event.
         :type event_data: EventData
         """
+        event = self._build_event(
+            pair_name=pair_name, event_type=event_type, event_data=event_data
+        )
+
+        if event is not None:
+            self.message_queue.put(event)
+
+    def _build_event(
+        self, pair_name: str, event_type: Type[BaseEvent], event_data: EventData
+    ) -> Optional[OrderEvent | FeeEvent]:
+        """Build the order or fee event that is placed on the message queue from the data of a retrieved event. This
+        is the decode path shared by the event handlers of the Client and its subclasses.
+
+        :param pair_name: Name of the pair associated with the event.
+        :type pair_name: str
+        :param event_type: Type of the event.
+        :type event_type: Type[BaseEvent]
+        :param event_data: Data of the retrieved event.
+        :type event_data: EventData
+        :return: The order or fee event, or None if the event does not pass the client filter.
+        :rtype: Optional[OrderEvent | FeeEvent]
+        """
+        # Discard events that do not pass the client filter before building them. A wallet filter cannot always be
+        # applied by the node, e.g. the taker of an emitTake event is not indexed.
+        if not event_type.client_filter_args(
+            args=event_data["args"], wallet=self.wallet
+        ):
+            return None
+
         raw_event = event_type(
             block_number=event_data["blockNumber"], **event_data["args"]
         )
 
-        if raw_event.client_filter(wallet=self.wallet):
-            if isinstance(raw_event, EmitFeeEvent):
-                asset = self.network.tokens[raw_event.asset]
+        if isinstance(raw_event, EmitFeeEvent):
+            asset = self.network.tokens[raw_event.asset]
 
-                event = FeeEvent.from_event(
-                    pair_name=pair_name, asset=asset, event=raw_event
-                )
-            else:
-                base_asset, quote_asset = pair_name.split("/")
+            return FeeEvent.from_event(
+                pair_name=pair_name, asset=asset, event=raw_event
+            )
 
-                event = OrderEvent.from_event(
-                    base_asset=self.network.tokens[base_asset],
-                    quote_asset=self.network.tokens[quote_asset],
-                    event=raw_event,
-                    wallet=self.wallet,
-                )
+        base_asset, quote_asset = pair_name.split("/")
 
-            self.message_queue.put(event)
+        return OrderEvent.from_event(
+            base_asset=self.network.tokens[base_asset],
+            quote_asset=self.network.tokens[quote_asset],
+            event=raw_event,
+            wallet=self.wallet,
+        )
 
     ######################################################################
     # order methods
@@ -527,15 +1086,15 @@ class Client:
         :return: The transaction to execute the market order.
         :rtype: TxParams
         """
-        base_asset, quote_asset = order.pair_name.split("/")
+        base_asset, quote_asset = self._get_pair(pair_name=order.pair_name)
 
         match order.order_side:
             case OrderSide.BUY:
                 transaction = self.network.rubicon_market.buy_all_amount(
-                    buy_gem=self.network.tokens[base_asset].address,
-                    buy_amt=self.network.tokens[base_asset].to_integer(order.size),
-                    pay_gem=self.network.tokens[quote_asset].address,
-                    max_fill_amount=self.network.tokens[quote_asset].to_integer(
+                    buy_gem=base_asset.address,
+                    buy_amt=base_asset.to_integer(order.size),
+                    pay_gem=quote_asset.address,
+                    max_fill_amount=quote_asset.to_integer(
                         order.worst_execution_price * order.size
                     ),
                     wallet=self.wallet,
@@ -546,10 +1105,10 @@ class Client:
                 )
             case OrderSide.SELL:
                 transaction = self.network.rubicon_market.sell_all_amount(
-                    pay_gem=self.network.tokens[base_asset].address,
-                    pay_amt=self.network.tokens[base_asset].to_integer(order.size),
-                    buy_gem=self.network.tokens[quote_asset].address,
-                    min_fill_amount=self.network.tokens[quote_asset].to_integer(
+                    pay_gem=base_asset.address,
+                    pay_amt=base_asset.to_integer(order.size),
+                    buy_gem=quote_asset.address,
+                    min_fill_amount=quote_asset.to_integer(
                         order.worst_execution_price * order.size
                     ),
                     wallet=self.wallet,
@@ -561,7 +1120,8 @@ class Client:
             case _:
                 raise Exception("OrderSide must be BUY or SELL")
 
-        transaction["pair_names"] = [order.pair_name]
+        if transaction:
+            transaction["pair_names"] = [order.pair_name]
 
         return transaction
 
@@ -591,17 +1151,15 @@ class Client:
         :return: The transaction to execute the limit order.
         :rtype: TxParams
         """
-        base_asset, quote_asset = order.pair_name.split("/")
+        base_asset, quote_asset = self._get_pair(pair_name=order.pair_name)
 
         match order.order_side:
             case OrderSide.BUY:
                 transaction = self.network.rubicon_market.offer(
-                    pay_amt=self.network.tokens[quote_asset].to_integer(
-                        order.price * order.size
-                    ),
-                    pay_gem=self.network.tokens[quote_asset].address,
-                    buy_amt=self.network.tokens[base_asset].to_integer(order.size),
-                    buy_gem=self.network.tokens[base_asset].address,
+                    pay_amt=quote_asset.to_integer(order.price * order.size),
+                    pay_gem=quote_asset.address,
+                    buy_amt=base_asset.to_integer(order.size),
+                    buy_gem=base_asset.address,
                     wallet=self.wallet,
                     nonce=nonce,
                     gas=gas,
@@ -610,12 +1168,10 @@ class Client:
                 )
             case OrderSide.SELL:
                 transaction = self.network.rubicon_market.offer(
-                    pay_amt=self.network.tokens[base_asset].to_integer(order.size),
-                    pay_gem=self.network.tokens[base_asset].address,
-                    buy_amt=self.network.tokens[quote_asset].to_integer(
-                        order.price * order.size
-                    ),
-                    buy_gem=self.network.tokens[quote_asset].address,
+                    pay_amt=base_asset.to_integer(order.size),
+                    pay_gem=base_asset.address,
+                    buy_amt=quote_asset.to_integer(order.price * order.size),
+                    buy_gem=quote_asset.address,
                     wallet=self.wallet,
                     nonce=nonce,
                     gas=gas,
@@ -625,7 +1181,8 @@ class Client:
             case _:
                 raise Exception("OrderSide must be BUY or SELL")
 
-        transaction["pair_names"] = [order.pair_name]
+        if transaction:
+            transaction["pair_names"] = [order.pair_name]
 
         return transaction
 
@@ -664,7 +1221,8 @@ class Client:
             max_priority_fee_per_gas=max_priority_fee_per_gas,
         )
 
-        transaction["pair_names"] = [order.pair_name]
+        if transaction:
+            transaction["pair_names"] = [order.pair_name]
 
         return transaction
 
@@ -694,39 +1252,10 @@ class Client:
         :return: Transaction to execute the limit order batch.
         :rtype: TxParams
         """
-        pay_amts = []
-        pay_gems = []
-        buy_amts = []
-        buy_gems = []
-
-        pair_names: List[str] = []
-        for order in orders:
-            base_asset, quote_asset = order.pair_name.split("/")
-            pair_names.append(order.pair_name)
-
-            match order.order_side:
-                case OrderSide.BUY:
-                    pay_amts.append(
-                        self.network.tokens[quote_asset].to_integer(
-                            order.price * order.size
-                        )
-                    )
-                    pay_gems.append(self.network.tokens[quote_asset].address)
-                    buy_amts.append(
-                        self.network.tokens[base_asset].to_integer(order.size)
-                    )
-                    buy_gems.append(self.network.tokens[base_asset].address)
-                case OrderSide.SELL:
-                    pay_amts.append(
-                        self.network.tokens[base_asset].to_integer(order.size)
-                    )
-                    pay_gems.append(self.network.tokens[base_asset].address)
-                    buy_amts.append(
-                        self.network.tokens[quote_asset].to_integer(
-                            order.price * order.size
-                        )
-                    )
-                    buy_gems.append(self.network.tokens[quote_asset].address)
+        pay_amts, pay_gems, buy_amts, buy_gems = self._batch_order_amounts(
+            orders=orders
+        )
+        pair_names: List[str] = [order.pair_name for order in orders]
 
         transaction = self.network.rubicon_market.batch_offer(
             pay_amts=pay_amts,
@@ -770,42 +1299,25 @@ class Client:
         :return: The transaction to execute the update limit order batch.
         :rtype: TxParams
         """
-        order_ids = []
-        pay_amts = []
-        pay_gems = []
-        buy_amts = []
-        buy_gems = []
-
-        pair_names: List[str] = []
+        # A requote cancels the order it updates, so only the last update of an order can be applied on chain. Earlier
+        # updates of the same order are dropped instead of reverting the whole batch.
+        latest_updates: Dict[int, UpdateLimitOrder] = {}
         for order in orders:
-            base_asset, quote_asset = order.pair_name.split("/")
-            pair_names.append(order.pair_name)
+            latest_updates.pop(order.order_id, None)
+            latest_updates[order.order_id] = order
 
-            order_ids.append(order.order_id)
+        if len(latest_updates) < len(orders):
+            logger.debug(
+                "dropped %s superseded limit order updates from the batch",
+                len(orders) - len(latest_updates),
+            )
+            orders = list(latest_updates.values())
 
-            match order.order_side:
-                case OrderSide.BUY:
-                    pay_amts.append(
-                        self.network.tokens[quote_asset].to_integer(
-                            order.price * order.size
-                        )
-                    )
-                    pay_gems.append(self.network.tokens[quote_asset].address)
-                    buy_amts.append(
-                        self.network.tokens[base_asset].to_integer(order.size)
-                    )
-                    buy_gems.append(self.network.tokens[base_asset].address)
-                case OrderSide.SELL:
-                    pay_amts.append(
-                        self.network.tokens[base_asset].to_integer(order.size)
-                    )
-                    pay_gems.append(self.network.tokens[base_asset].address)
-                    buy_amts.append(
-                        self.network.tokens[quote_asset].to_integer(
-                            order.price * order.size
-                        )
-                    )
-                    buy_gems.append(self.network.tokens[quote_asset].address)
+        pay_amts, pay_gems, buy_amts, buy_gems = self._batch_order_amounts(
+            orders=orders
+        )
+        order_ids = [order.order_id for order in orders]
+        pair_names: List[str] = [order.pair_name for order in orders]
 
         transaction = self.network.rubicon_market.batch_requote(
             ids=order_ids,
@@ -819,8 +1331,8 @@ class Client:
             max_fee_per_gas=max_fee_per_gas,
             max_priority_fee_per_gas=max_priority_fee_per_gas,
         )
-
-        transaction["pair_names"] = pair_names
+        if transaction:
+            transaction["pair_names"] = pair_names
 
         return transaction
 
@@ -850,13 +1362,8 @@ class Client:
         :return: The transaction to execute the cancel limit orders batch.
         :rtype: TxParams
         """
-        order_ids = []
-
-        pair_names: List[str] = []
-        for order in orders:
-            pair_names.append(order.pair_name)
-
-            order_ids.append(order.order_id)
+        order_ids = [order.order_id for order in orders]
+        pair_names: List[str] = [order.pair_name for order in orders]
 
         transaction = self.network.rubicon_market.batch_cancel(
             ids=order_ids,
@@ -866,8 +1373,8 @@ class Client:
             max_fee_per_gas=max_fee_per_gas,
             max_priority_fee_per_gas=max_priority_fee_per_gas,
         )
-
-        transaction["pair_names"] = pair_names
+        if transaction:
+            transaction["pair_names"] = pair_names
 
         return transaction
 
@@ -1194,6 +1701,141 @@ class Client:
 
         return transaction_receipt
 
+    @staticmethod
+    def _put_drop_oldest(message_queue: queue.Queue, message: Any) -> None:
+        """Put a message on a bounded queue without blocking. If the queue is full the oldest message is dropped to
+        make space for the new message.
+
+        :param message_queue: The bounded queue to put the message on.
+        :type message_queue: queue.Queue
+        :param message: The message to put on the queue.
+        :type message: Any
+        """
+        while True:
+            try:
+                message_queue.put_nowait(message)
+                return
+            except queue.Full:
+                try:
+                    message_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _pair_identifiers(self, pair_name: str) -> Tuple[str, str]:
+        """Get the bid and ask identifiers of a pair as used by the RubiconMarket to identify a pair on events.
+
+        :param pair_name: Name of the pair.
+        :type pair_name: str
+        :return: The bid identifier and ask identifier of the pair.
+        :rtype: Tuple[str, str]
+        """
+        identifiers = self._pair_identifier_cache.get(pair_name)
+        if identifiers is not None:
+            return identifiers
+
+        base_asset, quote_asset = self._get_pair(pair_name=pair_name)
+
+        bid_identifier = self.network.w3.solidity_keccak(
+            abi_types=["address", "address"],
+            values=[quote_asset.address, base_asset.address],
+        ).hex()
+        ask_identifier = self.network.w3.solidity_keccak(
+            abi_types=["address", "address"],
+            values=[base_asset.address, quote_asset.address],
+        ).hex()
+
+        self._pair_identifier_cache[pair_name] = (bid_identifier, ask_identifier)
+
+        return bid_identifier, ask_identifier
+
+    def _default_filters(
+        self, pair_name: str, event_type: Type[BaseEvent]
+    ) -> Dict[str, Any]:
+        """Get the default argument filters of an event type for a pair. The filters are built once per event type and
+        pair, and a copy is returned so that callers can add their own filters to it.
+
+        :param pair_name: Name of the pair.
+        :type pair_name: str
+        :param event_type: The type of the event.
+        :type event_type: Type[BaseEvent]
+        :return: The default argument filters of the event type for the pair.
+        :rtype: Dict[str, Any]
+        """
+        key = (event_type, pair_name)
+
+        filters = self._filter_cache.get(key)
+        if filters is None:
+            bid_identifier, ask_identifier = self._pair_identifiers(pair_name=pair_name)
+
+            filters = event_type.default_filters(
+                bid_identifier=bid_identifier, ask_identifier=ask_identifier
+            )
+            self._filter_cache[key] = filters
+
+        return dict(filters)
+
+    def _batch_order_amounts(
+        self, orders: List[Union[NewLimitOrder, UpdateLimitOrder]]
+    ) -> Tuple[List[int], List[ChecksumAddress], List[int], List[ChecksumAddress]]:
+        """Build the pay and buy amounts and gems of a batch of limit orders as expected by the RubiconMarket batch
+        methods.
+
+        :param orders: The limit orders in the batch.
+        :type orders: List[Union[NewLimitOrder, UpdateLimitOrder]]
+        :return: The pay amounts, pay gems, buy amounts and buy gems of the orders.
+        :rtype: Tuple[List[int], List[ChecksumAddress], List[int], List[ChecksumAddress]]
+        """
+        pairs = self._get_pairs(pair_names={order.pair_name for order in orders})
+
+        if any(order.order_side not in _LIMIT_ORDER_LEGS for order in orders):
+            raise Exception("OrderSide must be BUY or SELL")
+
+        if not orders:
+            return [], [], [], []
+
+        # Build the legs of all orders in one pass and split them into columns, rather than growing four lists
+        legs = [
+            _LIMIT_ORDER_LEGS[order.order_side](*pairs[order.pair_name], order)
+            for order in orders
+        ]
+        pay_amts, pay_gems, buy_amts, buy_gems = map(list, zip(*legs))
+
+        return pay_amts, pay_gems, buy_amts, buy_gems
+
+    def _get_pairs(self, pair_names: Set[str]) -> Dict[str, Tuple[ERC20, ERC20]]:
+        """Resolve the base and quote asset of each pair once, so they can be looked up locally when building batches.
+
+        :param pair_names: The names of the pairs to resolve.
+        :type pair_names: Set[str]
+        :return: A mapping of pair name to the base and quote asset of the pair.
+        :rtype: Dict[str, Tuple[ERC20, ERC20]]
+        """
+        return {
+            pair_name: self._get_pair(pair_name=pair_name) for pair_name in pair_names
+        }
+
+    def _get_pair(self, pair_name: str) -> Tuple[ERC20, ERC20]:
+        """Resolve the base and quote asset of a pair.
+
+        :param pair_name: The name of the pair to resolve.
+        :type pair_name: str
+        :return: The base and quote asset of the pair.
+        :rtype: Tuple[ERC20, ERC20]
+        :raises Exception: If the assets of the pair are not in the clients token set.
+        """
+        base_asset, quote_asset = pair_name.split("/")
+
+        base_erc20 = self.network.tokens.get(base_asset)
+        quote_erc20 = self.network.tokens.get(quote_asset)
+
+        if base_erc20 is None or quote_erc20 is None:
+            raise Exception(
+                f"{pair_name} is not a valid pair as its assets are not in the clients token set: "
+                f"{self.network.tokens.keys()}"
+            )
+
+        return base_erc20, quote_erc20
+
     def _get_base_and_quote_asset(
         self,
         raw: EmitOfferEvent | EmitTakeEvent | EmitCancelEvent | SubgraphOffer,
@@ -1,6 +1,10 @@
 from .contract_types import *
+from .poll_scheduler import PollScheduler
+from .http_provider import PooledHTTPProvider
+from .log_subscriber import LogSubscriber
 from .base_contract import BaseContract
 from .erc20 import ERC20
 from .market import RubiconMarket
+from .multicall import Multicall
 from .router import RubiconRouter
-from .transaction_handler import TransactionHandler
+from .transaction_handler import TransactionHandler, TransactionSendError
@@ -1,26 +1,276 @@
+import itertools
 import json
 import logging
 import os
-from threading import Thread
-from time import sleep
-from typing import Optional, Callable, Type, Dict, Any, Union
-
-from eth_typing import ChecksumAddress
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from statistics import median
+from time import monotonic
+from typing import Optional, Callable, Type, Dict, Any, Union, List, Tuple
+from weakref import WeakKeyDictionary
+
+from eth_typing import ChecksumAddress, HexStr
 from eth_utils import encode_hex, function_abi_to_4byte_selector
-from web3 import Web3
-from web3._utils.filters import LogFilter  # noqa
+from hexbytes import HexBytes
+from web3 import Web3, HTTPProvider
+from eth_abi.exceptions import EncodingError
+from web3._utils.abi import (  # noqa
+    get_abi_input_types,
+    get_abi_output_types,
+    map_abi_data,
+)
+from web3._utils.filters import (  # noqa
+    LogFilter,
+    construct_event_filter_params,
+    match_fn,
+)
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS  # noqa
 from web3.contract import Contract
 from web3.contract.contract import (
     ContractFunction,
 )  # TODO: figure out why jupyter notebook is complaining about this
 from web3.exceptions import ContractCustomError
-from web3.types import ABI, Nonce, TxParams
+from web3.types import ABI, ABIFunction, Nonce, TxParams, LogReceipt
 
+from rubi.contracts.batch_request import http_batch_request
 from rubi.contracts.contract_types import BaseEvent
+from rubi.contracts.event_decoding import decode_event_log
+from rubi.contracts.log_subscriber import LogSubscriber
+from rubi.contracts.poll_scheduler import PollScheduler
+from rubi.contracts.transaction_handler import (
+    fetch_transaction_params,
+    TransactionHandler,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _load_abi(name: str) -> ABI:
+    """Load an abi from the network_config/abis/ folder. Abis are immutable, so each file is only read and parsed
+    once and the parsed abi is shared by every contract created from it.
+
+    :param name: The name of the abi file without the .json extension.
+    :type name: str
+    :return: The parsed abi.
+    :rtype: ABI
+    :raises Exception: If the abi file does not exist.
+    """
+    try:
+        path = f"{os.path.dirname(os.path.abspath(__file__))}/../../network_config/abis/{name}.json"
+
+        with open(path) as f:
+            return json.load(f)
+
+    except FileNotFoundError:
+        raise Exception(
+            f"{name}.json abi not found. This file should be in the network_config/abis/ folder"
+        )
+
+
+# The chain id of a node never changes, so it is read once per Web3 instance and shared by every contract using it
+_chain_ids: "WeakKeyDictionary[Web3, int]" = WeakKeyDictionary()
+
+
+def get_chain_id(w3: Web3) -> int:
+    """Get the chain id of the node the Web3 instance is connected to. The chain id is only requested from the node
+    the first time it is needed for a Web3 instance.
+
+    :param w3: Web3 instance
+    :type w3: Web3
+    :return: The chain id.
+    :rtype: int
+    """
+    chain_id = _chain_ids.get(w3)
+
+    if chain_id is None:
+        chain_id = int(w3.eth.chain_id)
+        _chain_ids[w3] = chain_id
+
+    return chain_id
+
+
+# chain id -> block time in seconds of the chains in network_config
+KNOWN_BLOCK_TIMES: Dict[int, float] = {
+    10: 2,  # optimism
+    420: 2,  # optimism goerli
+    8453: 2,  # base
+    42161: 0.25,  # arbitrum one
+    421613: 0.25,  # arbitrum goerli
+    80001: 2,  # polygon mumbai
+}
+
+# The block time of a chain is read once per Web3 instance and shared by every event poller using it
+_block_times: "WeakKeyDictionary[Web3, float]" = WeakKeyDictionary()
+
+
+def get_block_time(w3: Web3, sample_size: int = 20) -> float:
+    """Get the block time of the chain the Web3 instance is connected to, clamped to between 0.25 and 5 seconds. The
+    block time of a chain in KNOWN_BLOCK_TIMES is looked up, otherwise it is the median time between the latest
+    sample_size blocks. The block time is only sampled the first time it is needed for a Web3 instance.
+
+    :param w3: Web3 instance
+    :type w3: Web3
+    :param sample_size: The number of blocks to sample the block time from (optional, default is 20).
+    :type sample_size: int
+    :return: The block time in seconds.
+    :rtype: float
+    """
+    block_time = _block_times.get(w3)
+
+    if block_time is None:
+        block_time = KNOWN_BLOCK_TIMES.get(get_chain_id(w3=w3))
+
+        if block_time is None:
+            latest_block = w3.eth.get_block("latest")
+            block_numbers = range(
+                max(0, latest_block["number"] - sample_size), latest_block["number"]
+            )
+
+            timestamps = [
+                block["timestamp"]
+                for block in _get_blocks(w3=w3, block_numbers=block_numbers)
+            ] + [latest_block["timestamp"]]
+
+            block_time = (
+                median(
+                    later - earlier
+                    for earlier, later in zip(timestamps, timestamps[1:])
+                )
+                if len(timestamps) > 1
+                else 0
+            )
+
+        block_time = max(0.25, min(5.0, block_time))
+        _block_times[w3] = block_time
+
+    return block_time
+
+
+def _get_blocks(w3: Web3, block_numbers: range) -> List[Dict[str, Any]]:
+    """Get blocks without their transactions. For an HTTPProvider they are fetched in a single JSON-RPC batch request.
+
+    :param w3: Web3 instance
+    :type w3: Web3
+    :param block_numbers: The numbers of the blocks.
+    :type block_numbers: range
+    :return: The blocks, with their numbers and timestamps as ints.
+    :rtype: List[Dict[str, Any]]
+    """
+    if isinstance(w3.provider, HTTPProvider):
+        try:
+            raw_blocks = http_batch_request(
+                provider=w3.provider,
+                requests=[
+                    ("eth_getBlockByNumber", [hex(block_number), False])
+                    for block_number in block_numbers
+                ],
+            )
+        except Exception as e:
+            logger.debug(
+                "Batch request failed, falling back to individual requests: %s", e
+            )
+        else:
+            return [
+                {
+                    "number": int(raw_block["number"], 16),
+                    "timestamp": int(raw_block["timestamp"], 16),
+                }
+                for raw_block in raw_blocks
+            ]
+
+    return [w3.eth.get_block(block_number) for block_number in block_numbers]
+
+
+# id(function abi) -> (function abi, selector, input types). Every instantiation of a contract function shares its
+# function abi, so the selector is hashed once per function instead of for every call. The function abi is kept with
+# its entry so that its id cannot be reused by another function abi.
+_call_encoders: Dict[int, Tuple[ABIFunction, bytes, List[str]]] = {}
+
+
+def encode_call_data(contract_function: ContractFunction) -> HexStr:
+    """Encode the call data of an instantiated contract function. The arguments are encoded directly with the abi codec
+    instead of going through the argument validation and normalization of ContractFunction, which is most of the
+    cost of encoding a call. Unlike ContractFunction, addresses that are all lowercase are accepted, as they are by
+    Web3.to_checksum_address. Arguments that the codec cannot encode as they are (e.g. ENS names or hex strings for
+    bytes) are encoded by ContractFunction instead.
+
+    :param contract_function: The instantiated contract function.
+    :type contract_function: ContractFunction
+    :return: The call data.
+    :rtype: HexStr
+    """
+    if contract_function.kwargs:
+        return contract_function._encode_transaction_data()
+
+    function_abi = contract_function.abi
+    encoder = _call_encoders.get(id(function_abi))
+
+    if encoder is None or encoder[0] is not function_abi:
+        encoder = (
+            function_abi,
+            function_abi_to_4byte_selector(function_abi),
+            get_abi_input_types(function_abi),
+        )
+        _call_encoders[id(function_abi)] = encoder
+
+    try:
+        encoded_arguments = contract_function.w3.codec.encode(
+            encoder[2], contract_function.args
+        )
+    except EncodingError:
+        return contract_function._encode_transaction_data()
+
+    return HexStr("0x" + (encoder[1] + encoded_arguments).hex())
+
+
+# contract class name -> name of its abi in the network_config/abis/ folder, used by from_address
+_ABI_NAMES: Dict[str, str] = {
+    "RubiconMarket": "market",
+    "RubiconRouter": "router",
+    "ERC20": "ERC20",
+    "Multicall": "multicall",
+}
+
+
+# id(abi) -> (abi, error decoder, names of the functions that are not overloaded). Contracts created from the same abi
+# share the parsed abi from _load_abi, so its error selectors are hashed once instead of for every contract. The abi is
+# kept with its entry so that its id cannot be reused by another abi.
+_abi_summaries: Dict[int, Tuple[ABI, Dict[str, str], Tuple[str, ...]]] = {}
+
+
+def _summarize_abi(abi: ABI) -> Tuple[Dict[str, str], Tuple[str, ...]]:
+    """Get the error decoder and the names of the functions that are not overloaded of an abi, computed once per abi.
+
+    :param abi: The contract abi.
+    :type abi: ABI
+    :return: The error names keyed by error selector, and the names of the functions that are not overloaded.
+    :rtype: Tuple[Dict[str, str], Tuple[str, ...]]
+    """
+    summary = _abi_summaries.get(id(abi))
+
+    if summary is None or summary[0] is not abi:
+        error_decoder: Dict[str, str] = {}
+        function_names = Counter()
+        for item in abi:
+            if item["type"] == "error":
+                error_hex_code = str(encode_hex(function_abi_to_4byte_selector(item)))
+
+                error_decoder[error_hex_code] = item["name"]
+            elif item["type"] == "function":
+                function_names[item["name"]] += 1
+
+        summary = (
+            abi,
+            error_decoder,
+            tuple(name for name, count in function_names.items() if count == 1),
+        )
+        _abi_summaries[id(abi)] = summary
+
+    return summary[1], summary[2]
+
+
 class BaseContract:
     """Base class representation of a contract which defines the structure of a contract and provides several helpful
     methods that can be used by subclass contracts that extend this contract.
@@ -40,14 +290,42 @@ class BaseContract:
         self.contract = contract
         self.address = contract.address
         self.w3 = w3
-        self.chain_id = self.w3.eth.chain_id
-
-        self.error_decoder: Dict[str, str] = {}
-        for item in self.contract.abi:
-            if item["type"] == "error":
-                error_hex_code = str(encode_hex(function_abi_to_4byte_selector(item)))
+        self.chain_id = get_chain_id(w3=w3)
+
+        # The fields every transaction of this contract shares, copied for each transaction
+        self._transaction_template: Dict[str, Any] = {"chainId": self.chain_id}
+
+        # (fetched at, max fee per gas, max priority fee per gas). Fees rarely change more than once per block, so the
+        # default fees are reused by the transactions of this contract for fee_cache_time seconds.
+        self.fee_cache_time: float = 2
+        self._fee_cache: Optional[Tuple[float, int, int]] = None
+
+        # The transaction handler that sends the transactions of this contract, set by the Network. If set the default
+        # nonce and fees come from the handler, which advances the nonce locally for each transaction it sends instead
+        # of asking the node for every transaction.
+        self.transaction_handler: Optional[TransactionHandler] = None
+
+        # function name -> gas limit used for the transactions of the function when no gas limit is passed, instead of
+        # estimating it with an eth_estimateGas request for every transaction. None are set by default, as the gas
+        # used by most functions depends on the token and the state of the order book.
+        self.gas_limits: Dict[str, int] = {}
+
+        # Shared by every contract with the same abi, so it should not be modified
+        self.error_decoder: Dict[str, str]
+        self.error_decoder, function_names = _summarize_abi(abi=self.contract.abi)
+
+        # Bind each function that is not overloaded to its abi, so that instantiating it does not search the contract
+        # abi for the function matching the arguments on every call. Overloaded functions can be bound by signature
+        # with contract.get_function_by_signature.
+        for function_name in function_names:
+            setattr(
+                self.contract.functions,
+                function_name,
+                self.contract.get_function_by_name(function_name),
+            )
 
-                self.error_decoder[error_hex_code] = item["name"]
+        # Calldata and contract function of argument-less read calls, keyed by function name
+        self._constant_calls: Dict[str, Tuple[HexStr, ContractFunction]] = {}
 
     @classmethod
     def from_address_and_abi(
@@ -92,125 +370,116 @@ class BaseContract:
         :return: A BaseContract instance based on the address.
         :rtype: BaseContract
         """
+        name = _ABI_NAMES.get(cls.__name__)
 
-        match str(cls.__name__):
-            case "RubiconMarket":
-                name = "market"
-            case "RubiconRouter":
-                name = "router"
-            case "ERC20":
-                name = "ERC20"
-            case _:
-                raise Exception("from_address called on unexpected class")
-
-        try:
-            path = f"{os.path.dirname(os.path.abspath(__file__))}/../../network_config/abis/{name}.json"
-
-            with open(path) as f:
-                abi = json.load(f)
-
-        except FileNotFoundError:
-            raise Exception(
-                f"{name}.json abi not found. This file should be in the network_config/abis/ folder"
-            )
+        if name is None:
+            raise Exception("from_address called on unexpected class")
 
         return cls.from_address_and_abi(
             w3=w3,
             address=address,
-            contract_abi=abi,
+            contract_abi=_load_abi(name=name),
         )
 
     ######################################################################
     # event listeners
     ######################################################################
 
-    # TODO: revisit poll time. Right now it is set to block production time of optimism according to:
-    #  https://community.optimism.io/docs/protocol/2-rollup-protocol/#block-storage
-    #  however arbitrum produces blocks faster (every 0.25 secs) according to:
-    #  https://arbiscan.io/chart/blocktime so we may be prudent to account for different chains
-    #  however the better way to do this is probably a websocket connection to the node
     # TODO: investigate using a more generic filter so that you don't need to poll for each event as this could
     #  spam the node that is being connected to
     def start_event_poller(
         self,
-        pair_name: str,
+        pair_name: Optional[str],
         event_type: Type[BaseEvent],
         argument_filters: Optional[Dict[str, Any]] = None,
         event_handler: Optional[Callable] = None,
-        poll_time: int = 2,
+        poll_time: Optional[float] = None,
+        poll_scheduler: Optional[PollScheduler] = None,
+        log_subscriber: Optional[LogSubscriber] = None,
     ) -> None:
-        """Start a thread which runs an event poller for a specific event type.
+        """Start an event poller for a specific event type. The poller is run by the poll scheduler, or if a log
+        subscriber is passed the events are pushed by the node over its websocket connection instead of being polled.
 
-        :param pair_name: The name of the pair we are monitoring events of.
-        :type pair_name: str
+        Without a poll time the poller polls once per block of the chain. After 3 polls in a row without any events the
+        time between polls is increased by half each poll, up to 10 seconds, and it is reset by the first poll with
+        events. Events are never missed by polling less often, as each poll returns every event since the last one.
+
+        :param pair_name: The name of the pair we are monitoring events of. None if events of multiple pairs are being
+            monitored.
+        :type pair_name: Optional[str]
         :param event_type: The type of event to poll for.
         :type event_type: Type[BaseEvent]
         :param argument_filters: Optional filters that the node will filter events on (optional, default is None).
         :type argument_filters: Optional[Dict[str, Any]]
         :param event_handler: Optional event handler function. Defaults to using the events default handler.
         :type event_handler: Optional[Callable]
-        :param poll_time: The time interval between each poll in seconds. Defaults to 2 seconds.
-        :type poll_time: int
+        :param poll_time: The fixed time interval between each poll in seconds (optional, default is None). Defaults to
+            an interval adapted to the block time of the chain.
+        :type poll_time: Optional[float]
+        :param poll_scheduler: The poll scheduler to run the poller on. Defaults to a new poll scheduler dedicated to
+            this poller (optional, default is None).
+        :type poll_scheduler: Optional[PollScheduler]
+        :param log_subscriber: The log subscriber to receive the events from instead of polling for them (optional,
+            default is None).
+        :type log_subscriber: Optional[LogSubscriber]
         """
-
-        event_filter = event_type.create_event_filter(
-            contract=self.contract, argument_filters=argument_filters
-        )
         handler = (
             event_handler if event_handler is not None else event_type.default_handler
         )
 
-        thread = Thread(
-            target=self._start_default_event_poller,
-            args=(
-                pair_name,
-                event_type,
-                self.contract,
-                argument_filters,
-                event_filter,
-                handler,
-                poll_time,
-            ),
-            daemon=True,
+        if log_subscriber is not None:
+            self._subscribe_to_events(
+                pair_name=pair_name,
+                event_type=event_type,
+                argument_filters=argument_filters,
+                event_handler=handler,
+                log_subscriber=log_subscriber,
+            )
+            return
+
+        event_filter = self._create_event_filter(
+            event_type=event_type, argument_filters=argument_filters
         )
-        thread.start()
 
-    @staticmethod
-    def _start_default_event_poller(
-        pair_name: str,
-        event_type: Type[BaseEvent],
-        contract: Contract,
-        argument_filters: Optional[Dict[str, Any]],
-        event_filter: LogFilter,
-        event_handler: Callable,
-        poll_time: int,
-    ) -> None:
-        """Start the default event poller loop. This thread will stop if the pair is removed from the client.
+        if poll_scheduler is None:
+            poll_scheduler = PollScheduler(max_workers=1)
 
-        :param pair_name: The name of the event pair.
-        :type pair_name: str
-        :param event_type: The type of the event.
-        :type event_type: Type[BaseEvent]
-        :param event_filter: The event filter to retrieve new entries.
-        :type event_filter: LogFilter
-        :param event_handler: The event handler function.
-        :type event_handler: Callable
-        :param poll_time: The time interval between poll iterations in seconds.
-        :type poll_time: int
-        """
-        polling = True
+        adaptive = poll_time is None
+        base_poll_time = get_block_time(w3=self.w3) if adaptive else poll_time
+        next_poll_time = base_poll_time
+        empty_polls = 0
+
+        def poll() -> Optional[float]:
+            """Poll the event filter once and pass each new entry to the event handler. Polling will stop if the pair
+            is removed from the client.
+
+            :return: The time until the next poll in seconds, or None if polling should stop.
+            :rtype: Optional[float]
+            """
+            nonlocal event_filter, next_poll_time, empty_polls
 
-        while polling:
             try:
-                for event_data in event_filter.get_new_entries():
-                    event_handler(pair_name, event_type, event_data)
+                entries = event_filter.get_new_entries()
+
+                for event_data in entries:
+                    handler(pair_name, event_type, event_data)
+
+                if entries:
+                    next_poll_time = base_poll_time
+                    empty_polls = 0
+                elif adaptive:
+                    empty_polls += 1
+
+                    # Back off while there is no activity
+                    if empty_polls >= 3:
+                        next_poll_time = min(next_poll_time * 1.5, 10)
             except Exception as e:
                 logger.error(e)
 
                 # The filter has been deleted by the node and needs to be recreated
                 if "filter not found" in str(e):
-                    event_filter = event_type.create_event_filter(
-                        contract=contract, argument_filters=argument_filters
+                    event_filter = self._create_event_filter(
+                        event_type=event_type, argument_filters=argument_filters
                     )
                     logger.info(f"event filter for: {event_type} has been recreated")
 
@@ -219,9 +488,101 @@ class BaseContract:
                 #  circular import. Think about restructuring the directories to avoid this (e.g one root level types
                 #  directory).
                 if "add pair to the client" in str(e):
-                    polling = False
+                    return None
+
+            return next_poll_time
+
+        poll_scheduler.schedule(job=poll)
+
+    def _create_event_filter(
+        self, event_type: Type[BaseEvent], argument_filters: Optional[Dict[str, Any]]
+    ) -> LogFilter:
+        """Create an event filter for an event type whose entries are decoded with decode_event_log instead of web3's
+        get_event_data.
+
+        :param event_type: The type of event to create the filter for.
+        :type event_type: Type[BaseEvent]
+        :param argument_filters: Optional filters that the node will filter events on.
+        :type argument_filters: Optional[Dict[str, Any]]
+        :return: The created event filter.
+        :rtype: LogFilter
+        """
+        event_filter = event_type.create_event_filter(
+            contract=self.contract, argument_filters=argument_filters
+        )
+        event_filter.log_entry_formatter = partial(
+            decode_event_log,
+            self.w3.codec,
+            self.contract.events[event_type.get_event_name()]().abi,
+        )
+
+        return event_filter
+
+    def _subscribe_to_events(
+        self,
+        pair_name: Optional[str],
+        event_type: Type[BaseEvent],
+        argument_filters: Optional[Dict[str, Any]],
+        event_handler: Callable,
+        log_subscriber: LogSubscriber,
+    ) -> None:
+        """Subscribe to the events of an event type with the log subscriber. The subscription is cancelled if the
+        pair is removed from the client.
+
+        :param pair_name: The name of the pair we are monitoring events of. None if events of multiple pairs are being
+            monitored.
+        :type pair_name: Optional[str]
+        :param event_type: The type of event to subscribe to.
+        :type event_type: Type[BaseEvent]
+        :param argument_filters: Optional filters that the events are filtered on.
+        :type argument_filters: Optional[Dict[str, Any]]
+        :param event_handler: The event handler function.
+        :type event_handler: Callable
+        :param log_subscriber: The log subscriber to subscribe with.
+        :type log_subscriber: LogSubscriber
+        """
+        event_abi = self.contract.events[event_type.get_event_name()]().abi
+
+        # Filters on indexed arguments are applied by the node, filters on other arguments are applied to the logs
+        data_filter_set, filter_params = construct_event_filter_params(
+            event_abi,
+            self.w3.codec,
+            contract_address=self.address,
+            argument_filters=argument_filters,
+        )
+        matches_data_filters = (
+            match_fn(self.w3.codec, data_filter_set) if any(data_filter_set) else None
+        )
+
+        def handle_log(log: LogReceipt) -> bool:
+            """Decode a log and pass it to the event handler.
+
+            :param log: The log of the event.
+            :type log: LogReceipt
+            :return: Whether the subscription should be kept.
+            :rtype: bool
+            """
+            if matches_data_filters is not None and not matches_data_filters(
+                log["data"]
+            ):
+                return True
+
+            try:
+                event_handler(
+                    pair_name,
+                    event_type,
+                    decode_event_log(self.w3.codec, event_abi, log),
+                )
+            except Exception as e:
+                logger.error(e)
+
+                # See the equivalent check of the event poller
+                if "add pair to the client" in str(e):
+                    return False
+
+            return True
 
-            sleep(poll_time)
+        log_subscriber.subscribe(filter_params=filter_params, log_handler=handle_log)
 
     ######################################################################
     # helper methods
@@ -239,7 +600,11 @@ class BaseContract:
         """Default transaction constructor for building transactions for this contract. This function will build
          a transaction with reasonable defaults (mostly from the web3py library).
 
-        Note: if a nonce is not passed then this function will query to the wallet to get the nonce.
+        Note: if a nonce is not passed then the next nonce of the wallet is taken from the transaction handler, or
+        queried from the node if the contract has no transaction handler.
+
+        Note: if a gas limit is not passed then the gas limit of the function in gas_limits is used, or estimated by
+        the node if the function has none.
 
         :param instantiated_contract_function: The instantiated contract function to call.
         :type instantiated_contract_function: ContractFunction
@@ -257,6 +622,9 @@ class BaseContract:
         :return: The built transaction. The result is None if the transaction fails to build
         :rtype: Optional[TxParams]
         """
+        if gas is None:
+            gas = self.gas_limits.get(instantiated_contract_function.fn_name)
+
         base_transaction = self._transaction_params(
             gas=gas,
             nonce=nonce,
@@ -265,6 +633,22 @@ class BaseContract:
             wallet=wallet,
         )
 
+        # With the gas limit, nonce and fees set, build_transaction would only add the call data and target, so the
+        # transaction is built directly instead of going through web3's transaction preparation
+        if "gas" in base_transaction:
+            try:
+                return {
+                    **base_transaction,
+                    "to": instantiated_contract_function.address,
+                    "data": encode_call_data(
+                        contract_function=instantiated_contract_function
+                    ),
+                    "value": 0,
+                }
+            except Exception as e:
+                logger.error(f"Error constructing transaction: {e}")
+                return None
+
         try:
             built_transaction = instantiated_contract_function.build_transaction(
                 transaction=base_transaction
@@ -289,7 +673,9 @@ class BaseContract:
         max_priority_fee_per_gas: Optional[int],
     ) -> Dict:
         """Build transaction parameters Dict for a transaction. If a key is associated with a None value after building
-        the Dict then this key will be removed before returning the dict.
+        the Dict then this key will be removed before returning the dict. If no nonce is passed and the contract has a
+        transaction handler then the nonce, and the default fees if no fees are passed, come from the handler.
+        Otherwise, if no fees are passed then the default fees are used, which are reused for fee_cache_time seconds.
 
         :param wallet: The wallet address to use for interacting with the contract.
         :type wallet: ChecksumAddress
@@ -305,17 +691,205 @@ class BaseContract:
         :return: The transaction parameters dictionary.
         :rtype: Dict
         """
+        if nonce is None and self.transaction_handler is not None:
+            transaction_params = self.transaction_handler.get_transaction_params(
+                wallet=wallet
+            )
+
+            nonce = transaction_params["nonce"]
+
+            if max_fee_per_gas is None and max_priority_fee_per_gas is None:
+                max_fee_per_gas = transaction_params["max_fee_per_gas"]
+                max_priority_fee_per_gas = transaction_params[
+                    "max_priority_fee_per_gas"
+                ]
+
+        if max_fee_per_gas is None and max_priority_fee_per_gas is None:
+            cached_fees = self._fee_cache
+
+            if (
+                cached_fees is not None
+                and monotonic() - cached_fees[0] < self.fee_cache_time
+            ):
+                _, max_fee_per_gas, max_priority_fee_per_gas = cached_fees
+            else:
+                # Fetch the fees, and the nonce, in one round trip instead of one for the nonce and two more when
+                # building the transaction
+                transaction_params = fetch_transaction_params(w3=self.w3, wallet=wallet)
+
+                max_fee_per_gas = transaction_params["max_fee_per_gas"]
+                max_priority_fee_per_gas = transaction_params[
+                    "max_priority_fee_per_gas"
+                ]
+                self._fee_cache = (
+                    monotonic(),
+                    max_fee_per_gas,
+                    max_priority_fee_per_gas,
+                )
+
+                if nonce is None:
+                    nonce = transaction_params["nonce"]
 
         if nonce is None:
-            nonce = self.w3.eth.get_transaction_count(wallet)
-
-        transaction = {
-            "chainId": self.chain_id,
-            "gas": gas,
-            "maxFeePerGas": max_fee_per_gas,
-            "maxPriorityFeePerGas": max_priority_fee_per_gas,
-            "nonce": nonce,
-            "from": wallet,
-        }
-
-        return {key: value for key, value in transaction.items() if value is not None}
+            nonce = self.w3.eth.get_transaction_count(wallet, "pending")
+
+        transaction = {**self._transaction_template, "nonce": nonce, "from": wallet}
+
+        # Only set the optional fields that were passed, instead of building the dict and then filtering it
+        if gas is not None:
+            transaction["gas"] = gas
+        if max_fee_per_gas is not None:
+            transaction["maxFeePerGas"] = max_fee_per_gas
+        if max_priority_fee_per_gas is not None:
+            transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
+
+        return transaction
+
+    def _batch_call(self, contract_functions: List[ContractFunction]) -> List[Any]:
+        """Call several instantiated contract functions in a single JSON-RPC batch request, so that the calls cost one
+        round trip to the node instead of one each. If the provider is not an HTTPProvider, or the node does not
+        support batch requests, the calls are made concurrently as individual requests instead.
+
+        :param contract_functions: The instantiated contract functions to call.
+        :type contract_functions: List[ContractFunction]
+        :return: The results of the calls, in the same order as the contract functions.
+        :rtype: List[Any]
+        """
+        provider = self.w3.provider
+
+        if isinstance(provider, HTTPProvider):
+            try:
+                return self._http_batch_call(
+                    provider=provider, contract_functions=contract_functions
+                )
+            except Exception as e:
+                logger.debug(
+                    "Batch call failed, falling back to individual calls: %s", e
+                )
+
+        with ThreadPoolExecutor() as executor:
+            return list(
+                executor.map(
+                    lambda contract_function: contract_function.call(),
+                    contract_functions,
+                )
+            )
+
+    def _http_batch_call(
+        self, provider: HTTPProvider, contract_functions: List[ContractFunction]
+    ) -> List[Any]:
+        """Send the eth_calls of the instantiated contract functions to the node as a single JSON-RPC batch request and
+        decode the results in the same way as ContractFunction.call.
+
+        :param provider: The HTTPProvider of the Web3 instance.
+        :type provider: HTTPProvider
+        :param contract_functions: The instantiated contract functions to call.
+        :type contract_functions: List[ContractFunction]
+        :return: The results of the calls, in the same order as the contract functions.
+        :rtype: List[Any]
+        """
+        raw_results = http_batch_request(
+            provider=provider,
+            requests=[
+                (
+                    "eth_call",
+                    [
+                        {
+                            "to": contract_function.address,
+                            "data": encode_call_data(
+                                contract_function=contract_function
+                            ),
+                        },
+                        "latest",
+                    ],
+                )
+                for contract_function in contract_functions
+            ],
+        )
+
+        return [
+            self._decode_call_result(
+                contract_function=contract_function, return_data=HexBytes(raw_result)
+            )
+            for contract_function, raw_result in zip(contract_functions, raw_results)
+        ]
+
+    def _call_constant(self, function_name: str) -> Any:
+        """Call a contract function that takes no arguments. The calldata of such a call never changes, so it is
+        encoded once per contract instance and the eth_call is made directly instead of through ContractFunction.call.
+
+        :param function_name: The name of the contract function.
+        :type function_name: str
+        :return: The decoded result of the call.
+        :rtype: Any
+        """
+        if function_name not in self._constant_calls:
+            contract_function = self.contract.get_function_by_name(function_name)()
+
+            self._constant_calls[function_name] = (
+                encode_call_data(contract_function=contract_function),
+                contract_function,
+            )
+
+        data, contract_function = self._constant_calls[function_name]
+
+        return self._eth_call(contract_function=contract_function, data=data)
+
+    def _call(self, contract_function: ContractFunction) -> Any:
+        """Call an instantiated contract function. This is the same as ContractFunction.call, but the call data is
+        encoded with encode_call_data and the eth_call is made directly, which skips the argument validation and
+        normalization of ContractFunction. Used by the read calls that are polled often, e.g. ERC20.balance_of.
+
+        :param contract_function: The instantiated contract function.
+        :type contract_function: ContractFunction
+        :return: The decoded result of the call.
+        :rtype: Any
+        """
+        return self._eth_call(
+            contract_function=contract_function,
+            data=encode_call_data(contract_function=contract_function),
+        )
+
+    def _eth_call(self, contract_function: ContractFunction, data: HexStr) -> Any:
+        """Make an eth_call to the contract with the encoded call data of a contract function and decode its result.
+
+        :param contract_function: The instantiated contract function that is called.
+        :type contract_function: ContractFunction
+        :param data: The encoded call data of the contract function.
+        :type data: HexStr
+        :return: The decoded result of the call.
+        :rtype: Any
+        """
+        transaction: TxParams = {"to": self.address, "data": data}
+        if self.w3.eth.default_account:
+            transaction["from"] = self.w3.eth.default_account
+
+        return self._decode_call_result(
+            contract_function=contract_function,
+            return_data=self.w3.eth.call(transaction),
+        )
+
+    def _decode_call_result(
+        self, contract_function: ContractFunction, return_data: bytes
+    ) -> Any:
+        """Decode the return data of a call to an instantiated contract function in the same way as
+        ContractFunction.call.
+
+        :param contract_function: The instantiated contract function that was called.
+        :type contract_function: ContractFunction
+        :param return_data: The return data of the call.
+        :type return_data: bytes
+        :return: The decoded result of the call.
+        :rtype: Any
+        """
+        output_types = get_abi_output_types(contract_function.abi)
+        output_data = map_abi_data(
+            itertools.chain(
+                BASE_RETURN_NORMALIZERS,
+                contract_function._return_data_normalizers,
+            ),
+            output_types,
+            self.w3.codec.decode(output_types, return_data),
+        )
+
+        return output_data[0] if len(output_data) == 1 else output_data
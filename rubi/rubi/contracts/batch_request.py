@@ -0,0 +1,60 @@
+import json
+from typing import Any, List, Tuple
+
+from web3 import HTTPProvider
+from web3._utils.request import make_post_request  # noqa
+
+from rubi.contracts.http_provider import PooledHTTPProvider
+
+
+def http_batch_request(
+    provider: HTTPProvider,
+    requests: List[Tuple[str, List[Any]]],
+    return_errors: bool = False,
+) -> List[Any]:
+    """Send several JSON-RPC requests to the node of an HTTPProvider as a single batch request, so that they cost one
+    round trip instead of one each. The results are returned as raw JSON-RPC results, i.e. without any of the
+    formatting web3 applies to responses.
+
+    :param provider: The HTTPProvider of the Web3 instance.
+    :type provider: HTTPProvider
+    :param requests: The requests to send as (method, params) tuples.
+    :type requests: List[Tuple[str, List[Any]]]
+    :param return_errors: Whether an error returned for a request is returned as an Exception in place of its result
+        instead of being raised, e.g. when the other requests have side effects (optional, default is False).
+    :type return_errors: bool
+    :return: The raw results of the requests, in the same order as the requests.
+    :rtype: List[Any]
+    :raises Exception: If the node returns an error for any of the requests and return_errors is False.
+    """
+    batch_request = [
+        {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+        for request_id, (method, params) in enumerate(requests)
+    ]
+
+    data = json.dumps(batch_request).encode()
+
+    if isinstance(provider, PooledHTTPProvider):
+        raw_response = provider.make_post_request(data=data)
+    else:
+        raw_response = make_post_request(
+            provider.endpoint_uri, data, **provider.get_request_kwargs()
+        )
+
+    responses = {response["id"]: response for response in json.loads(raw_response)}
+
+    results = []
+    for request_id, (method, _) in enumerate(requests):
+        response = responses[request_id]
+
+        if "error" in response:
+            error = Exception(f"{method} request failed: {response['error']}")
+
+            if not return_errors:
+                raise error
+
+            results.append(error)
+        else:
+            results.append(response["result"])
+
+    return results
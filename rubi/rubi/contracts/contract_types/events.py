@@ -3,7 +3,6 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, Type, TypeVar, Union
 
 from eth_typing import ChecksumAddress, HexStr
-from eth_utils import add_0x_prefix
 from web3._utils.filters import LogFilter  # noqa
 from web3.contract import Contract
 from web3.types import EventData
@@ -18,6 +17,8 @@ logger = logging.getLogger(__name__)
 class BaseEvent(ABC):
     """Base class for events to define the structure of an Event from a Rubicon contract."""
 
+    __slots__ = ("block_number",)
+
     def __init__(self, block_number: int, **args):
         """Initialize a BaseEvent instance.
 
@@ -61,7 +62,8 @@ class BaseEvent(ABC):
             case "Transfer":
                 return EmitTransfer(**kwargs)
             case _:
-                logger.debug(f"Cannot parse {name} events")
+                # Lazy formatting as this runs for every unrecognised log in a receipt
+                logger.debug("Cannot parse %s events", name)
 
     @staticmethod
     @abstractmethod
@@ -97,6 +99,16 @@ class BaseEvent(ABC):
         """
         raise NotImplementedError()
 
+    @staticmethod
+    @abstractmethod
+    def get_event_name() -> str:
+        """Abstract method to get the name of the event in the contract abi. Must be overridden in each event subclass.
+
+        :return: The name of the event.
+        :rtype: str
+        """
+        raise NotImplementedError()
+
     @classmethod
     def default_handler(
         cls, pair_name: str, event_type: Type["BaseEvent"], event_data: EventData
@@ -139,8 +151,28 @@ class BaseEvent(ABC):
         """
         return True
 
+    # noinspection PyUnusedLocal
+    @classmethod
+    def client_filter_args(cls, args: Dict[str, Any], wallet: ChecksumAddress) -> bool:
+        """Apply the client_filter to the decoded arguments of an event, so events can be discarded without being
+        built. By default, no filtering is done but this should be overwritten together with client_filter.
+
+        :param args: The decoded arguments of the event.
+        :type args: Dict[str, Any]
+        :param wallet: The wallet address.
+        :type wallet: ChecksumAddress
+        :return: True if the event passes the filter, False otherwise.
+        :rtype: bool
+        """
+        return True
+
     def __repr__(self):
-        items = ("{}={!r}".format(k, self.__dict__[k]) for k in self.__dict__)
+        slots = (
+            slot
+            for cls in reversed(type(self).__mro__)
+            for slot in getattr(cls, "__slots__", ())
+        )
+        items = ("{}={!r}".format(k, getattr(self, k)) for k in slots)
         return "{}({})".format(type(self).__name__, ", ".join(items))
 
 
@@ -152,6 +184,8 @@ class BaseEvent(ABC):
 class BaseMarketEvent(BaseEvent, ABC):
     """This class is a base class for all MarketEvents"""
 
+    __slots__ = ("id", "pair")
+
     def __init__(self, id: bytes, pair: bytes, **args):
         """Initialize a BaseMarketEvent instance.
 
@@ -163,8 +197,9 @@ class BaseMarketEvent(BaseEvent, ABC):
         :type args: dict
         """
         super().__init__(**args)
-        self.id = int(id.hex(), 16)
-        self.pair = add_0x_prefix(HexStr(pair.hex()))
+        self.id = int.from_bytes(id, "big")
+        # bytes.hex never adds a 0x prefix, also when the pair is passed as HexBytes
+        self.pair = HexStr("0x" + bytes.hex(pair))
 
     @staticmethod
     def get_event_contract(
@@ -177,6 +212,8 @@ class BaseMarketEvent(BaseEvent, ABC):
 class EmitOfferEvent(BaseMarketEvent):
     """Event emitted whenever a new offer is made on the RubiconMarket"""
 
+    __slots__ = ("maker", "pay_gem", "buy_gem", "pay_amt", "buy_amt")
+
     def __init__(
         self,
         maker: ChecksumAddress,
@@ -217,6 +254,11 @@ class EmitOfferEvent(BaseMarketEvent):
             argument_filters=argument_filters, fromBlock="latest"
         )
 
+    @staticmethod
+    def get_event_name() -> str:
+        """implementation of BaseEvent get_event_name"""
+        return "emitOffer"
+
     @staticmethod
     def default_filters(bid_identifier: str, ask_identifier: str) -> dict:
         """implementation of BaseEvent default_filters"""
@@ -228,6 +270,8 @@ class EmitOfferEvent(BaseMarketEvent):
 class EmitTakeEvent(BaseMarketEvent):
     """Event emitted whenever an offer is taken by a market order on the RubiconMarket"""
 
+    __slots__ = ("maker", "taker", "pay_gem", "buy_gem", "take_amt", "give_amt")
+
     def __init__(
         self,
         maker: ChecksumAddress,
@@ -273,6 +317,11 @@ class EmitTakeEvent(BaseMarketEvent):
             argument_filters=argument_filters, fromBlock="latest"
         )
 
+    @staticmethod
+    def get_event_name() -> str:
+        """implementation of BaseEvent get_event_name"""
+        return "emitTake"
+
     @staticmethod
     def default_filters(bid_identifier: HexStr, ask_identifier: HexStr) -> dict:
         """implementation of BaseEvent default_filters"""
@@ -282,12 +331,21 @@ class EmitTakeEvent(BaseMarketEvent):
 
     def client_filter(self, wallet: ChecksumAddress) -> bool:
         """overwriting of BaseEvent client_filter to only filter when our wallet is either the maker or taker"""
-        return wallet is None or (self.maker == wallet or self.taker == wallet)
+        return self.client_filter_args(
+            args={"maker": self.maker, "taker": self.taker}, wallet=wallet
+        )
+
+    @classmethod
+    def client_filter_args(cls, args: Dict[str, Any], wallet: ChecksumAddress) -> bool:
+        """overwriting of BaseEvent client_filter_args to only filter when our wallet is either the maker or taker"""
+        return wallet is None or (args["maker"] == wallet or args["taker"] == wallet)
 
 
 class EmitCancelEvent(BaseMarketEvent):
     """Event emitted whenever an offer is cancelled on the RubiconMarket"""
 
+    __slots__ = ("maker", "pay_gem", "buy_gem", "pay_amt", "buy_amt")
+
     def __init__(
         self,
         maker: ChecksumAddress,
@@ -329,6 +387,11 @@ class EmitCancelEvent(BaseMarketEvent):
             argument_filters=argument_filters, fromBlock="latest"
         )
 
+    @staticmethod
+    def get_event_name() -> str:
+        """implementation of BaseEvent get_event_name"""
+        return "emitCancel"
+
     @staticmethod
     def default_filters(bid_identifier: str, ask_identifier: str) -> dict:
         """implementation of BaseEvent default_filters"""
@@ -340,6 +403,8 @@ class EmitCancelEvent(BaseMarketEvent):
 class EmitFeeEvent(BaseMarketEvent):
     """Event emitted whenever an offer is taken on the RubiconMarket that results in a fee being paid to the maker."""
 
+    __slots__ = ("taker", "fee_to", "asset", "fee_amt")
+
     def __init__(
         self,
         taker: ChecksumAddress,
@@ -377,6 +442,11 @@ class EmitFeeEvent(BaseMarketEvent):
             argument_filters=argument_filters, fromBlock="latest"
         )
 
+    @staticmethod
+    def get_event_name() -> str:
+        """implementation of BaseEvent get_event_name"""
+        return "emitFee"
+
     @staticmethod
     def default_filters(bid_identifier: str, ask_identifier: str) -> dict:
         """implementation of BaseEvent default_filters"""
@@ -390,6 +460,8 @@ class EmitDeleteEvent(BaseMarketEvent):
     being closed
     """
 
+    __slots__ = ("maker",)
+
     def __init__(self, maker: ChecksumAddress, **args):
         """Initialize an EmitDeleteEvent instance.
 
@@ -411,6 +483,11 @@ class EmitDeleteEvent(BaseMarketEvent):
             argument_filters=argument_filters, fromBlock="latest"
         )
 
+    @staticmethod
+    def get_event_name() -> str:
+        """implementation of BaseEvent get_event_name"""
+        return "emitDelete"
+
     @staticmethod
     def default_filters(bid_identifier: str, ask_identifier: str) -> dict:
         """implementation of BaseEvent default_filters"""
@@ -427,6 +504,16 @@ class EmitDeleteEvent(BaseMarketEvent):
 class EmitSwap(BaseEvent):
     """Event emitted whenever swap is executed on the RubiconRouter"""
 
+    __slots__ = (
+        "recipient",
+        "inputERC20",
+        "targetERC20",
+        "pair",
+        "inputAmount",
+        "realizedFill",
+        "hurdleBuyAmtMin",
+    )
+
     def __init__(
         self,
         recipient: ChecksumAddress,
@@ -483,6 +570,11 @@ class EmitSwap(BaseEvent):
             argument_filters=argument_filters, fromBlock="latest"
         )
 
+    @staticmethod
+    def get_event_name() -> str:
+        """implementation of BaseEvent get_event_name"""
+        return "emitSwap"
+
     @staticmethod
     def default_filters(bid_identifier: str, ask_identifier: str) -> dict:
         """implementation of BaseEvent default_filters"""
@@ -497,6 +589,8 @@ class EmitSwap(BaseEvent):
 
 
 class EmitApproval(BaseEvent):
+    __slots__ = ("address", "guy", "src", "wad")
+
     def __init__(
         self,
         address: ChecksumAddress,
@@ -539,6 +633,11 @@ class EmitApproval(BaseEvent):
         """implementation of BaseEvent create_event_filter"""
         raise Exception("This method doesn't make sense on this class")
 
+    @staticmethod
+    def get_event_name() -> str:
+        """implementation of BaseEvent get_event_name"""
+        return "Approval"
+
     @staticmethod
     def default_filters(bid_identifier: str, ask_identifier: str) -> dict:
         """implementation of BaseEvent default_filters"""
@@ -546,6 +645,8 @@ class EmitApproval(BaseEvent):
 
 
 class EmitTransfer(BaseEvent):
+    __slots__ = ("address", "dst", "src", "wad")
+
     def __init__(
         self,
         address: ChecksumAddress,
@@ -588,6 +689,11 @@ class EmitTransfer(BaseEvent):
         """implementation of BaseEvent create_event_filter"""
         raise Exception("This method doesn't make sense on this class")
 
+    @staticmethod
+    def get_event_name() -> str:
+        """implementation of BaseEvent get_event_name"""
+        return "Transfer"
+
     @staticmethod
     def default_filters(bid_identifier: str, ask_identifier: str) -> dict:
         """implementation of BaseEvent default_filters"""
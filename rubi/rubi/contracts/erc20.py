@@ -1,5 +1,4 @@
-from _decimal import Decimal
-from concurrent.futures import ThreadPoolExecutor
+from _decimal import Decimal, Context
 from typing import Optional
 
 from eth_typing import ChecksumAddress
@@ -9,6 +8,10 @@ from web3.types import TxParams
 
 from rubi.contracts.base_contract import BaseContract
 
+# Enough precision for any uint256 so that scaling a Decimal to its integer representation is exact. The default
+# context only keeps 28 significant digits, which silently rounds large 18 decimal amounts.
+_SCALE_CONTEXT = Context(prec=78)
+
 
 class ERC20(BaseContract):
     """this class represents a contract that implements the ERC20 standard.
@@ -30,16 +33,19 @@ class ERC20(BaseContract):
             contract=contract,
         )
 
-        with ThreadPoolExecutor() as executor:
-            name_future = executor.submit(self.name)
-            symbol_future = executor.submit(self.symbol)
-            decimals_future = executor.submit(self.decimals)
-
-        self.name = name_future.result()
-        self.symbol = symbol_future.result()
-        self.decimals = decimals_future.result()
+        # Read the token metadata in a single round trip to the node
+        self.name, self.symbol, self.decimals = self._batch_call(
+            contract_functions=[
+                self.contract.functions.name(),
+                self.contract.functions.symbol(),
+                self.contract.functions.decimals(),
+            ]
+        )
         self.address = self.contract.address
 
+        # Scaling factor between the integer and Decimal representation of the token
+        self.scale = Decimal(10**self.decimals)
+
     ######################################################################
     # read calls
     ######################################################################
@@ -57,7 +63,7 @@ class ERC20(BaseContract):
         :rtype: int
         """
 
-        return self.contract.functions.allowance(owner, spender).call()
+        return self._call(self.contract.functions.allowance(owner, spender))
 
     # balanceOf(account (address)) -> uint256
     def balance_of(self, account: ChecksumAddress) -> int:
@@ -69,7 +75,7 @@ class ERC20(BaseContract):
         :rtype: int
         """
 
-        return self.contract.functions.balanceOf(account).call()
+        return self._call(self.contract.functions.balanceOf(account))
 
     # totalSupply() -> uint256
     def total_supply(self) -> int:
@@ -79,7 +85,7 @@ class ERC20(BaseContract):
         :rtype: int
         """
 
-        return self.contract.functions.totalSupply().call()
+        return self._call_constant(function_name="totalSupply")
 
     # decimals() -> uint256
     def decimals(self) -> int:
@@ -90,7 +96,7 @@ class ERC20(BaseContract):
         :rtype: int
         """
 
-        return self.contract.functions.decimals().call()
+        return self._call_constant(function_name="decimals")
 
     # name() -> string
     def name(self) -> str:
@@ -100,7 +106,7 @@ class ERC20(BaseContract):
         :rtype: str
         """
 
-        return self.contract.functions.name().call()
+        return self._call_constant(function_name="name")
 
     # symbol() -> string
     def symbol(self) -> str:
@@ -110,7 +116,7 @@ class ERC20(BaseContract):
         :rtype: str
         """
 
-        return self.contract.functions.symbol().call()
+        return self._call_constant(function_name="symbol")
 
     ######################################################################
     # write calls
@@ -268,7 +274,7 @@ class ERC20(BaseContract):
         if number == 0:
             return Decimal("0")
         else:
-            return Decimal(number) / Decimal(10**self.decimals)
+            return Decimal(number) / self.scale
 
     def to_integer(self, number: Decimal) -> int:
         """Converts a Decimal representation of the token to an integer representation of the token by multiplying the
@@ -283,7 +289,8 @@ class ERC20(BaseContract):
         if number == Decimal("0"):
             return 0
         else:
-            return int(number * (10**self.decimals))
+            # Shifting the exponent is exact, unlike multiplying by the scale in the default context
+            return int(Decimal(number).scaleb(self.decimals, _SCALE_CONTEXT))
 
     def max_approval_amount(self) -> Decimal:
         """return the max uint256 token approval amount. Note: this is not very secure and if you give this approval you
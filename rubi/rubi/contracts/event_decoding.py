@@ -0,0 +1,168 @@
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from eth_abi.codec import ABICodec
+from eth_utils import event_abi_to_log_topic, to_bytes, to_checksum_address
+from hexbytes import HexBytes
+from web3._utils.abi import (  # noqa
+    exclude_indexed_event_inputs,
+    get_abi_input_names,
+    get_indexed_event_inputs,
+    normalize_event_input_types,
+)
+from web3._utils.encoding import hexstr_if_str  # noqa
+from web3._utils.events import (  # noqa
+    get_event_abi_types_for_decoding,
+    get_event_data,
+)
+from web3.datastructures import AttributeDict
+from web3.exceptions import MismatchedABI, LogTopicError
+from web3.types import ABIEvent, EventData, LogReceipt
+
+# The same few token and maker addresses are in most events, so each address is only checksummed once
+_to_checksum_address = lru_cache(maxsize=4096)(to_checksum_address)
+
+
+class _EventLayout(NamedTuple):
+    """The parts of an event abi needed to decode its logs, extracted once per event abi."""
+
+    topic: HexBytes
+    topic_types: List[str]
+    topic_names: List[str]
+    data_types: List[str]
+    data_names: List[str]
+
+
+# id(event abi) -> (event abi, layout of the event or None if its logs are decoded by get_event_data). The event abi is
+# kept with its entry so that its id cannot be reused by another event abi.
+_event_layouts: Dict[int, Tuple[ABIEvent, Optional[_EventLayout]]] = {}
+
+
+def decode_event_log(
+    abi_codec: ABICodec, event_abi: ABIEvent, log_entry: LogReceipt
+) -> EventData:
+    """Decode a log of an event into its event data, in the same way as web3's get_event_data. The types and names of
+    the event arguments are extracted from the event abi once, instead of on every log, and the indexed arguments are
+    decoded together. Anonymous events and events with tuple or array arguments are decoded by get_event_data.
+
+    :param abi_codec: The abi codec, e.g. w3.codec.
+    :type abi_codec: ABICodec
+    :param event_abi: The abi of the event.
+    :type event_abi: ABIEvent
+    :param log_entry: The log of the event.
+    :type log_entry: LogReceipt
+    :return: The decoded event data.
+    :rtype: EventData
+    :raises MismatchedABI: If the log is not an event of the event abi.
+    :raises LogTopicError: If the log does not have a topic for every indexed argument of the event.
+    """
+    layout = _get_event_layout(event_abi=event_abi)
+
+    if layout is None:
+        return get_event_data(abi_codec, event_abi, log_entry)
+
+    topics = log_entry["topics"]
+
+    if not topics or topics[0] != layout.topic:
+        raise MismatchedABI("The event signature did not match the provided ABI")
+
+    if len(topics) - 1 != len(layout.topic_types):
+        raise LogTopicError(
+            f"Expected {len(layout.topic_types)} log topics.  Got {len(topics) - 1}"
+        )
+
+    # Every indexed argument is a single word in its topic, so they are decoded as one static tuple. The topics are
+    # HexBytes, which are joined as they are instead of being copied into new bytes first.
+    decoded_topics = abi_codec.decode(layout.topic_types, b"".join(topics[1:]))
+    decoded_data = abi_codec.decode(
+        layout.data_types, hexstr_if_str(to_bytes, log_entry["data"])
+    )
+
+    event_args = dict(
+        zip(
+            layout.topic_names,
+            _checksum_addresses(types=layout.topic_types, values=decoded_topics),
+        )
+    )
+    event_args.update(
+        zip(
+            layout.data_names,
+            _checksum_addresses(types=layout.data_types, values=decoded_data),
+        )
+    )
+
+    event_data = EventData(
+        args=event_args,
+        event=event_abi["name"],
+        logIndex=log_entry["logIndex"],
+        transactionIndex=log_entry["transactionIndex"],
+        transactionHash=log_entry["transactionHash"],
+        address=log_entry["address"],
+        blockHash=log_entry["blockHash"],
+        blockNumber=log_entry["blockNumber"],
+    )
+
+    if isinstance(log_entry, AttributeDict):
+        # The arguments are flat, so this is the same as AttributeDict.recursive
+        event_data["args"] = AttributeDict(event_args)
+        return AttributeDict(event_data)
+
+    return event_data
+
+
+def _get_event_layout(event_abi: ABIEvent) -> Optional[_EventLayout]:
+    """Get the layout of an event abi, extracting it the first time it is needed.
+
+    :param event_abi: The abi of the event.
+    :type event_abi: ABIEvent
+    :return: The layout of the event, or None if its logs are decoded by get_event_data.
+    :rtype: Optional[_EventLayout]
+    """
+    entry = _event_layouts.get(id(event_abi))
+
+    if entry is None or entry[0] is not event_abi:
+        layout = None
+
+        if not event_abi["anonymous"] and not any(
+            "tuple" in event_input["type"] or "[" in event_input["type"]
+            for event_input in event_abi["inputs"]
+        ):
+            topic_inputs = get_indexed_event_inputs(event_abi)
+            data_inputs = exclude_indexed_event_inputs(event_abi)
+
+            layout = _EventLayout(
+                topic=HexBytes(event_abi_to_log_topic(event_abi)),
+                topic_types=list(
+                    get_event_abi_types_for_decoding(
+                        normalize_event_input_types(topic_inputs)
+                    )
+                ),
+                topic_names=get_abi_input_names(ABIEvent({"inputs": topic_inputs})),
+                data_types=list(
+                    get_event_abi_types_for_decoding(
+                        normalize_event_input_types(data_inputs)
+                    )
+                ),
+                data_names=get_abi_input_names(ABIEvent({"inputs": data_inputs})),
+            )
+
+        entry = (event_abi, layout)
+        _event_layouts[id(event_abi)] = entry
+
+    return entry[1]
+
+
+def _checksum_addresses(types: List[str], values: Tuple[Any, ...]) -> List[Any]:
+    """Checksum the decoded address values, as web3 does for decoded event arguments.
+
+    :param types: The abi types of the values.
+    :type types: List[str]
+    :param values: The decoded values.
+    :type values: Tuple[Any, ...]
+    :return: The values with the addresses checksummed.
+    :rtype: List[Any]
+    """
+    return [
+        _to_checksum_address(value) if abi_type == "address" else value
+        for abi_type, value in zip(types, values)
+    ]
@@ -0,0 +1,67 @@
+from typing import Any, Optional, Union
+
+import requests
+from eth_typing import URI
+from requests.adapters import HTTPAdapter
+from web3 import HTTPProvider
+from web3._utils.request import DEFAULT_TIMEOUT  # noqa
+from web3.types import RPCEndpoint, RPCResponse
+
+
+class PooledHTTPProvider(HTTPProvider):
+    """An HTTPProvider that sends all requests through a single session with a shared, keep-alive connection pool.
+    web3's HTTPProvider keeps a session per thread, so every new thread (e.g. of the thread pools used to make requests
+    concurrently) opens, and pays the TCP/TLS handshake for, a new connection to the node.
+
+    :param endpoint_uri: The url of the node.
+    :type endpoint_uri: Union[URI, str]
+    :param request_kwargs: Additional keyword arguments passed to each request (optional, default is None).
+    :type request_kwargs: Optional[Any]
+    :param pool_maxsize: The maximum number of connections kept open to the node (optional, default is 32).
+    :type pool_maxsize: int
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: Union[URI, str],
+        request_kwargs: Optional[Any] = None,
+        pool_maxsize: int = 32,
+    ):
+        """constructor method"""
+        super().__init__(endpoint_uri=endpoint_uri, request_kwargs=request_kwargs)
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Make a JSON-RPC request to the node through the shared session.
+
+        :param method: The JSON-RPC method.
+        :type method: RPCEndpoint
+        :param params: The parameters of the method.
+        :type params: Any
+        :return: The decoded JSON-RPC response.
+        :rtype: RPCResponse
+        """
+        return self.decode_rpc_response(
+            self.make_post_request(data=self.encode_rpc_request(method, params))
+        )
+
+    def make_post_request(self, data: bytes) -> bytes:
+        """Post an encoded request body to the node through the shared session.
+
+        :param data: The encoded request body.
+        :type data: bytes
+        :return: The raw response body.
+        :rtype: bytes
+        """
+        kwargs = self.get_request_kwargs()
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+
+        response = self.session.post(self.endpoint_uri, data=data, **kwargs)
+        response.raise_for_status()
+
+        return response.content
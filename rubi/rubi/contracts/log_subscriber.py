@@ -0,0 +1,217 @@
+import asyncio
+import json
+import logging
+from itertools import count
+from threading import Thread, Lock
+from typing import Callable, Dict, Optional, Tuple, Set, Any
+
+from web3._utils.method_formatters import log_entry_formatter  # noqa
+from web3.types import FilterParams, LogReceipt
+from websockets import connect
+
+logger = logging.getLogger(__name__)
+
+
+class LogSubscriber:
+    """Streams logs from a node over a single websocket connection using eth_subscribe. Instead of each event poller
+    polling its own filter, every subscription is multiplexed over the one connection and the node pushes logs as
+    soon as they are mined.
+
+    The connection is opened by a background thread when the first subscription is made. If the connection drops it
+    is reopened and every subscription is made again, logs mined while disconnected are not delivered.
+
+    Log handlers are run on the subscriber thread, so they should not block. A log handler returns False to
+    unsubscribe.
+
+    :param ws_url: The websocket url of the node.
+    :type ws_url: str
+    :param reconnect_delay: The time in seconds to wait before reconnecting after the connection drops (optional,
+        default is 1).
+    :type reconnect_delay: float
+    """
+
+    def __init__(self, ws_url: str, reconnect_delay: float = 1):
+        """constructor method"""
+        self.ws_url = ws_url
+        self.reconnect_delay = reconnect_delay
+
+        # subscription key -> (filter params, log handler)
+        self._subscriptions: Dict[
+            int, Tuple[FilterParams, Callable[[LogReceipt], bool]]
+        ] = {}
+        self._subscription_keys = count()
+        self._lock = Lock()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # The state of the current connection, only used on the subscriber thread
+        self._websocket: Optional[Any] = None
+        self._request_ids = count(1)
+        self._subscribed: Set[int] = set()
+        self._pending_subscriptions: Dict[int, int] = {}
+        self._subscription_ids: Dict[str, int] = {}
+
+    def subscribe(
+        self, filter_params: FilterParams, log_handler: Callable[[LogReceipt], bool]
+    ) -> None:
+        """Subscribe to the logs matching the filter params. The subscriber thread is started by the first
+        subscription.
+
+        :param filter_params: The address and topics of the logs to subscribe to.
+        :type filter_params: FilterParams
+        :param log_handler: Called with every formatted log of the subscription. Returns False to unsubscribe.
+        :type log_handler: Callable[[LogReceipt], bool]
+        """
+        with self._lock:
+            key = next(self._subscription_keys)
+            self._subscriptions[key] = (filter_params, log_handler)
+
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+
+                Thread(
+                    target=self._loop.run_forever,
+                    daemon=True,
+                    name="rubi-log-subscriber",
+                ).start()
+
+                # Every subscription is made once the connection is open
+                asyncio.run_coroutine_threadsafe(self._run(), self._loop)
+                return
+
+        asyncio.run_coroutine_threadsafe(self._subscribe(key=key), self._loop)
+
+    ######################################################################
+    # helper methods
+    ######################################################################
+
+    async def _run(self) -> None:
+        """Keep a connection to the node open, make every subscription on it and dispatch the messages received."""
+        while True:
+            try:
+                async with connect(self.ws_url) as websocket:
+                    self._websocket = websocket
+
+                    with self._lock:
+                        keys = list(self._subscriptions)
+
+                    for key in keys:
+                        await self._subscribe(key=key)
+
+                    async for message in websocket:
+                        self._handle_message(message=json.loads(message))
+            except Exception as e:
+                logger.error(
+                    f"Log subscription connection to {self.ws_url} failed: {e}"
+                )
+            finally:
+                self._websocket = None
+                self._subscribed.clear()
+                self._pending_subscriptions.clear()
+                self._subscription_ids.clear()
+
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _subscribe(self, key: int) -> None:
+        """Make a subscription on the current connection, unless there is no connection yet or it was already made.
+
+        :param key: The key of the subscription.
+        :type key: int
+        """
+        with self._lock:
+            subscription = self._subscriptions.get(key)
+
+        if subscription is None or self._websocket is None or key in self._subscribed:
+            return
+
+        self._subscribed.add(key)
+
+        request_id = next(self._request_ids)
+        self._pending_subscriptions[request_id] = key
+
+        await self._websocket.send(
+            json.dumps(
+                {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "method": "eth_subscribe",
+                    "params": ["logs", subscription[0]],
+                }
+            )
+        )
+
+    async def _unsubscribe(self, subscription_id: str) -> None:
+        """Cancel a subscription with the node.
+
+        :param subscription_id: The id the node gave the subscription.
+        :type subscription_id: str
+        """
+        if self._websocket is None:
+            return
+
+        await self._websocket.send(
+            json.dumps(
+                {
+                    "jsonrpc": "2.0",
+                    "id": next(self._request_ids),
+                    "method": "eth_unsubscribe",
+                    "params": [subscription_id],
+                }
+            )
+        )
+
+    def _handle_message(self, message: Dict[str, Any]) -> None:
+        """Handle a message from the node, either a subscription notification or the response to a request.
+
+        :param message: The decoded JSON-RPC message.
+        :type message: Dict[str, Any]
+        """
+        if message.get("method") == "eth_subscription":
+            subscription_id = message["params"]["subscription"]
+            key = self._subscription_ids.get(subscription_id)
+
+            # A log of a subscription that has been unsubscribed
+            if key is None:
+                return
+
+            if not self._dispatch(key=key, log=message["params"]["result"]):
+                with self._lock:
+                    del self._subscriptions[key]
+
+                del self._subscription_ids[subscription_id]
+                self._subscribed.discard(key)
+
+                asyncio.ensure_future(self._unsubscribe(subscription_id))
+
+            return
+
+        # Responses to eth_unsubscribe requests are not tracked
+        key = self._pending_subscriptions.pop(message.get("id"), None)
+
+        if key is None:
+            return
+
+        if "error" in message:
+            logger.error(f"Log subscription failed: {message['error']}")
+            return
+
+        self._subscription_ids[message["result"]] = key
+
+    def _dispatch(self, key: int, log: Dict[str, Any]) -> bool:
+        """Pass a log to the log handler of its subscription.
+
+        :param key: The key of the subscription.
+        :type key: int
+        :param log: The raw log from the node.
+        :type log: Dict[str, Any]
+        :return: Whether the subscription should be kept.
+        :rtype: bool
+        """
+        with self._lock:
+            _, log_handler = self._subscriptions[key]
+
+        try:
+            return log_handler(log_entry_formatter(log))
+        except Exception as e:
+            logger.error(f"Log handler failed: {e}")
+            return True
@@ -28,6 +28,11 @@ class RubiconMarket(BaseContract):
             contract=contract,
         )
 
+        # offer is overloaded, so the overload that is used is bound to its abi once
+        self._offer = self.contract.get_function_by_signature(
+            "offer(uint256,address,uint256,address,uint256,bool,address,address)"
+        )
+
     ######################################################################
     # read calls
     ######################################################################
@@ -40,7 +45,7 @@ class RubiconMarket(BaseContract):
         :rtype: int
         """
 
-        return self.contract.functions.makerFee().call()
+        return self._call_constant(function_name="makerFee")
 
     # getOffer(id (uint256)) -> (uint256, address, uint256, address)
     def get_offer(self, id: int) -> Tuple[int, ChecksumAddress, int, ChecksumAddress]:
@@ -53,6 +58,20 @@ class RubiconMarket(BaseContract):
         """
         return self.contract.functions.getOffer(id).call()
 
+    # getOffer(id (uint256)) -> (uint256, address, uint256, address) for each id
+    def get_offers(
+        self, ids: List[int]
+    ) -> List[Tuple[int, ChecksumAddress, int, ChecksumAddress]]:
+        """Returns the offers associated with the provided ids. The offers are queried in a single batch request
+        instead of one request per offer.
+
+        :param ids: the ids of the offers being queried
+        :type ids: List[int]
+        :return: a description of each offer as (pay_amt, pay_gem, buy_amt, buy_gem), in the same order as the ids
+        :rtype: List[Tuple[int, ChecksumAddress, int, ChecksumAddress]]
+        """
+        return self._batch_call([self.contract.functions.getOffer(id) for id in ids])
+
     # getMinSell(pay_gem (address)) -> uint256
     def get_min_sell(self, pay_gem: ChecksumAddress) -> int:
         """Returns the minimum sell amount for an offer
@@ -229,7 +248,7 @@ class RubiconMarket(BaseContract):
         :rtype: Optional[TxParams]
         """
 
-        offer = self.contract.functions.offer(
+        offer = self._offer(
             pay_amt, pay_gem, buy_amt, buy_gem, pos, rounding, wallet, wallet
         )
 
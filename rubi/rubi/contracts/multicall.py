@@ -0,0 +1,70 @@
+from typing import Any, List, Optional
+
+from web3 import Web3
+from web3.contract import Contract
+from web3.contract.contract import ContractFunction
+
+from rubi.contracts.base_contract import BaseContract, encode_call_data
+
+
+class Multicall(BaseContract):
+    """This class represents the Multicall3 contract, which executes several read calls in a single eth_call. Unlike a
+    JSON-RPC batch request, this is a single request to the node and is therefore not affected by the batch limits of
+    rpc providers.
+
+    :param w3: Web3 instance
+    :type w3: Web3
+    :param contract: Contract instance
+    :type contract: Contract
+    """
+
+    def __init__(
+        self,
+        w3: Web3,
+        contract: Contract,
+    ) -> None:
+        """constructor method"""
+        super().__init__(
+            w3=w3,
+            contract=contract,
+        )
+
+    ######################################################################
+    # read calls
+    ######################################################################
+
+    # aggregate3(calls (tuple(address target, bool allowFailure, bytes callData)[]))
+    # -> (tuple(bool success, bytes returnData)[])
+    def aggregate(
+        self, contract_functions: List[ContractFunction]
+    ) -> List[Optional[Any]]:
+        """Call several instantiated contract functions in a single eth_call to the Multicall3 contract. A failing call
+        does not make the other calls fail.
+
+        :param contract_functions: The instantiated contract functions to call. These can be functions of any contract.
+        :type contract_functions: List[ContractFunction]
+        :return: The results of the calls, in the same order as the contract functions. The result of a call that
+            failed is None.
+        :rtype: List[Optional[Any]]
+        """
+        results = self.contract.functions.aggregate3(
+            [
+                (
+                    contract_function.address,
+                    True,
+                    encode_call_data(contract_function=contract_function),
+                )
+                for contract_function in contract_functions
+            ]
+        ).call()
+
+        return [
+            self._decode_call_result(
+                contract_function=contract_function, return_data=return_data
+            )
+            if success
+            else None
+            for contract_function, (success, return_data) in zip(
+                contract_functions, results
+            )
+        ]
@@ -0,0 +1,98 @@
+import logging
+import sched
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread, Event, Lock
+from time import monotonic
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PollScheduler:
+    """Runs recurring poll jobs from a single scheduler thread instead of a dedicated sleeping thread per poller. Jobs
+    are executed on a shared thread pool so that a slow job does not delay any other job. A job returns the delay in
+    seconds until it should run again, or None if it should not run again.
+
+    :param max_workers: The maximum number of jobs that can run concurrently (optional, default is 8).
+    :type max_workers: int
+    """
+
+    def __init__(self, max_workers: int = 8):
+        """constructor method"""
+        self._scheduler = sched.scheduler(monotonic, self._wait)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="rubi-poller"
+        )
+
+        # Set whenever a job is scheduled so that the scheduler thread wakes up if it is waiting on a later job
+        self._wakeup = Event()
+
+        self._lock = Lock()
+        self._thread: Optional[Thread] = None
+
+    def schedule(self, job: Callable[[], Optional[float]], delay: float = 0) -> None:
+        """Schedule a job to run after the delay. The scheduler thread is started when the first job is scheduled.
+
+        :param job: The job to run. It returns the delay in seconds until it should run again or None to stop.
+        :type job: Callable[[], Optional[float]]
+        :param delay: The delay in seconds until the job is run (optional, default is 0).
+        :type delay: float
+        """
+        self._scheduler.enter(delay, 1, self._submit, (job,))
+        self._wakeup.set()
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._run_scheduler, daemon=True)
+                self._thread.start()
+
+    ######################################################################
+    # helper methods
+    ######################################################################
+
+    def _submit(self, job: Callable[[], Optional[float]]) -> None:
+        """Submit a due job to the thread pool.
+
+        :param job: The job to submit.
+        :type job: Callable[[], Optional[float]]
+        """
+        try:
+            self._executor.submit(self._run, job)
+        except RuntimeError:
+            # The thread pool has been shut down as the interpreter is exiting
+            logger.debug(
+                "Poll job %s not submitted as the poll scheduler is shut down", job
+            )
+
+    def _run(self, job: Callable[[], Optional[float]]) -> None:
+        """Run a job on the thread pool and reschedule it if it should run again.
+
+        :param job: The job to run.
+        :type job: Callable[[], Optional[float]]
+        """
+        try:
+            delay = job()
+        except Exception as e:
+            logger.error(f"Poll job {job} failed and will not be rescheduled: {e}")
+            return
+
+        if delay is not None:
+            self.schedule(job=job, delay=delay)
+
+    def _run_scheduler(self) -> None:
+        """The scheduler loop. Submits jobs to the thread pool when they are due and waits when no jobs are
+        scheduled."""
+        while True:
+            self._scheduler.run()
+
+            self._wakeup.wait()
+            self._wakeup.clear()
+
+    def _wait(self, timeout: float) -> None:
+        """Delay function of the scheduler which returns early if a new job is scheduled.
+
+        :param timeout: The time in seconds until the next job is due.
+        :type timeout: float
+        """
+        self._wakeup.wait(timeout)
+        self._wakeup.clear()
@@ -0,0 +1,204 @@
+import logging
+from concurrent.futures import Future, TimeoutError
+from threading import Thread, Lock
+from time import monotonic, sleep
+from typing import Dict, List, Optional, Set
+
+from hexbytes import HexBytes
+from web3 import HTTPProvider
+from web3._utils.method_formatters import receipt_formatter  # noqa
+from web3.exceptions import TimeExhausted
+from web3.types import TxReceipt
+
+from rubi.contracts.batch_request import http_batch_request
+
+logger = logging.getLogger(__name__)
+
+
+class ReceiptWaiter:
+    """Waits for the transaction receipts of every caller with a single poll loop, instead of each waiting caller
+    polling the node on its own. Each poll is one JSON-RPC batch request of the block number and of the pending
+    receipts that have not been requested at the latest block yet, so a receipt is requested once per block however
+    many transactions are pending. The poll thread is started when a receipt is waited for and stops once no receipts
+    are pending.
+
+    :param provider: The HTTPProvider of the Web3 instance.
+    :type provider: HTTPProvider
+    :param poll_latency: The time in seconds between polls (optional, default is 0.5).
+    :type poll_latency: float
+    """
+
+    def __init__(self, provider: HTTPProvider, poll_latency: float = 0.5):
+        """constructor method"""
+        self.provider = provider
+        self.poll_latency = poll_latency
+
+        # transaction hash -> [number of waiting callers, future of the receipt], until the receipt is found
+        self._pending: Dict[HexBytes, List] = {}
+        self._lock = Lock()
+        self._thread: Optional[Thread] = None
+
+    def wait(
+        self, transaction_hashes: List[HexBytes], timeout: float = 120
+    ) -> List[TxReceipt]:
+        """Wait for the receipts of the transactions.
+
+        :param transaction_hashes: The transaction hashes of the transactions.
+        :type transaction_hashes: List[HexBytes]
+        :param timeout: The time in seconds to wait for the receipts (optional, default is 120).
+        :type timeout: float
+        :return: The formatted receipts, in the same order as the transaction hashes.
+        :rtype: List[TxReceipt]
+        :raises TimeExhausted: If not all transactions are mined within the timeout.
+        :raises Exception: If the node cannot be polled for the receipts.
+        """
+        transaction_hashes = [
+            HexBytes(transaction_hash) for transaction_hash in transaction_hashes
+        ]
+        deadline = monotonic() + timeout
+
+        with self._lock:
+            futures: List[Future] = []
+            for transaction_hash in transaction_hashes:
+                waiting = self._pending.get(transaction_hash)
+
+                if waiting is None:
+                    waiting = self._pending[transaction_hash] = [0, Future()]
+
+                waiting[0] += 1
+                futures.append(waiting[1])
+
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run, daemon=True, name="rubi-receipt-waiter"
+                )
+                self._thread.start()
+
+        try:
+            return [
+                future.result(timeout=max(0.0, deadline - monotonic()))
+                for future in futures
+            ]
+        except TimeoutError:
+            pending = sum(not future.done() for future in futures)
+
+            raise TimeExhausted(
+                f"{pending} transactions are not in the chain after {timeout} seconds"
+            )
+        finally:
+            with self._lock:
+                for transaction_hash, future in zip(transaction_hashes, futures):
+                    waiting = self._pending.get(transaction_hash)
+
+                    # The receipt was found, or polling for it failed, and it was already removed
+                    if waiting is None or waiting[1] is not future:
+                        continue
+
+                    waiting[0] -= 1
+
+                    # Nobody is waiting for the receipt anymore
+                    if waiting[0] == 0:
+                        del self._pending[transaction_hash]
+
+    ######################################################################
+    # helper methods
+    ######################################################################
+
+    def _run(self) -> None:
+        """The poll loop. Requests the receipts that have not been requested at the latest block, and then waits for
+        the next poll once every pending receipt has been requested at the latest block.
+        """
+        block_number: Optional[str] = None
+
+        # The pending receipts that were missing when requested at block_number
+        requested: Set[HexBytes] = set()
+
+        while True:
+            with self._lock:
+                pending = {
+                    transaction_hash: waiting[1]
+                    for transaction_hash, waiting in self._pending.items()
+                }
+
+                if not pending:
+                    self._thread = None
+                    return
+
+            # Receipts that were found, or stopped being waited for, are dropped
+            requested &= pending.keys()
+
+            to_request = [
+                transaction_hash
+                for transaction_hash in pending
+                if transaction_hash not in requested
+            ]
+
+            try:
+                # The block number is read before the receipts, so a receipt that is missing is not in any block up
+                # to it
+                raw_block_number, *raw_receipts = http_batch_request(
+                    provider=self.provider,
+                    requests=[("eth_blockNumber", [])]
+                    + [
+                        ("eth_getTransactionReceipt", [transaction_hash.hex()])
+                        for transaction_hash in to_request
+                    ],
+                )
+            except Exception as e:
+                logger.debug("Polling for receipts failed: %s", e)
+
+                # The waiting callers fall back to polling on their own
+                self._resolve(pending=pending, exception=e)
+                continue
+
+            if raw_block_number != block_number:
+                # Receipts requested at an earlier block are requested again
+                block_number = raw_block_number
+                requested = set()
+
+            found = {}
+            for transaction_hash, raw_receipt in zip(to_request, raw_receipts):
+                if raw_receipt is None:
+                    requested.add(transaction_hash)
+                else:
+                    found[transaction_hash] = receipt_formatter(raw_receipt)
+
+            self._resolve(pending=pending, receipts=found)
+
+            # Receipts only change when a new block is mined, so until then only the block number is polled
+            if all(
+                transaction_hash in requested or transaction_hash in found
+                for transaction_hash in pending
+            ):
+                sleep(self.poll_latency)
+
+    def _resolve(
+        self,
+        pending: Dict[HexBytes, Future],
+        receipts: Optional[Dict[HexBytes, TxReceipt]] = None,
+        exception: Optional[Exception] = None,
+    ) -> None:
+        """Stop waiting for receipts, passing the found receipts, or the exception polling failed with, to their
+        waiting callers.
+
+        :param pending: The pending receipts of the poll.
+        :type pending: Dict[HexBytes, Future]
+        :param receipts: The receipts that were found (optional, default is None).
+        :type receipts: Optional[Dict[HexBytes, TxReceipt]]
+        :param exception: The exception polling failed with, passed to every pending receipt (optional, default is
+            None).
+        :type exception: Optional[Exception]
+        """
+        with self._lock:
+            for transaction_hash, future in pending.items():
+                if exception is not None:
+                    future.set_exception(exception)
+                elif transaction_hash in receipts:
+                    future.set_result(receipts[transaction_hash])
+                else:
+                    continue
+
+                waiting = self._pending.get(transaction_hash)
+
+                if waiting is not None and waiting[1] is future:
+                    del self._pending[transaction_hash]
@@ -1,17 +1,174 @@
 import logging
-from typing import List, Union
-
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from operator import itemgetter
+from time import monotonic
+from typing import List, Union, Dict, Optional, Tuple
+
+from eth_account.datastructures import SignedTransaction
+from eth_typing import ChecksumAddress
+from eth_utils import event_abi_to_log_topic
 from hexbytes import HexBytes
-from web3 import Web3
+from requests import RequestException
+from web3 import Web3, HTTPProvider
 from web3.contract import Contract
-from web3.logs import DISCARD
-from web3.types import EventData, TxReceipt, TxParams
+from web3.exceptions import MismatchedABI, LogTopicError, InvalidEventABI, TimeExhausted
+from web3.types import ABIEvent, EventData, LogReceipt, TxReceipt, TxParams
 
+from rubi.contracts.batch_request import http_batch_request
 from rubi.contracts.contract_types import TransactionReceipt, BaseEvent
+from rubi.contracts.event_decoding import decode_event_log
+from rubi.contracts.receipt_waiter import ReceiptWaiter
 
 logger = logging.getLogger(__name__)
 
 
+def _to_hexbytes(value: Union[HexBytes, bytes, str]) -> HexBytes:
+    """Convert a value to HexBytes, reusing it if it already is HexBytes instead of copying it.
+
+    :param value: The value to convert.
+    :type value: Union[HexBytes, bytes, str]
+    :return: The value as HexBytes.
+    :rtype: HexBytes
+    """
+    return value if isinstance(value, HexBytes) else HexBytes(value)
+
+
+def fetch_transaction_params(w3: Web3, wallet: ChecksumAddress) -> Dict[str, int]:
+    """Fetch the nonce and fee parameters for the next transaction of the wallet. For an HTTPProvider these are fetched
+    in a single JSON-RPC batch request, instead of the separate round trips that are made when building a transaction
+    without them. The max fee per gas is max_priority_fee + (2 * base fee per gas of latest block), the same default
+    that is used when building a transaction.
+
+    :param w3: The Web3 instance.
+    :type w3: Web3
+    :param wallet: The wallet address that will send the transaction.
+    :type wallet: ChecksumAddress
+    :return: The nonce, max_fee_per_gas and max_priority_fee_per_gas for the next transaction.
+    :rtype: Dict[str, int]
+    """
+    provider = w3.provider
+
+    if isinstance(provider, HTTPProvider):
+        try:
+            raw_nonce, raw_max_priority_fee, raw_latest_block = http_batch_request(
+                provider=provider,
+                requests=[
+                    ("eth_getTransactionCount", [wallet, "pending"]),
+                    ("eth_maxPriorityFeePerGas", []),
+                    ("eth_getBlockByNumber", ["latest", False]),
+                ],
+            )
+
+            nonce = int(raw_nonce, 16)
+            max_priority_fee = int(raw_max_priority_fee, 16)
+            base_fee = int(raw_latest_block["baseFeePerGas"], 16)
+        except Exception as e:
+            logger.debug(
+                "Batch request failed, falling back to individual requests: %s", e
+            )
+        else:
+            return {
+                "nonce": nonce,
+                "max_fee_per_gas": max_priority_fee + 2 * base_fee,
+                "max_priority_fee_per_gas": max_priority_fee,
+            }
+
+    max_priority_fee = w3.eth.max_priority_fee
+    base_fee = w3.eth.get_block("latest")["baseFeePerGas"]
+
+    return {
+        "nonce": w3.eth.get_transaction_count(wallet, "pending"),
+        "max_fee_per_gas": max_priority_fee + 2 * base_fee,
+        "max_priority_fee_per_gas": max_priority_fee,
+    }
+
+
+def estimate_gas(w3: Web3, transactions: List[TxParams]) -> List[Optional[int]]:
+    """Estimate the gas limit of several transactions. For an HTTPProvider all the estimates are requested in a single
+    JSON-RPC batch request instead of one round trip each. The estimates are made without the nonces of the
+    transactions, so transactions that will be sent back to back can be estimated before the earlier ones are sent.
+
+    :param w3: The Web3 instance.
+    :type w3: Web3
+    :param transactions: The transactions to estimate.
+    :type transactions: List[TxParams]
+    :return: The gas estimate of each transaction, or None if the transaction would fail.
+    :rtype: List[Optional[int]]
+    """
+    calls = [
+        {
+            "from": transaction["from"],
+            "to": transaction["to"],
+            "data": transaction["data"],
+            "value": transaction.get("value", 0),
+        }
+        for transaction in transactions
+    ]
+
+    provider = w3.provider
+
+    if isinstance(provider, HTTPProvider):
+        try:
+            results = http_batch_request(
+                provider=provider,
+                requests=[
+                    ("eth_estimateGas", [{**call, "value": hex(call["value"])}])
+                    for call in calls
+                ],
+                return_errors=True,
+            )
+        except Exception as e:
+            logger.debug(
+                "Batch request failed, falling back to individual requests: %s", e
+            )
+        else:
+            estimates = []
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error estimating gas: {result}")
+                    estimates.append(None)
+                else:
+                    estimates.append(int(result, 16))
+
+            return estimates
+
+    estimates = []
+    for call in calls:
+        try:
+            estimates.append(w3.eth.estimate_gas(call))
+        except Exception as e:
+            logger.error(f"Error estimating gas: {e}")
+            estimates.append(None)
+
+    return estimates
+
+
+class TransactionSendError(Exception):
+    """Raised when some of several transactions could not be submitted to chain. The transactions that were submitted
+    are in flight, so a caller can wait for them and retry only the ones that failed.
+
+    :param message: The error message.
+    :type message: str
+    :param sent_transaction_hashes: The transaction hashes of the transactions that were submitted.
+    :type sent_transaction_hashes: List[HexBytes]
+    :param errors: For each transaction None if it was submitted, otherwise the reason it was not.
+    :type errors: List[Optional[Exception]]
+    """
+
+    def __init__(
+        self,
+        message: str,
+        sent_transaction_hashes: List[HexBytes],
+        errors: List[Optional[Exception]],
+    ):
+        """constructor method"""
+        super().__init__(message)
+
+        self.sent_transaction_hashes = sent_transaction_hashes
+        self.errors = errors
+
+
 class TransactionHandler:
     """
     The transaction handler handles submitting transactions to chain and querying transaction receipts.
@@ -20,11 +177,58 @@ class TransactionHandler:
     :type w3: Web3
     :param contracts: A list of contracts that will be used for decoding the logs on TxReceipts.
     :type contracts: List[Contract]
+    :param transaction_params_cache_time: The time in seconds that the fee parameters returned by
+        get_transaction_params are reused for (optional, default is 2).
+    :type transaction_params_cache_time: float
+    :param receipt_timeout: The time in seconds to wait for a transaction receipt (optional, default is 120).
+    :type receipt_timeout: float
+    :param receipt_poll_latency: The time in seconds between polls for a transaction receipt (optional, default is
+        0.5).
+    :type receipt_poll_latency: float
     """
 
-    def __init__(self, w3: Web3, contracts: List[Contract]):
+    def __init__(
+        self,
+        w3: Web3,
+        contracts: List[Contract],
+        transaction_params_cache_time: float = 2,
+        receipt_timeout: float = 120,
+        receipt_poll_latency: float = 0.5,
+    ):
         self.w3 = w3
-        self.contracts = contracts
+        self.contracts = []
+
+        # Receipts can only appear once per block, so polling much faster than the block time only adds load on the
+        # node. The web3py default poll latency is 0.1 seconds.
+        self.receipt_timeout = receipt_timeout
+        self.receipt_poll_latency = receipt_poll_latency
+
+        # For an HTTPProvider, every transaction sent through this handler waits for its receipt through one shared
+        # poll loop
+        self._receipt_waiter: Optional[ReceiptWaiter] = (
+            ReceiptWaiter(provider=w3.provider, poll_latency=receipt_poll_latency)
+            if isinstance(w3.provider, HTTPProvider)
+            else None
+        )
+
+        # wallet -> (fetched at, transaction params). Fees rarely change more than once per block, so they are reused
+        # for a short time instead of being fetched for every transaction.
+        self.transaction_params_cache_time = transaction_params_cache_time
+        self._transaction_params_cache: Dict[
+            ChecksumAddress, Tuple[float, Dict[str, int]]
+        ] = {}
+
+        # wallet -> the nonce after the highest nonce sent through this handler, as the cached nonce goes stale as soon
+        # as a transaction is sent. It is only used within the cache window, a refetched nonce replaces it.
+        self._next_nonces: Dict[ChecksumAddress, int] = {}
+        self._nonce_lock = Lock()
+
+        # topic0 of each event of the contracts -> (position, event abi), so that each log is decoded with a single
+        # lookup. The position is the order in which the event was added and is used to order the decoded events.
+        self._event_abis_by_topic: Dict[HexBytes, Tuple[int, ABIEvent]] = {}
+
+        for contract in contracts:
+            self.add_contract(contract=contract)
 
     def add_contract(self, contract: Contract):
         """Add a contract to the list of contracts that are used to decode logs on TxReceipts.
@@ -34,6 +238,16 @@ class TransactionHandler:
         """
         self.contracts.append(contract)
 
+        for abi in contract.abi:
+            # Anonymous events (e.g. LogNote) have no topic0 and cannot be matched to a log
+            if abi["type"] != "event" or abi.get("anonymous"):
+                continue
+
+            self._event_abis_by_topic.setdefault(
+                HexBytes(event_abi_to_log_topic(abi)),
+                (len(self._event_abis_by_topic), abi),
+            )
+
     def execute_transaction(
         self,
         transaction: TxParams,
@@ -49,23 +263,170 @@ class TransactionHandler:
         :return: The transaction receipt of the executed transaction.
         :rtype: TransactionReceipt
         """
-        if "pair_names" in transaction:
-            del transaction["pair_names"]
-
-        signed_transaction = self.w3.eth.account.sign_transaction(
-            transaction_dict=transaction, private_key=key
-        )
+        signed_transaction = self._sign_transaction(transaction=transaction, key=key)
 
         try:
-            self.w3.eth.send_raw_transaction(signed_transaction.rawTransaction)
+            self._send_raw_transaction(
+                raw_transaction=signed_transaction.rawTransaction
+            )
         except Exception as e:
             logger.error(f"Error trying to send transaction: {e}")
+
+            # e.g. nonce too low or too high, the next transaction resyncs the nonce with the node
+            self._invalidate_sent_transaction_nonce(transaction=transaction)
+            raise e
+
+        self._record_sent_transaction(transaction=transaction)
+
+        try:
+            return self._wait_for_transaction_receipt(
+                transaction_hash=signed_transaction.hash
+            )
+        except Exception as e:
+            # The transaction may never be mined, so the nonce of the node is used for the next transaction
+            self._invalidate_sent_transaction_nonce(transaction=transaction)
             raise e
 
-        return self._wait_for_transaction_receipt(
-            transaction_hash=signed_transaction.hash
+    def execute_transactions(
+        self,
+        transactions: List[TxParams],
+        key: str,
+    ) -> List[TransactionReceipt]:
+        """Execute several transactions by signing them with the given key and submitting them to chain back to back.
+        For an HTTPProvider all of them are submitted in a single JSON-RPC batch request. The transaction receipts are
+        then waited for concurrently, so the transactions can be mined in the same block instead of each one waiting
+        for the previous one to be mined. The transactions should have sequential nonces.
+
+        :param transactions: The transactions to execute
+        :type transactions: List[TxParams]
+        :param key: The private key to sign the transactions.
+        :type key: str
+        :return: The transaction receipts of the executed transactions, in the same order as the transactions.
+        :rtype: List[TransactionReceipt]
+        :raises TransactionSendError: If any of the transactions could not be submitted. The error has the transaction
+            hashes of the transactions that were submitted.
+        """
+        signed_transactions = [
+            self._sign_transaction(transaction=transaction, key=key)
+            for transaction in transactions
+        ]
+
+        send_errors = self._send_raw_transactions(
+            raw_transactions=[
+                signed_transaction.rawTransaction
+                for signed_transaction in signed_transactions
+            ]
         )
 
+        for transaction, send_error in zip(transactions, send_errors):
+            if send_error is None:
+                self._record_sent_transaction(transaction=transaction)
+
+        transaction_hashes = [
+            signed_transaction.hash for signed_transaction in signed_transactions
+        ]
+
+        failed = [send_error for send_error in send_errors if send_error is not None]
+
+        if failed:
+            sent_transaction_hashes = [
+                transaction_hash
+                for transaction_hash, send_error in zip(transaction_hashes, send_errors)
+                if send_error is None
+            ]
+
+            logger.error(
+                f"Error trying to send transactions: {failed}. Sent transactions: "
+                f"{[transaction_hash.hex() for transaction_hash in sent_transaction_hashes]}"
+            )
+
+            # e.g. nonce too low or too high, the next transaction resyncs the nonce with the node
+            for transaction in transactions:
+                self._invalidate_sent_transaction_nonce(transaction=transaction)
+
+            raise TransactionSendError(
+                message=f"{len(failed)} of {len(transactions)} transactions could not be sent: {failed[0]}",
+                sent_transaction_hashes=sent_transaction_hashes,
+                errors=send_errors,
+            )
+
+        try:
+            return self._wait_for_transaction_receipts(
+                transaction_hashes=transaction_hashes
+            )
+        except Exception as e:
+            # Some of the transactions may never be mined, so the nonce of the node is used for the next transaction
+            for transaction in transactions:
+                self._invalidate_sent_transaction_nonce(transaction=transaction)
+            raise e
+
+    def get_transaction_params(self, wallet: ChecksumAddress) -> Dict[str, int]:
+        """Get the nonce and fee parameters for the next transaction of the wallet. For an HTTPProvider these are
+        fetched in a single JSON-RPC batch request, instead of the separate round trips that are made when building a
+        transaction without them. The max fee per gas is max_priority_fee + (2 * base fee per gas of latest block), the
+        same default that is used when building a transaction.
+
+        The parameters are reused for transaction_params_cache_time seconds. In the meantime the nonce is advanced
+        locally for each transaction of the wallet that is sent through this handler. When the parameters are fetched
+        again the nonce of the node is used.
+
+        :param wallet: The wallet address that will send the transaction.
+        :type wallet: ChecksumAddress
+        :return: The nonce, max_fee_per_gas and max_priority_fee_per_gas for the next transaction.
+        :rtype: Dict[str, int]
+        """
+        cached = self._transaction_params_cache.get(wallet)
+
+        if (
+            cached is None
+            or monotonic() - cached[0] >= self.transaction_params_cache_time
+        ):
+            cached = (monotonic(), self._fetch_transaction_params(wallet=wallet))
+            self._transaction_params_cache[wallet] = cached
+
+            # The pending transaction count of the node is authoritative, so a transaction that was sent but dropped
+            # or replaced does not leave a nonce gap
+            self.invalidate_nonce(wallet=wallet, refetch=False)
+
+        transaction_params = dict(cached[1])
+
+        with self._nonce_lock:
+            transaction_params["nonce"] = max(
+                transaction_params["nonce"], self._next_nonces.get(wallet, 0)
+            )
+
+        return transaction_params
+
+    def invalidate_nonce(self, wallet: ChecksumAddress, refetch: bool = True) -> None:
+        """Forget the locally advanced nonce of the wallet, e.g. after a transaction of the wallet was dropped or
+        replaced outside of this handler.
+
+        :param wallet: The wallet address.
+        :type wallet: ChecksumAddress
+        :param refetch: Whether the cached transaction params of the wallet should be fetched again on the next call to
+            get_transaction_params (optional, default is True).
+        :type refetch: bool
+        """
+        with self._nonce_lock:
+            self._next_nonces.pop(wallet, None)
+
+        if refetch:
+            self._transaction_params_cache.pop(wallet, None)
+
+    def decode_log(self, log: LogReceipt) -> Optional[BaseEvent]:
+        """Decode a log emitted by one of the contracts into its event, e.g. a log received from a log subscription. The
+        event is found with a single lookup on the topic0 of the log, so logs of different events do not need to be
+        routed to separate decoders.
+
+        :param log: The log to decode.
+        :type log: LogReceipt
+        :return: The decoded event, or None if the log is not an event of the contracts or cannot be decoded.
+        :rtype: Optional[BaseEvent]
+        """
+        decoded_log = self._decode_log(log=log)
+
+        return decoded_log[1] if decoded_log else None
+
     def get_transaction_receipt(self, transaction_hash: str) -> TransactionReceipt:
         """Get a transaction receipt for the give transaction_hash.
 
@@ -80,30 +441,225 @@ class TransactionHandler:
     # helper methods
     ######################################################################
 
+    def _record_sent_transaction(self, transaction: TxParams) -> None:
+        """Advance the local nonce of the wallet that sent the transaction.
+
+        :param transaction: The transaction that was sent.
+        :type transaction: TxParams
+        """
+        wallet = transaction.get("from")
+        nonce = transaction.get("nonce")
+
+        if wallet is None or nonce is None:
+            return
+
+        with self._nonce_lock:
+            self._next_nonces[wallet] = max(self._next_nonces.get(wallet, 0), nonce + 1)
+
+    def _sign_transaction(self, transaction: TxParams, key: str) -> SignedTransaction:
+        """Sign a transaction built by one of the contracts. The pair names the client adds to a transaction are not
+        part of the transaction and are removed before signing.
+
+        :param transaction: The transaction to sign.
+        :type transaction: TxParams
+        :param key: The private key to sign the transaction.
+        :type key: str
+        :return: The signed transaction.
+        :rtype: SignedTransaction
+        """
+        if "pair_names" in transaction:
+            del transaction["pair_names"]
+
+        return self.w3.eth.account.sign_transaction(
+            transaction_dict=transaction, private_key=key
+        )
+
+    def _send_raw_transaction(self, raw_transaction: HexBytes) -> None:
+        """Submit a signed transaction. The request is made to the provider directly, as the transaction hash is
+        already known from signing and the response does not need to go through the middlewares of w3.
+
+        :param raw_transaction: The signed raw transaction.
+        :type raw_transaction: HexBytes
+        :raises Exception: If the node returns an error for the transaction.
+        """
+        response = self.w3.provider.make_request(
+            "eth_sendRawTransaction", [raw_transaction.hex()]
+        )
+
+        if "error" in response:
+            raise Exception(
+                f"eth_sendRawTransaction request failed: {response['error']}"
+            )
+
+    def _send_raw_transactions(
+        self, raw_transactions: List[HexBytes]
+    ) -> List[Optional[Exception]]:
+        """Submit signed transactions in order. For an HTTPProvider they are submitted in a single JSON-RPC batch
+        request, otherwise one after the other until one of them fails.
+
+        :param raw_transactions: The signed raw transactions.
+        :type raw_transactions: List[HexBytes]
+        :return: For each transaction None if it was submitted, otherwise the reason it was not.
+        :rtype: List[Optional[Exception]]
+        """
+        provider = self.w3.provider
+
+        if isinstance(provider, HTTPProvider):
+            try:
+                results = http_batch_request(
+                    provider=provider,
+                    requests=[
+                        ("eth_sendRawTransaction", [raw_transaction.hex()])
+                        for raw_transaction in raw_transactions
+                    ],
+                    return_errors=True,
+                )
+            except RequestException as e:
+                # The node may have received some of the transactions, so none of them are sent again
+                return [e] * len(raw_transactions)
+            except Exception as e:
+                logger.debug(
+                    "Batch send failed, falling back to individual requests: %s", e
+                )
+            else:
+                return [
+                    result if isinstance(result, Exception) else None
+                    for result in results
+                ]
+
+        send_errors: List[Optional[Exception]] = []
+        for raw_transaction in raw_transactions:
+            try:
+                self._send_raw_transaction(raw_transaction=raw_transaction)
+            except Exception as e:
+                # The later transactions would have a nonce gap, so they are not sent
+                send_errors.append(e)
+                break
+
+            send_errors.append(None)
+
+        failed = Exception("not sent as a previous transaction failed to send")
+
+        return send_errors + [failed] * (len(raw_transactions) - len(send_errors))
+
+    def _invalidate_sent_transaction_nonce(self, transaction: TxParams) -> None:
+        """Forget the locally advanced nonce of the wallet that sent the transaction.
+
+        :param transaction: The transaction that was sent.
+        :type transaction: TxParams
+        """
+        wallet = transaction.get("from")
+
+        if wallet is not None:
+            self.invalidate_nonce(wallet=wallet)
+
+    def _fetch_transaction_params(self, wallet: ChecksumAddress) -> Dict[str, int]:
+        """Fetch the nonce and fee parameters for the next transaction of the wallet. For an HTTPProvider these are
+        fetched in a single JSON-RPC batch request.
+
+        :param wallet: The wallet address that will send the transaction.
+        :type wallet: ChecksumAddress
+        :return: The nonce, max_fee_per_gas and max_priority_fee_per_gas for the next transaction.
+        :rtype: Dict[str, int]
+        """
+        return fetch_transaction_params(w3=self.w3, wallet=wallet)
+
     def _wait_for_transaction_receipt(
         self,
         transaction_hash: str,
     ) -> TransactionReceipt:
-        """Get the transaction receipt for the given transaction hash.
+        """Get the transaction receipt for the given transaction hash. For an HTTPProvider the receipt is polled for by
+        the shared receipt waiter.
 
         :param transaction_hash: The transaction hash of the transaction.
         :type transaction_hash: str
         :return: The transaction receipt of the given transaction hash
         :rtype: TransactionReceipt
         """
+        if self._receipt_waiter is not None:
+            return self._wait_for_transaction_receipts(
+                transaction_hashes=[_to_hexbytes(transaction_hash)]
+            )[0]
+
+        return self._poll_for_transaction_receipt(transaction_hash=transaction_hash)
+
+    def _poll_for_transaction_receipt(
+        self,
+        transaction_hash: Union[HexBytes, str],
+    ) -> TransactionReceipt:
+        """Poll the node for the transaction receipt for the given transaction hash on its own.
 
+        :param transaction_hash: The transaction hash of the transaction.
+        :type transaction_hash: Union[HexBytes, str]
+        :return: The transaction receipt of the given transaction hash
+        :rtype: TransactionReceipt
+        """
         tx_receipt = self.w3.eth.wait_for_transaction_receipt(
-            HexBytes(transaction_hash)
+            _to_hexbytes(transaction_hash),
+            timeout=self.receipt_timeout,
+            poll_latency=self.receipt_poll_latency,
         )
 
+        return self._to_transaction_receipt(tx_receipt=tx_receipt)
+
+    def _wait_for_transaction_receipts(
+        self,
+        transaction_hashes: List[HexBytes],
+    ) -> List[TransactionReceipt]:
+        """Get the transaction receipts for the given transaction hashes. For an HTTPProvider the receipts are polled
+        for by the shared receipt waiter, which polls for every pending receipt of the handler with a single JSON-RPC
+        batch request per poll instead of every transaction polling the node on its own. Otherwise, the receipts are
+        waited for concurrently.
+
+        :param transaction_hashes: The transaction hashes of the transactions.
+        :type transaction_hashes: List[HexBytes]
+        :return: The transaction receipts, in the same order as the transaction hashes.
+        :rtype: List[TransactionReceipt]
+        :raises TimeExhausted: If not all transactions are mined within the timeout.
+        """
+        if self._receipt_waiter is not None:
+            try:
+                tx_receipts = self._receipt_waiter.wait(
+                    transaction_hashes=transaction_hashes,
+                    timeout=self.receipt_timeout,
+                )
+            except TimeExhausted as e:
+                raise e
+            except Exception as e:
+                logger.debug(
+                    "Batch receipt polling failed, falling back to individual requests: %s",
+                    e,
+                )
+            else:
+                return [
+                    self._to_transaction_receipt(tx_receipt=tx_receipt)
+                    for tx_receipt in tx_receipts
+                ]
+
+        with ThreadPoolExecutor() as executor:
+            return list(
+                executor.map(
+                    lambda transaction_hash: self._poll_for_transaction_receipt(
+                        transaction_hash=transaction_hash
+                    ),
+                    transaction_hashes,
+                )
+            )
+
+    def _to_transaction_receipt(self, tx_receipt: TxReceipt) -> TransactionReceipt:
+        """Build a TransactionReceipt from the receipt received from the node by decoding its logs into events.
+
+        :param tx_receipt: The transaction receipt received from the node.
+        :type tx_receipt: TxReceipt
+        :return: The transaction receipt with its decoded events.
+        :rtype: TransactionReceipt
+        """
         raw_events = self._process_receipt_logs_into_raw_events(receipt=tx_receipt)
 
-        result = TransactionReceipt.from_tx_receipt(
+        return TransactionReceipt.from_tx_receipt(
             tx_receipt=tx_receipt, raw_events=raw_events
         )
 
-        return result
-
     def _process_receipt_logs_into_raw_events(
         self, receipt: TxReceipt
     ) -> List[Union[BaseEvent, EventData]]:
@@ -117,32 +673,44 @@ class TransactionHandler:
         """
 
         raw_events = []
-        for contract in self.contracts:
-            event_names = list(
-                map(lambda event: event.event_name, contract.events)  # noqa
-            )
+        for log in receipt["logs"]:
+            decoded_log = self._decode_log(log=log)
 
-            if len(event_names) == 0:
-                continue
+            if decoded_log:
+                raw_events.append(decoded_log)
 
-            for event_name in event_names:
-                # TODO: Figure out why this breaks things for some reason
-                if event_name == "LogNote":
-                    continue
+        # Events are grouped by contract and event in the order they were added, as consumers rely on this order
+        return [event for _, event in sorted(raw_events, key=itemgetter(0))]
 
-                transaction_events_data = contract.events[event_name]().process_receipt(
-                    receipt, DISCARD
-                )
+    def _decode_log(self, log: LogReceipt) -> Optional[Tuple[int, BaseEvent]]:
+        """Decode a log into its event by looking up the event abi on the topic0 of the log.
+
+        :param log: The log to decode.
+        :type log: LogReceipt
+        :return: The position of the event abi and the decoded event, or None if the log is not an event of the
+            contracts or cannot be decoded.
+        :rtype: Optional[Tuple[int, BaseEvent]]
+        """
+        if not log["topics"]:
+            return None
+
+        position, event_abi = self._event_abis_by_topic.get(
+            log["topics"][0], (None, None)
+        )
 
-                for event_data in transaction_events_data:
-                    event = BaseEvent.from_raw(
-                        name=event_name,
-                        address=event_data["address"],
-                        block_number=event_data["blockNumber"],
-                        **event_data["args"],
-                    )
+        if event_abi is None:
+            return None
 
-                    if event:
-                        raw_events.append(event)
+        try:
+            event_data = decode_event_log(self.w3.codec, event_abi, log)
+        except (MismatchedABI, LogTopicError, InvalidEventABI, TypeError):
+            return None
+
+        event = BaseEvent.from_raw(
+            name=event_data["event"],
+            address=event_data["address"],
+            block_number=event_data["blockNumber"],
+            **event_data["args"],
+        )
 
-        return raw_events
+        return (position, event) if event else None
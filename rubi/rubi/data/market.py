@@ -1,6 +1,7 @@
 import logging
 from _decimal import Decimal
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, List, Union
 
 import pandas as pd
@@ -19,6 +20,10 @@ logger = logging.getLogger(__name__)
 # Stop subgrounds from logging kak
 logging.getLogger("subgrounds").setLevel(logging.WARNING)
 
+# The subgraph returns lowercase addresses and the same few token and maker addresses repeat on every row, so each
+# address is only checksummed once
+_to_checksum_address = lru_cache(maxsize=4096)(Web3.to_checksum_address)
+
 
 class MarketData:
     """This class represents the RubiconV2 Subgraph, which contains data primarily related to the RubiconMarket.sol
@@ -125,22 +130,26 @@ class MarketData:
     ) -> Optional[Decimal]:
         """Helper to convert an amount to decimals for the given ERC20"""
 
-        if self.tokens.get(Web3.to_checksum_address(gem)) is None:
+        gem = _to_checksum_address(gem)
+
+        if self.tokens.get(gem) is None:
             self.network.token_from_address(gem)
 
         try:
-            return self.tokens[Web3.to_checksum_address(gem)].to_decimal(amt)
+            return self.tokens[gem].to_decimal(amt)
         except KeyError:
             return None
 
     def _erc20_to_symbol(self, gem: Union[ChecksumAddress, str]) -> Optional[str]:
         """Helper to get the symbol of the given ERC20"""
 
-        if self.tokens.get(Web3.to_checksum_address(gem)) is None:
+        gem = _to_checksum_address(gem)
+
+        if self.tokens.get(gem) is None:
             self.network.token_from_address(gem)
 
         try:
-            return self.tokens[Web3.to_checksum_address(gem)].symbol
+            return self.tokens[gem].symbol
         except KeyError:
             return None
 
@@ -547,11 +556,11 @@ class MarketData:
                 offers.append(
                     SubgraphOffer(
                         order_id=int(raw_offer["id"], 16),
-                        order_owner=Web3.to_checksum_address(raw_offer["maker"]["id"]),
-                        pay_gem=Web3.to_checksum_address(raw_offer["pay_gem"]),
+                        order_owner=_to_checksum_address(raw_offer["maker"]["id"]),
+                        pay_gem=_to_checksum_address(raw_offer["pay_gem"]),
                         pay_amt=raw_offer["pay_amt"],
                         paid_amt=raw_offer["paid_amt"],
-                        buy_gem=Web3.to_checksum_address(raw_offer["buy_gem"]),
+                        buy_gem=_to_checksum_address(raw_offer["buy_gem"]),
                         buy_amt=raw_offer["buy_amt"],
                         bought_amt=raw_offer["bought_amt"],
                         open=raw_offer["open"],
@@ -2,13 +2,23 @@ import os
 import logging
 from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Optional, Dict, Union
+from typing import Optional, Dict, Union, List, Any
 
 import yaml
 from eth_typing import ChecksumAddress
 from web3 import Web3
-
-from rubi.contracts import ERC20, RubiconMarket, RubiconRouter, TransactionHandler
+from web3.contract.contract import ContractFunction
+
+from rubi.contracts import (
+    ERC20,
+    Multicall,
+    LogSubscriber,
+    PooledHTTPProvider,
+    RubiconMarket,
+    RubiconRouter,
+    TransactionHandler,
+)
+from rubi.contracts.base_contract import get_chain_id
 
 # from rubi.data import MarketData
 
@@ -45,8 +55,10 @@ class Network:
         market_data_fallback_url: str,
         rubicon: Dict,
         token_addresses: Dict,
+        multicall: Optional[str] = None,
         # optional custom token config file from the user
         custom_token_addresses_file: Optional[str] = None,
+        log_subscriber: Optional[LogSubscriber] = None,
     ):
         """Initializes a Network instance.
 
@@ -67,10 +79,15 @@ class Network:
         :type rubicon: dict
         :param token_addresses: Dictionary containing token addresses on the network.
         :type token_addresses: dict
+        :param multicall: The address of the Multicall3 contract on the network (optional, default is None).
+        :type multicall: Optional[str]
         :param custom_token_addresses_file: The name of a yaml file (relative to the current working directory) with
             custom token addresses. Overwrites the token config found in network_config/{chain}/network.yaml.
             (optional, default is None).
         :type custom_token_addresses_file: Optional[str]
+        :param log_subscriber: The log subscriber events are received from instead of being polled for (optional,
+            default is None).
+        :type log_subscriber: Optional[LogSubscriber]
         """
         # General config
         self.name = name
@@ -79,6 +96,7 @@ class Network:
         self.currency = currency
         self.rpc_url = rpc_url
         self.explorer_url = explorer_url
+        self.log_subscriber = log_subscriber
 
         # Rubicon contracts
         self.rubicon_market = RubiconMarket.from_address(
@@ -87,6 +105,9 @@ class Network:
         self.rubicon_router = RubiconRouter.from_address(
             w3=self.w3, address=rubicon["router"]
         )
+        self.multicall: Optional[Multicall] = (
+            Multicall.from_address(w3=self.w3, address=multicall) if multicall else None
+        )
 
         # Tokens
         custom_token_addresses = self._custom_token_addresses(
@@ -122,6 +143,13 @@ class Network:
             ],
         )
 
+        for contract in [
+            self.rubicon_market,
+            self.rubicon_router,
+            *self.tokens.values(),
+        ]:
+            contract.transaction_handler = self.transaction_handler
+
         # Subgraph urls
         # TODO: currently we are utilizing just a single url, we should switch to a dictionary as the number of
         #  subgraphs we support grows
@@ -133,6 +161,9 @@ class Network:
         cls,
         http_node_url: str,
         custom_token_addresses_file: Optional[str] = None,
+        request_kwargs: Optional[Dict[str, Any]] = None,
+        pool_maxsize: int = 32,
+        ws_node_url: Optional[str] = None,
     ) -> "Network":
         """Create a Network instance based on the node url provided. A call is then made to this node to get the
         chain_id which links to network_config/{network_name}/ using the NetworkId Enum.
@@ -143,30 +174,69 @@ class Network:
             custom token addresses. Overwrites the token config found in network_config/{chain}/network.yaml.
             (optional, default is None).
         :type custom_token_addresses_file: Optional[str]
+        :param request_kwargs: Additional keyword arguments passed to each request to the node, e.g. a timeout
+            (optional, default is None).
+        :type request_kwargs: Optional[Dict[str, Any]]
+        :param pool_maxsize: The maximum number of keep-alive connections kept open to the node (optional, default is
+            32).
+        :type pool_maxsize: int
+        :param ws_node_url: The websocket URL of the node. If set, events are pushed by the node over a websocket
+            connection instead of being polled for (optional, default is None).
+        :type ws_node_url: Optional[str]
         :return: A Network instance based on the network configuration.
         :rtype: Network
         :raises Exception: If no network configuration file is found for the specified network name.
         """
-        w3 = Web3(Web3.HTTPProvider(http_node_url))
+        w3 = Web3(
+            PooledHTTPProvider(
+                endpoint_uri=http_node_url,
+                request_kwargs=request_kwargs,
+                pool_maxsize=pool_maxsize,
+            )
+        )
 
-        network_name = NetworkId(w3.eth.chain_id).name.lower()
+        network_name = NetworkId(get_chain_id(w3=w3)).name.lower()
 
         try:
             path = f"{os.path.dirname(os.path.abspath(__file__))}/../../network_config/{network_name}"
 
             with open(f"{path}/network.yaml") as f:
                 network_data = yaml.safe_load(f)
-                return cls(
-                    w3=w3,
-                    custom_token_addresses_file=custom_token_addresses_file,
-                    **network_data,
-                )
         except FileNotFoundError:
             raise Exception(
                 f"No network config found for {network_name}. There should be a corresponding folder in "
                 f"the network_config directory."
             )
 
+        return cls(
+            w3=w3,
+            custom_token_addresses_file=custom_token_addresses_file,
+            log_subscriber=LogSubscriber(ws_url=ws_node_url) if ws_node_url else None,
+            **network_data,
+        )
+
+    def batch_call(self, contract_functions: List[ContractFunction]) -> List[Any]:
+        """Call several instantiated contract functions, of any of the contracts on the network, in a single request to
+        the node. If the network has a Multicall3 contract the calls are aggregated into one eth_call, otherwise they are
+        sent as a single JSON-RPC batch request.
+
+        :param contract_functions: The instantiated contract functions to call.
+        :type contract_functions: List[ContractFunction]
+        :return: The results of the calls, in the same order as the contract functions. With Multicall3 the result of a
+            call that failed is None.
+        :rtype: List[Any]
+        """
+        if self.multicall is not None:
+            try:
+                return self.multicall.aggregate(contract_functions=contract_functions)
+            except Exception as e:
+                logger.debug("Multicall failed, falling back to a batch call: %s", e)
+
+        # The batch call is not specific to the contract it is made on
+        return self.rubicon_market._batch_call(  # noqa
+            contract_functions=contract_functions
+        )
+
     @staticmethod
     def _custom_token_addresses(custom_token_addresses_file: str) -> Dict[str, str]:
         if not custom_token_addresses_file:
@@ -218,5 +288,6 @@ class Network:
             logger.error(f"Could not find token with address {address}")
             return
 
+        erc20.transaction_handler = self.transaction_handler
         self.tokens[erc20.symbol] = erc20
         self.tokens[erc20.address] = erc20
@@ -1,6 +1,7 @@
 import logging
+import multiprocessing.queues
+import queue
 from _decimal import Decimal
-from multiprocessing import Queue
 from typing import Optional, Dict, List, Any, Type, Union
 
 from eth_typing import ChecksumAddress
@@ -16,8 +17,6 @@ from rubi import (
     EmitDeleteEvent,
     TransactionReceipt,
     BaseEvent,
-    EmitFeeEvent,
-    FeeEvent,
     EmitCancelEvent,
     EmitOfferEvent,
 )
@@ -32,8 +31,10 @@ class OrderTrackingClient(Client):
     :type network: Network
     :param pair_names: The list of pair names that the client is going to track.
     :type pair_names: List[str]
-    :param message_queue: Optional message queue for processing events (optional, default is None).
-    :type message_queue: Optional[Queue]
+    :param message_queue: Optional message queue for processing events (optional, default is None). Use a
+        queue.Queue when the messages are consumed in the same process, as a multiprocessing.Queue pickles every
+        message to pass it through a pipe. Only use a multiprocessing.Queue to consume messages in another process.
+    :type message_queue: Optional[queue.Queue | multiprocessing.Queue]
     :param wallet: Wallet address (optional, default is None).
     :type wallet: Optional[ChecksumAddress]
     :param key: Key for the wallet (optional, default is None).
@@ -44,7 +45,7 @@ class OrderTrackingClient(Client):
         self,
         network: Network,
         pair_names: List[str],
-        message_queue: Optional[Queue] = None,
+        message_queue: Optional[queue.Queue | multiprocessing.queues.Queue] = None,
         wallet: Optional[Union[ChecksumAddress, str]] = None,
         key: Optional[str] = None,
     ):
@@ -69,10 +70,13 @@ class OrderTrackingClient(Client):
         cls,
         http_node_url: str,
         pair_names: List[str] = None,
-        message_queue: Optional[Queue] = None,
+        message_queue: Optional[queue.Queue | multiprocessing.queues.Queue] = None,
         wallet: Optional[Union[ChecksumAddress, str]] = None,
         key: Optional[str] = None,
         custom_token_addresses_file: Optional[str] = None,
+        request_kwargs: Optional[Dict[str, Any]] = None,
+        pool_maxsize: int = 32,
+        ws_node_url: Optional[str] = None,
         **kwargs,
     ):
         """Initialize a Client using a http_node_url.
@@ -81,8 +85,9 @@ class OrderTrackingClient(Client):
         :type http_node_url: str
         :param pair_names: The list of pair names that the client is going to track.
         :type pair_names: List[str]
-        :param message_queue: Optional message queue for processing events (optional, default is None).
-        :type message_queue: Optional[Queue]
+        :param message_queue: Optional message queue for processing events (optional, default is None). Use a
+            queue.Queue unless the messages are consumed in another process.
+        :type message_queue: Optional[queue.Queue | multiprocessing.Queue]
         :param wallet: Wallet address (optional, default is None).
         :type wallet: Optional[Union[ChecksumAddress, str]]
         :param key: Key for the wallet (optional, default is None).
@@ -91,6 +96,15 @@ class OrderTrackingClient(Client):
             custom token addresses. Overwrites the token config found in network_config/{chain}/network.yaml.
             (optional, default is None).
         :type custom_token_addresses_file: Optional[str]
+        :param request_kwargs: Additional keyword arguments passed to each request to the node, e.g. a timeout
+            (optional, default is None).
+        :type request_kwargs: Optional[Dict[str, Any]]
+        :param pool_maxsize: The maximum number of keep-alive connections kept open to the node (optional, default is
+            32).
+        :type pool_maxsize: int
+        :param ws_node_url: The websocket URL of the node. If set, events are pushed by the node over a websocket
+            connection instead of being polled for (optional, default is None).
+        :type ws_node_url: Optional[str]
         """
         if pair_names is None:
             raise Exception(
@@ -100,6 +114,9 @@ class OrderTrackingClient(Client):
         network = Network.from_http_node_url(
             http_node_url=http_node_url,
             custom_token_addresses_file=custom_token_addresses_file,
+            request_kwargs=request_kwargs,
+            pool_maxsize=pool_maxsize,
+            ws_node_url=ws_node_url,
         )
 
         return cls(
@@ -124,15 +141,11 @@ class OrderTrackingClient(Client):
         :return:
         """
 
+        # The pair names are removed from the transaction when it is signed
         pair_names = transaction["pair_names"] if "pair_names" in transaction else None
 
-        transaction_receipt = self.network.transaction_handler.execute_transaction(
-            transaction=transaction, key=self._key
-        )
-
-        processed_transaction_receipt = self._handle_transaction_receipt_raw_events(
-            transaction_receipt=transaction_receipt,
-            pair_names=pair_names,
+        processed_transaction_receipt = super().execute_transaction(
+            transaction=transaction
         )
 
         if pair_names:
@@ -142,6 +155,33 @@ class OrderTrackingClient(Client):
 
         return processed_transaction_receipt
 
+    def execute_transactions(
+        self, transactions: List[TxParams]
+    ) -> List[TransactionReceipt]:
+        """Execute the passed transactions.
+
+        :param transactions: The transactions to execute.
+        :type transactions: List[TxParams]
+        :return: The TransactionReceipts of the executed transactions, in the same order as the transactions.
+        :rtype: List[TransactionReceipt]
+        """
+        # The pair names are removed from the transactions when they are signed
+        pair_names = [transaction.get("pair_names") for transaction in transactions]
+
+        processed_transaction_receipts = super().execute_transactions(
+            transactions=transactions
+        )
+
+        for processed_transaction_receipt, transaction_pair_names in zip(
+            processed_transaction_receipts, pair_names
+        ):
+            if transaction_pair_names:
+                self._update_active_limit_orders(
+                    events=processed_transaction_receipt.events
+                )
+
+        return processed_transaction_receipts
+
     ######################################################################
     # order tracking methods
     ######################################################################
@@ -159,30 +199,16 @@ class OrderTrackingClient(Client):
         :param event_data: Data of the retrieved event.
         :type event_data: EventData
         """
-        raw_event = event_type(
-            block_number=event_data["blockNumber"], **event_data["args"]
+        event = self._build_event(
+            pair_name=pair_name, event_type=event_type, event_data=event_data
         )
 
-        if raw_event.client_filter(wallet=self.wallet):
-            if isinstance(raw_event, EmitFeeEvent):
-                asset = self.network.tokens[raw_event.asset]
-
-                event = FeeEvent.from_event(
-                    pair_name=pair_name, asset=asset, event=raw_event
-                )
-            else:
-                base_asset, quote_asset = pair_name.split("/")
-
-                event = OrderEvent.from_event(
-                    base_asset=self.network.tokens[base_asset],
-                    quote_asset=self.network.tokens[quote_asset],
-                    event=raw_event,
-                    wallet=self.wallet,
-                )
+        if event is None:
+            return
 
-                self._update_active_limit_orders(events=[event])
+        self._update_active_limit_orders(events=[event])
 
-            self.message_queue.put(event)
+        self.message_queue.put(event)
 
     def _update_active_limit_orders(self, events: List[Any]) -> None:
         """Update active limit order based on incoming events"""
@@ -223,7 +249,7 @@ class OrderTrackingClient(Client):
             del self.open_limit_orders[order_id]
         except KeyError:
             logger.debug(
-                f"Limit order {order_id} already removed from active limit orders."
+                "Limit order %s already removed from active limit orders.", order_id
             )
 
     def _register_listeners(self, pair_names: List[str]) -> None:
@@ -234,26 +260,20 @@ class OrderTrackingClient(Client):
             if pair_name not in self.pairs_with_registered_event_listeners
         ]
 
+        if not new_pair_names:
+            return
+
         self.pairs_with_registered_event_listeners.extend(new_pair_names)
 
-        for pair_name in new_pair_names:
-            self.start_event_poller(
-                pair_name=pair_name,
-                event_type=EmitOfferEvent,
-                filters={"maker": self.wallet},
-            )
-            self.start_event_poller(
-                pair_name=pair_name,
-                event_type=EmitTakeEvent,
-                filters={"maker": self.wallet},
-            )
-            self.start_event_poller(
-                pair_name=pair_name,
-                event_type=EmitCancelEvent,
-                filters={"maker": self.wallet},
-            )
-            self.start_event_poller(
-                pair_name=pair_name,
-                event_type=EmitDeleteEvent,
+        # One poller per event type for all the new pairs, rather than one per event type and pair
+        for event_type in [
+            EmitOfferEvent,
+            EmitTakeEvent,
+            EmitCancelEvent,
+            EmitDeleteEvent,
+        ]:
+            self.start_event_multiplex_poller(
+                pair_names=new_pair_names,
+                event_type=event_type,
                 filters={"maker": self.wallet},
             )
@@ -15,6 +15,8 @@ class Approval:
     :type: spender: Optional[ChecksumAddress]
     """
 
+    __slots__ = ("token", "amount", "spender")
+
     def __init__(self, token: str, amount: Decimal, spender: Optional[ChecksumAddress]):
         """constructor method."""
         self.token = token
@@ -22,13 +24,20 @@ class Approval:
         self.spender = spender
 
     def __repr__(self):
-        items = ("{}={!r}".format(k, self.__dict__[k]) for k in self.__dict__)
+        slots = (
+            slot
+            for cls in reversed(type(self).__mro__)
+            for slot in getattr(cls, "__slots__", ())
+        )
+        items = ("{}={!r}".format(k, getattr(self, k)) for k in slots)
         return "{}({})".format(type(self).__name__, ", ".join(items))
 
 
 class RubiconMarketApproval(Approval):
     """A subclass for a RubiconMarket approval"""
 
+    __slots__ = ()
+
     def __init__(self, token: str, amount: Decimal):
         """constructor method."""
         super().__init__(token=token, amount=amount, spender=None)
@@ -37,6 +46,8 @@ class RubiconMarketApproval(Approval):
 class RubiconRouterApproval(Approval):
     """A subclass for a RubiconRouter approval"""
 
+    __slots__ = ()
+
     def __init__(self, token: str, amount: Decimal):
         """constructor method."""
         super().__init__(token=token, amount=amount, spender=None)
@@ -45,6 +56,8 @@ class RubiconRouterApproval(Approval):
 class ApprovalEvent(Approval):
     """A Subclass for approval events."""
 
+    __slots__ = ("source",)
+
     def __init__(
         self,
         token: str,
@@ -69,6 +82,8 @@ class Transfer:
     :type: recipient: ChecksumAddress
     """
 
+    __slots__ = ("token", "amount", "recipient")
+
     def __init__(self, token: str, amount: Decimal, recipient: ChecksumAddress):
         """constructor method."""
         self.token = token
@@ -76,13 +91,20 @@ class Transfer:
         self.recipient = recipient
 
     def __repr__(self):
-        items = ("{}={!r}".format(k, self.__dict__[k]) for k in self.__dict__)
+        slots = (
+            slot
+            for cls in reversed(type(self).__mro__)
+            for slot in getattr(cls, "__slots__", ())
+        )
+        items = ("{}={!r}".format(k, getattr(self, k)) for k in slots)
         return "{}({})".format(type(self).__name__, ", ".join(items))
 
 
 class TransferEvent(Transfer):
     """A Subclass for transfer events."""
 
+    __slots__ = ("source",)
+
     def __init__(
         self,
         token: str,
@@ -14,13 +14,15 @@ class BookLevel:
     :type size: Decimal
     """
 
+    __slots__ = ("price", "size")
+
     def __init__(self, price: Decimal, size: Decimal):
         """constructor method."""
         self.price = price
         self.size = size
 
     def __repr__(self):
-        items = ("{}={!r}".format(k, self.__dict__[k]) for k in self.__dict__)
+        items = ("{}={!r}".format(k, getattr(self, k)) for k in self.__slots__)
         return "{}({})".format(type(self).__name__, ", ".join(items))
 
 
@@ -33,6 +35,8 @@ class BookSide:
     :type levels: List[BookLevel]
     """
 
+    __slots__ = ("book_side", "levels")
+
     def __init__(self, book_side: OrderSide, levels: List[BookLevel]):
         """constructor method."""
         self.book_side = book_side
@@ -101,7 +105,7 @@ class BookSide:
         return cls(book_side=book_side, levels=levels)
 
     def __repr__(self):
-        items = ("{}={!r}".format(k, self.__dict__[k]) for k in self.__dict__)
+        items = ("{}={!r}".format(k, getattr(self, k)) for k in self.__slots__)
         return "{}({})".format(type(self).__name__, ", ".join(items))
 
 
@@ -114,6 +118,8 @@ class OrderBook:
     :type asks: BookSide
     """
 
+    __slots__ = ("bids", "asks")
+
     def __init__(self, bids: BookSide, asks: BookSide):
         """constructor method."""
         self.bids = bids
@@ -186,7 +192,7 @@ class OrderBook:
         return self.best_ask() - self.best_bid()
 
     def __repr__(self):
-        items = ("{}={!r}".format(k, self.__dict__[k]) for k in self.__dict__)
+        items = ("{}={!r}".format(k, getattr(self, k)) for k in self.__slots__)
         return "{}({})".format(type(self).__name__, ", ".join(items))
 
 
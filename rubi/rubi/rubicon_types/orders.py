@@ -1,5 +1,6 @@
 from _decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Union
 
 from eth_typing import ChecksumAddress
@@ -17,6 +18,24 @@ from rubi.contracts import (
 )
 
 
+@lru_cache(maxsize=None)
+def _pair_identifier(pay_gem: ChecksumAddress, buy_gem: ChecksumAddress) -> str:
+    """Get the identifier the RubiconMarket uses for offers paying pay_gem for buy_gem. This is needed for every event
+    that is converted into an OrderEvent, so it is hashed and hex encoded once per pair instead of once per event.
+
+    :param pay_gem: The address of the token being paid.
+    :type pay_gem: ChecksumAddress
+    :param buy_gem: The address of the token being bought.
+    :type buy_gem: ChecksumAddress
+    :return: The hex encoded pair identifier.
+    :rtype: str
+    """
+    return Web3.solidity_keccak(
+        abi_types=["address", "address"],
+        values=[pay_gem, buy_gem],
+    ).hex()
+
+
 class OrderSide(Enum):
     """Enumeration representing the order side."""
 
@@ -334,6 +353,17 @@ class OrderEvent:
     :type size: Decimal
     """
 
+    __slots__ = (
+        "limit_order_id",
+        "limit_order_owner",
+        "market_order_owner",
+        "pair_name",
+        "order_side",
+        "order_type",
+        "price",
+        "size",
+    )
+
     def __init__(
         self,
         limit_order_id: int,
@@ -524,20 +554,23 @@ class OrderEvent:
 
     @staticmethod
     def _bid_identifier(base_asset: ERC20, quote_asset: ERC20) -> str:
-        return Web3.solidity_keccak(
-            abi_types=["address", "address"],
-            values=[
-                quote_asset.address,
-                base_asset.address,
-            ],
-        ).hex()
+        return _pair_identifier(pay_gem=quote_asset.address, buy_gem=base_asset.address)
 
     def __repr__(self):
-        items = ("{}={!r}".format(k, self.__dict__[k]) for k in self.__dict__)
+        items = ("{}={!r}".format(k, getattr(self, k)) for k in self.__slots__)
         return "{}({})".format(type(self).__name__, ", ".join(items))
 
 
 class FeeEvent:
+    __slots__ = (
+        "id",
+        "pair_name",
+        "fee_to",
+        "market_order_owner",
+        "fee",
+        "fee_asset",
+    )
+
     def __init__(
         self,
         id: int,
@@ -571,5 +604,5 @@ class FeeEvent:
         )
 
     def __repr__(self):
-        items = ("{}={!r}".format(k, self.__dict__[k]) for k in self.__dict__)
+        items = ("{}={!r}".format(k, getattr(self, k)) for k in self.__slots__)
         return "{}({})".format(type(self).__name__, ", ".join(items))
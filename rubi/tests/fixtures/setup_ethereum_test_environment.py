@@ -1,5 +1,5 @@
 import os
-from multiprocessing import Queue
+from queue import Queue
 from typing import Dict
 
 from eth_tester import PyEVMBackend
@@ -1,10 +1,19 @@
+import asyncio
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from _decimal import Decimal
+from queue import Queue
+from threading import Thread
+from time import sleep, monotonic
 from typing import Dict
 
 import yaml
-from pytest import mark
+from pytest import mark, raises
+from eth_utils import event_abi_to_log_topic
 from web3 import Web3
+from web3._utils.events import get_event_data  # noqa
+from websockets.sync.server import serve
 
 from rubi import (
     Network,
@@ -31,7 +40,12 @@ from rubi import (
     TransferEvent,
     TransactionStatus,
     OrderTrackingClient,
+    TransactionSendError,
+    LogSubscriber,
 )
+from rubi.contracts import BaseContract
+from rubi.contracts.base_contract import encode_call_data, get_block_time
+from rubi.contracts.event_decoding import decode_event_log
 
 
 class TestNetwork:
@@ -48,6 +62,83 @@ class TestNetwork:
         assert network.explorer_url == test_network.explorer_url
         assert network.currency == test_network.currency
 
+    def test_contracts_read_the_chain_id_once(self, test_network: Network, web3: Web3):
+        w3 = Web3(web3.provider)
+        requested_methods = []
+
+        def record_request_middleware(make_request, _):
+            def middleware(method, params):
+                requested_methods.append(method)
+                return make_request(method, params)
+
+            return middleware
+
+        w3.middleware_onion.add(record_request_middleware)
+
+        contract = test_network.rubicon_market.contract
+        first = BaseContract(w3=w3, contract=contract)
+        second = BaseContract(w3=w3, contract=contract)
+
+        assert first.chain_id == second.chain_id == web3.eth.chain_id
+        assert requested_methods == ["eth_chainId"]
+
+    def test_block_time_is_sampled_once(self, web3: Web3):
+        w3 = Web3(web3.provider)
+        requested_methods = []
+
+        def record_request_middleware(make_request, _):
+            def middleware(method, params):
+                requested_methods.append(method)
+                return make_request(method, params)
+
+            return middleware
+
+        w3.middleware_onion.add(record_request_middleware)
+
+        block_time = get_block_time(w3=w3)
+        requests_made = len(requested_methods)
+
+        assert 0.25 <= block_time <= 5
+        assert get_block_time(w3=w3) == block_time
+        assert len(requested_methods) == requests_made
+
+    def test_encode_call_data(self, test_network: Network):
+        base_asset = test_network.tokens["COW"].address
+        quote_asset = test_network.tokens["ETH"].address
+        batch_offer = test_network.rubicon_market.contract.functions.batchOffer(
+            [10**18, 2 * 10**18],
+            [base_asset] * 2,
+            [10**18, 10**18],
+            [quote_asset] * 2,
+        )
+
+        assert (
+            encode_call_data(contract_function=batch_offer)
+            == batch_offer._encode_transaction_data()
+        )
+
+    def test_erc20_read_calls_match_web3(self, test_network: Network):
+        token = test_network.tokens["COW"]
+        account = test_network.w3.eth.accounts[0]
+        spender = test_network.rubicon_market.address
+
+        assert (
+            token.balance_of(account)
+            == token.contract.functions.balanceOf(account).call()
+        )
+        assert (
+            token.allowance(account, spender)
+            == token.contract.functions.allowance(account, spender).call()
+        )
+
+    def test_contracts_share_the_error_decoder_of_an_abi(self, test_network: Network):
+        contract = test_network.rubicon_market.contract
+        first = BaseContract(w3=test_network.w3, contract=contract)
+        second = BaseContract(w3=test_network.w3, contract=contract)
+
+        assert first.error_decoder is second.error_decoder
+        assert first.error_decoder == test_network.rubicon_market.error_decoder
+
 
 class TestClient:
     def test_init(self, account_1: Dict, test_network: Network):
@@ -92,6 +183,27 @@ class TestClient:
         assert offer.buy_gem == test_client_for_account_2.network.tokens["COW"].address
         assert offer.buy_amt == 1 * 10**18
 
+    @mark.usefixtures("add_account_2_offers_to_cow_eth_market")
+    def test_decode_log(self, test_client_for_account_2: Client):
+        network = test_client_for_account_2.network
+
+        tx_receipt = network.w3.eth.get_transaction_receipt(
+            "0x72e0f2e712770a886f963ab6a12b2b4d003aa786c18e3df1373909738049b8ed"
+        )
+
+        events = [
+            network.transaction_handler.decode_log(log=log)
+            for log in tx_receipt["logs"]
+        ]
+
+        # The offer is decoded from its log without knowing which event it is
+        offer: EmitOfferEvent = next(  # noqa
+            event for event in events if isinstance(event, EmitOfferEvent)
+        )
+
+        assert offer.pay_gem == network.tokens["ETH"].address
+        assert offer.buy_gem == network.tokens["COW"].address
+
     def test_execute_transaction(self, test_client_for_account_1: Client):
         # This is the transaction hash of an offer placed on the Rubicon Market
         approval = RubiconRouterApproval(token="COW", amount=Decimal("1"))
@@ -103,6 +215,155 @@ class TestClient:
         assert result.transaction_status == TransactionStatus.SUCCESS
         assert result.transaction_hash is not None
 
+    def test_execute_transaction_async(self, test_client_for_account_1: Client):
+        approval = RubiconRouterApproval(token="COW", amount=Decimal("1"))
+
+        transaction = test_client_for_account_1.approve(approval=approval)
+
+        result = asyncio.run(
+            test_client_for_account_1.execute_transaction_async(transaction=transaction)
+        )
+
+        assert result.transaction_status == TransactionStatus.SUCCESS
+
+    def test_execute_transactions_async_run_concurrently(
+        self, test_client_for_account_1: Client, monkeypatch
+    ):
+        approval = RubiconRouterApproval(token="COW", amount=Decimal("1"))
+
+        receipt = (
+            test_client_for_account_1.network.transaction_handler.execute_transaction(
+                transaction=test_client_for_account_1.approve(approval=approval),
+                key=test_client_for_account_1._key,
+            )
+        )
+
+        # The test provider is not thread safe, so a slow node is simulated instead of sending transactions
+        def slow_execute_transaction(transaction, key):
+            sleep(0.5)
+            return receipt
+
+        monkeypatch.setattr(
+            test_client_for_account_1.network.transaction_handler,
+            "execute_transaction",
+            slow_execute_transaction,
+        )
+
+        async def execute():
+            return await asyncio.gather(
+                *[
+                    test_client_for_account_1.execute_transaction_async(transaction={})
+                    for _ in range(4)
+                ]
+            )
+
+        start = monotonic()
+        results = asyncio.run(execute())
+
+        assert monotonic() - start < 1.5
+        assert all(
+            result.transaction_status == TransactionStatus.SUCCESS for result in results
+        )
+
+    def test_get_transaction_params(self, test_client_for_account_1: Client):
+        params = test_client_for_account_1.get_transaction_params()
+
+        assert params["nonce"] == test_client_for_account_1.get_nonce()
+        assert params["max_fee_per_gas"] >= params["max_priority_fee_per_gas"]
+
+        approval = RubiconRouterApproval(token="COW", amount=Decimal("1"))
+
+        transaction = test_client_for_account_1.approve(approval=approval, **params)
+
+        result = test_client_for_account_1.execute_transaction(transaction=transaction)
+
+        assert result.transaction_status == TransactionStatus.SUCCESS
+
+        # The fees are reused while the nonce is advanced past the executed transaction
+        next_params = test_client_for_account_1.get_transaction_params()
+
+        assert next_params["nonce"] == params["nonce"] + 1
+        assert next_params["max_fee_per_gas"] == params["max_fee_per_gas"]
+
+    def test_transaction_params_nonce_is_reconciled_with_the_node(
+        self, test_client_for_account_1: Client
+    ):
+        transaction_handler = test_client_for_account_1.network.transaction_handler
+        wallet = test_client_for_account_1.wallet
+
+        params = test_client_for_account_1.get_transaction_params()
+
+        # A transaction that was sent through the handler but never reached the chain
+        transaction_handler._record_sent_transaction(
+            transaction={"from": wallet, "nonce": params["nonce"]}
+        )
+
+        assert (
+            test_client_for_account_1.get_transaction_params()["nonce"]
+            == params["nonce"] + 1
+        )
+
+        # Once the params are fetched again the nonce of the node is used
+        transaction_handler.invalidate_nonce(wallet=wallet)
+
+        assert test_client_for_account_1.get_transaction_params()["nonce"] == (
+            test_client_for_account_1.get_nonce()
+        )
+
+    def test_default_nonce_is_advanced_locally(
+        self, test_client_for_account_1: Client, monkeypatch
+    ):
+        w3 = test_client_for_account_1.network.w3
+        monkeypatch.setattr(
+            test_client_for_account_1.network.transaction_handler,
+            "transaction_params_cache_time",
+            60,
+        )
+
+        nonce_requests = []
+        get_transaction_count = w3.eth.get_transaction_count
+
+        def record_get_transaction_count(*args, **kwargs):
+            nonce_requests.append(args)
+            return get_transaction_count(*args, **kwargs)
+
+        monkeypatch.setattr(
+            w3.eth, "get_transaction_count", record_get_transaction_count
+        )
+
+        approval = RubiconRouterApproval(token="COW", amount=Decimal("1"))
+
+        nonces = []
+        for _ in range(2):
+            transaction = test_client_for_account_1.approve(approval=approval)
+            nonces.append(transaction["nonce"])
+
+            test_client_for_account_1.execute_transaction(transaction=transaction)
+
+        assert nonces[1] == nonces[0] + 1
+        assert len(nonce_requests) == 1
+
+    def test_failed_send_resyncs_the_nonce(self, test_client_for_account_1: Client):
+        transaction_handler = test_client_for_account_1.network.transaction_handler
+
+        params = test_client_for_account_1.get_transaction_params()
+
+        approval = RubiconRouterApproval(token="COW", amount=Decimal("1"))
+
+        # A nonce ahead of the node is rejected by the test provider
+        transaction = test_client_for_account_1.approve(
+            approval=approval, gas=100000, **{**params, "nonce": params["nonce"] + 5}
+        )
+
+        with raises(Exception):
+            test_client_for_account_1.execute_transaction(transaction=transaction)
+
+        assert test_client_for_account_1.wallet not in transaction_handler._next_nonces
+        assert (
+            test_client_for_account_1.get_transaction_params()["nonce"]
+            == params["nonce"]
+        )
+
     ######################################################################
     # erc20 method tests
     ######################################################################
@@ -115,6 +376,47 @@ class TestClient:
 
         assert allowance == Decimal("1.157920892373161954235709850E+59")
 
+    def test_get_balances(self, test_client_for_account_1: Client):
+        balances = test_client_for_account_1.get_balances(tokens=["COW", "ETH"])
+
+        assert balances == {
+            "COW": test_client_for_account_1.get_balance(token="COW"),
+            "ETH": test_client_for_account_1.get_balance(token="ETH"),
+        }
+
+    def test_get_balances_with_a_failed_call(
+        self, test_client_for_account_1: Client, monkeypatch
+    ):
+        # With Multicall3 a failed balanceOf call is returned as None
+        monkeypatch.setattr(
+            test_client_for_account_1.network,
+            "batch_call",
+            lambda contract_functions: [None, 1],
+        )
+
+        with raises(Exception, match="COW"):
+            test_client_for_account_1.get_balances(tokens=["COW", "ETH"])
+
+    def test_get_allowance_of_a_lowercase_address(
+        self, test_client_for_account_1: Client
+    ):
+        spender = test_client_for_account_1.network.rubicon_market.address
+
+        assert test_client_for_account_1.get_allowance(
+            token="COW", spender=spender.lower()
+        ) == test_client_for_account_1.get_allowance(token="COW", spender=spender)
+
+        with raises(Exception, match="is not a valid address"):
+            test_client_for_account_1.get_allowance(token="COW", spender="0x1234")
+
+    def test_to_integer_is_exact(self, test_client_for_account_1: Client):
+        cow = test_client_for_account_1.network.tokens["COW"]
+
+        # 30 significant digits, more than the default Decimal context keeps
+        amount = Decimal("123456789012.123456789012345678")
+
+        assert cow.to_integer(amount) == 123456789012123456789012345678
+
     def test_approve(self, test_client_for_account_1: Client):
         approval = RubiconRouterApproval(token="COW", amount=Decimal("1"))
 
@@ -144,6 +446,146 @@ class TestClient:
 
         assert allowance == approval.amount
 
+    def test_approve_refreshes_a_cached_allowance(
+        self, test_client_for_account_1: Client
+    ):
+        spender = test_client_for_account_1.network.rubicon_router.address
+
+        allowance_before = test_client_for_account_1.get_allowance(
+            token="COW", spender=spender
+        )
+
+        transaction = test_client_for_account_1.approve(
+            approval=RubiconRouterApproval(
+                token="COW", amount=allowance_before + Decimal("3")
+            )
+        )
+        test_client_for_account_1.execute_transaction(transaction=transaction)
+
+        assert test_client_for_account_1.get_allowance(
+            token="COW", spender=spender
+        ) == allowance_before + Decimal("3")
+
+    def test_batch_approve(self, test_client_for_account_1: Client):
+        approvals = [
+            RubiconRouterApproval(token="COW", amount=Decimal("1")),
+            RubiconRouterApproval(token="ETH", amount=Decimal("2")),
+        ]
+
+        # The gas limit is set as the test provider rejects gas estimates for future nonces
+        transactions = test_client_for_account_1.batch_approve(
+            approvals=approvals, gas=100000
+        )
+
+        # Check the transactions have sequential nonces
+        assert transactions[1]["nonce"] == transactions[0]["nonce"] + 1
+
+        results = test_client_for_account_1.execute_transactions(
+            transactions=transactions
+        )
+
+        for approval, result in zip(approvals, results):
+            # Check transaction was a success
+            assert result.transaction_status == TransactionStatus.SUCCESS
+
+            # Check allowance after approval
+            allowance = test_client_for_account_1.get_allowance(
+                token=approval.token,
+                spender=test_client_for_account_1.network.rubicon_router.address,
+            )
+
+            assert allowance == approval.amount
+
+    def test_batch_approve_estimates_the_gas_limits(
+        self, test_client_for_account_1: Client
+    ):
+        approvals = [
+            RubiconRouterApproval(token="COW", amount=Decimal("3")),
+            RubiconRouterApproval(token="ETH", amount=Decimal("4")),
+        ]
+
+        transactions = test_client_for_account_1.batch_approve(approvals=approvals)
+
+        assert all(transaction["gas"] > 0 for transaction in transactions)
+
+        results = test_client_for_account_1.execute_transactions(
+            transactions=transactions
+        )
+
+        assert all(
+            result.transaction_status == TransactionStatus.SUCCESS for result in results
+        )
+
+    def test_decode_event_log_matches_web3(self, test_client_for_account_1: Client):
+        limit_order = NewLimitOrder(
+            pair_name="COW/ETH",
+            order_side=OrderSide.BUY,
+            size=Decimal("1"),
+            price=Decimal("1.5"),
+        )
+
+        result = test_client_for_account_1.execute_transaction(
+            transaction=test_client_for_account_1.limit_order(order=limit_order)
+        )
+
+        w3 = test_client_for_account_1.network.w3
+        market = test_client_for_account_1.network.rubicon_market.contract
+        event_abi = market.events.emitOffer().abi
+
+        logs = [
+            log
+            for log in w3.eth.get_transaction_receipt(result.transaction_hash)["logs"]
+            if log["topics"] and log["topics"][0] == event_abi_to_log_topic(event_abi)
+        ]
+
+        assert logs
+        assert [decode_event_log(w3.codec, event_abi, log) for log in logs] == [
+            get_event_data(w3.codec, event_abi, log) for log in logs
+        ]
+
+    def test_configured_gas_limit_is_used_instead_of_an_estimate(
+        self, test_client_for_account_1: Client
+    ):
+        approval = RubiconRouterApproval(token="COW", amount=Decimal("1"))
+        test_client_for_account_1.network.tokens["COW"].gas_limits["approve"] = 80000
+
+        transaction = test_client_for_account_1.approve(approval=approval)
+
+        assert transaction["gas"] == 80000
+
+        result = test_client_for_account_1.execute_transaction(transaction=transaction)
+
+        assert result.transaction_status == TransactionStatus.SUCCESS
+
+    def test_execute_transactions_with_a_failed_send(
+        self, test_client_for_account_1: Client
+    ):
+        approval = RubiconRouterApproval(token="COW", amount=Decimal("1"))
+        nonce = test_client_for_account_1.get_nonce()
+
+        # The gas limit is set as the test provider rejects gas estimates for future nonces, the second nonce leaves a
+        # gap so that transaction is rejected
+        transactions = [
+            test_client_for_account_1.approve(
+                approval=approval, nonce=nonce + offset, gas=100000
+            )
+            for offset in (0, 5)
+        ]
+
+        with raises(TransactionSendError) as e:
+            test_client_for_account_1.execute_transactions(transactions=transactions)
+
+        assert len(e.value.sent_transaction_hashes) == 1
+        assert e.value.errors[0] is None
+        assert e.value.errors[1] is not None
+
+        # The transaction that was sent is still executed
+        receipt = test_client_for_account_1.get_transaction_receipt(
+            transaction_hash=e.value.sent_transaction_hashes[0]
+        )
+
+        assert receipt.transaction_status == TransactionStatus.SUCCESS
+
     def test_transfer(
         self, test_client_for_account_1: Client, test_client_for_account_2: Client
     ):
@@ -193,6 +635,85 @@ class TestClient:
         assert ask.price == Decimal("2")
         assert ask.size == Decimal("1")
 
+    @mark.usefixtures("add_account_2_offers_to_cow_eth_market")
+    def test_get_orderbook_is_cached_per_block(self, test_client_for_account_1: Client):
+        pair_name = "COW/ETH"
+
+        first = test_client_for_account_1.get_orderbook(pair_name=pair_name)
+        second = test_client_for_account_1.get_orderbook(pair_name=pair_name)
+
+        block_number = test_client_for_account_1.network.w3.eth.block_number
+
+        # Both reads happen in the same block so only a single entry is cached
+        assert list(test_client_for_account_1._orderbook_cache.keys()) == [
+            (pair_name, block_number)
+        ]
+        assert first.best_bid() == second.best_bid()
+        assert first.best_ask() == second.best_ask()
+
+    @mark.usefixtures("add_account_2_offers_to_cow_eth_market")
+    def test_get_orderbook_concurrent_reads_share_router_call(
+        self, test_client_for_account_1: Client, monkeypatch
+    ):
+        router = test_client_for_account_1.network.rubicon_router
+        get_book_from_pair = router.get_book_from_pair
+
+        calls = []
+
+        def slow_get_book_from_pair(**kwargs):
+            calls.append(kwargs)
+            sleep(0.2)
+            return get_book_from_pair(**kwargs)
+
+        monkeypatch.setattr(router, "get_book_from_pair", slow_get_book_from_pair)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            books = list(
+                executor.map(
+                    lambda _: test_client_for_account_1.get_orderbook(
+                        pair_name="COW/ETH"
+                    ),
+                    range(4),
+                )
+            )
+
+        assert len(calls) == 1
+        assert all(book.best_bid() == books[0].best_bid() for book in books)
+
+    @mark.usefixtures("add_account_2_offers_to_cow_eth_market")
+    def test_get_offers(self, test_client_for_account_1: Client):
+        rubicon_market = test_client_for_account_1.network.rubicon_market
+
+        offers = rubicon_market.get_offers(ids=[1, 2, 3])
+
+        assert offers == [rubicon_market.get_offer(id=id) for id in [1, 2, 3]]
+
+    def test_get_orderbook_for_unknown_pair(self, test_client_for_account_1: Client):
+        with raises(Exception, match="is not a valid pair"):
+            test_client_for_account_1.get_orderbook(pair_name="COW/XYZ")
+
+    @mark.usefixtures("add_account_2_offers_to_cow_eth_market")
+    def test_orderbook_dropped_when_message_queue_full(
+        self, test_client_for_account_1: Client
+    ):
+        pair_name = "COW/ETH"
+
+        test_client_for_account_1.message_queue = Queue(maxsize=1)
+        test_client_for_account_1.message_queue.put("event")
+
+        raw_offer_book_queue = Queue(maxsize=2)
+        raw_offer_book_queue.put(
+            test_client_for_account_1._get_rubicon_offer_book(pair_name=pair_name)
+        )
+
+        test_client_for_account_1._process_orderbook(
+            pair_name=pair_name, raw_offer_book_queue=raw_offer_book_queue
+        )
+
+        # The order book is dropped rather than blocking or replacing the queued event
+        assert test_client_for_account_1.dropped_books == 1
+        assert test_client_for_account_1.message_queue.get_nowait() == "event"
+
     @mark.usefixtures("add_account_2_offers_to_cow_eth_market")
     def test_orderbook_poller(self, test_client_for_account_1: Client):
         pair_name = "COW/ETH"
@@ -768,6 +1289,25 @@ class TestClient:
         assert orderbook_after_transaction.bids.levels[0].price == Decimal("1.5")
         assert orderbook_after_transaction.bids.levels[0].size == Decimal("1")
 
+    @mark.usefixtures("add_account_2_offers_to_cow_eth_market")
+    def test_batch_update_limit_orders_of_another_wallet(
+        self, test_client_for_account_1: Client
+    ):
+        # Order 2 is owned by account 2 so the transaction cannot be built
+        update_limit_order = UpdateLimitOrder(
+            order_id=2,
+            pair_name="COW/ETH",
+            order_side=OrderSide.SELL,
+            size=Decimal("2"),
+            price=Decimal("1.5"),
+        )
+
+        transaction = test_client_for_account_1.batch_update_limit_orders(
+            orders=[update_limit_order]
+        )
+
+        assert transaction is None
+
     @mark.usefixtures("add_account_2_offers_to_cow_eth_market")
     def test_batch_update_limit_orders(self, test_client_for_account_2: Client):
         pair_name = "COW/ETH"
@@ -840,6 +1380,38 @@ class TestClient:
         assert orderbook_after_update.asks.levels[1].price == Decimal("2.5")
         assert orderbook_after_update.asks.levels[1].size == Decimal("2")
 
+    @mark.usefixtures("add_account_2_offers_to_cow_eth_market")
+    def test_batch_update_limit_orders_keeps_the_last_update_of_an_order(
+        self, test_client_for_account_2: Client
+    ):
+        orders = [
+            UpdateLimitOrder(
+                order_id=2,
+                pair_name="COW/ETH",
+                order_side=OrderSide.SELL,
+                size=Decimal("2"),
+                price=price,
+            )
+            for price in [Decimal("1.5"), Decimal("1.75")]
+        ]
+
+        transaction = test_client_for_account_2.batch_update_limit_orders(orders=orders)
+
+        assert transaction["pair_names"] == ["COW/ETH"]
+
+        result = test_client_for_account_2.execute_transaction(transaction=transaction)
+
+        assert result.transaction_status == TransactionStatus.SUCCESS
+
+        limit_events = [
+            event
+            for event in result.events
+            if isinstance(event, OrderEvent) and event.order_type == OrderType.LIMIT
+        ]
+
+        assert len(limit_events) == 1
+        assert limit_events[0].price == Decimal("1.75")
+
     @mark.usefixtures("add_account_2_offers_to_cow_eth_market")
     def test_batch_cancel_limit_orders(self, test_client_for_account_2: Client):
         pair_name = "COW/ETH"
@@ -923,6 +1495,157 @@ class TestClient:
         assert message.price == Decimal("1.5")
         assert message.pair_name == pair_name
 
+    def test_default_filters_are_cached(self, test_client_for_account_1: Client):
+        pair_name = "COW/ETH"
+
+        filters = test_client_for_account_1._default_filters(
+            pair_name=pair_name, event_type=EmitOfferEvent
+        )
+        # Callers can add filters to the returned dict without changing the cached filters
+        filters["maker"] = test_client_for_account_1.wallet
+
+        bid_identifier, ask_identifier = test_client_for_account_1._pair_identifiers(
+            pair_name=pair_name
+        )
+
+        assert test_client_for_account_1._default_filters(
+            pair_name=pair_name, event_type=EmitOfferEvent
+        ) == {"pair": [bid_identifier, ask_identifier]}
+        assert list(test_client_for_account_1._filter_cache.keys()) == [
+            (EmitOfferEvent, pair_name)
+        ]
+
+    def test_emit_offer_event_multiplex_poller(self, test_client_for_account_1: Client):
+        test_client_for_account_1.start_event_multiplex_poller(
+            pair_names=["BLZ/ETH", "COW/ETH"], event_type=EmitOfferEvent
+        )
+
+        message_queue = test_client_for_account_1.message_queue
+
+        limit_order = NewLimitOrder(
+            pair_name="COW/ETH",
+            order_side=OrderSide.SELL,
+            size=Decimal("0.5"),
+            price=Decimal("1.5"),
+        )
+
+        transaction = test_client_for_account_1.limit_order(order=limit_order)
+
+        result = test_client_for_account_1.execute_transaction(transaction=transaction)
+
+        # Check that transaction was a success
+        assert result.transaction_status == TransactionStatus.SUCCESS
+
+        # Get message from message queue put there by event poller
+        message = message_queue.get(block=True)
+
+        # Check that the event was dispatched to the pair of the limit order we placed
+        assert isinstance(message, OrderEvent)
+        assert message.order_type == OrderType.LIMIT
+        assert message.order_side == OrderSide.SELL
+        assert message.size == Decimal("0.5")
+        assert message.price == Decimal("1.5")
+        assert message.pair_name == "COW/ETH"
+
+    def test_emit_offer_event_subscription(
+        self, test_client_for_account_1: Client, web3: Web3, monkeypatch
+    ):
+        requests = Queue()
+        connections = Queue()
+
+        def node(connection):
+            """A websocket node that answers subscription requests. Logs are pushed by the test."""
+            for message in connection:
+                request = json.loads(message)
+                requests.put(request)
+
+                connection.send(json.dumps({"id": request["id"], "result": "0x1"}))
+
+                if request["method"] == "eth_subscribe":
+                    connections.put(connection)
+
+        server = serve(node, "localhost", 0)
+        Thread(target=server.serve_forever, daemon=True).start()
+
+        monkeypatch.setattr(
+            test_client_for_account_1.network,
+            "log_subscriber",
+            LogSubscriber(ws_url=f"ws://localhost:{server.socket.getsockname()[1]}"),
+        )
+
+        test_client_for_account_1.start_event_poller(
+            pair_name="COW/ETH", event_type=EmitOfferEvent
+        )
+
+        subscribe_request = requests.get(timeout=5)
+        connection = connections.get(timeout=5)
+
+        bid_identifier, ask_identifier = test_client_for_account_1._pair_identifiers(
+            pair_name="COW/ETH"
+        )
+
+        # The node filters on the pair
+        assert subscribe_request["method"] == "eth_subscribe"
+        assert subscribe_request["params"][1]["topics"][2] == [
+            bid_identifier,
+            ask_identifier,
+        ]
+
+        limit_order = NewLimitOrder(
+            pair_name="COW/ETH",
+            order_side=OrderSide.BUY,
+            size=Decimal("0.5"),
+            price=Decimal("1.5"),
+        )
+
+        result = test_client_for_account_1.execute_transaction(
+            transaction=test_client_for_account_1.limit_order(order=limit_order)
+        )
+
+        assert result.transaction_status == TransactionStatus.SUCCESS
+
+        # Push the log of the limit order the way a node sends it
+        log = web3.eth.get_logs(
+            {
+                "address": test_client_for_account_1.network.rubicon_market.address,
+                "topics": [subscribe_request["params"][1]["topics"][0]],
+                "fromBlock": web3.eth.block_number,
+            }
+        )[-1]
+        connection.send(
+            json.dumps(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "eth_subscription",
+                    "params": {
+                        "subscription": "0x1",
+                        "result": {
+                            "address": log["address"],
+                            "topics": [topic.hex() for topic in log["topics"]],
+                            "data": log["data"].hex(),
+                            "blockNumber": hex(log["blockNumber"]),
+                            "blockHash": log["blockHash"].hex(),
+                            "transactionHash": log["transactionHash"].hex(),
+                            "transactionIndex": hex(log["transactionIndex"]),
+                            "logIndex": hex(log["logIndex"]),
+                            "removed": False,
+                        },
+                    },
+                }
+            )
+        )
+
+        message = test_client_for_account_1.message_queue.get(timeout=5)
+
+        assert isinstance(message, OrderEvent)
+        assert message.order_type == OrderType.LIMIT
+        assert message.order_side == OrderSide.BUY
+        assert message.size == Decimal("0.5")
+        assert message.price == Decimal("1.5")
+        assert message.pair_name == "COW/ETH"
+
+        server.shutdown()
+
     @mark.usefixtures("add_account_2_offers_to_cow_eth_market")
     def test_emit_take_event_poller(self, test_client_for_account_1: Client):
         pair_name = "COW/ETH"
@@ -1142,6 +1865,41 @@ class TestOrderTrackingClient:
         )
         assert open_limit_order.filled_size == Decimal("0")
 
+    @mark.usefixtures("add_account_2_offers_to_cow_eth_market")
+    def test_execute_limit_order_transactions(
+        self, test_order_tracking_client_for_account_1: OrderTrackingClient
+    ):
+        nonce = test_order_tracking_client_for_account_1.get_nonce()
+
+        # The gas limit is set as the test provider rejects gas estimates for future nonces
+        transactions = [
+            test_order_tracking_client_for_account_1.limit_order(
+                order=NewLimitOrder(
+                    pair_name="COW/ETH",
+                    order_side=OrderSide.BUY,
+                    size=Decimal("0.5"),
+                    price=price,
+                ),
+                nonce=nonce + i,
+                gas=300000,
+            )
+            for i, price in enumerate([Decimal("1.25"), Decimal("1.5")])
+        ]
+
+        results = test_order_tracking_client_for_account_1.execute_transactions(
+            transactions=transactions
+        )
+
+        assert all(
+            result.transaction_status == TransactionStatus.SUCCESS for result in results
+        )
+
+        # Check that the client is tracking both limit orders
+        assert sorted(
+            limit_order.price
+            for limit_order in test_order_tracking_client_for_account_1.open_limit_orders.values()
+        ) == [Decimal("1.25"), Decimal("1.5")]
+
     @mark.usefixtures("add_account_2_offers_to_cow_eth_market")
     def test_cancel_limit_order(
         self, test_order_tracking_client_for_account_1: OrderTrackingClient